@@ -8,14 +8,20 @@ import asyncio
 import logging
 
 from src.bootstrap.application_builder import ApplicationBuilder
+from src.bootstrap.modules.compositors import ArgParserCompositor
+from src.core.constants import INGEST_COMMAND
 
 async def main() -> None:
     """The main entry point for the application."""
     application = None
+    cli_args = ArgParserCompositor().compose()
 
     try:
         builder = ApplicationBuilder()
-        application = await builder.build()
+        if cli_args.command == INGEST_COMMAND:
+            application = await builder.build_ingest(cli_args)
+        else:
+            application = await builder.build()
         await application.run()
 
     except Exception as error:
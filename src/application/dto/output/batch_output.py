@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Tuple
+from src.application.dto.output.download_output import DownloadOutput
+
+@dataclass(frozen=True)
+class BatchItemOutput():
+    """Result of one item of a batch, either its output or why it failed."""
+    url: str
+    output: DownloadOutput | None = None
+    error: str | None = None
+
+@dataclass(frozen=True)
+class BatchOutput():
+    """Data transfer object for batch output."""
+    items: Tuple[BatchItemOutput, ...] = ()
+    archive_url: str | None = None
+    elapsed: float | None = None
\ No newline at end of file
@@ -1,10 +1,16 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
+from src.domain.enum.quality import Quality
 
 @dataclass(frozen=True)
 class DownloadOutput():
     """Data transfer object for download output."""
     file_path: Path | None = None
+    file_paths: Tuple[Path, ...] = () # parts of a split file, in order
     file_url: str | None = None
     file_size: int | None = None
-    elapsed: float | None = None
\ No newline at end of file
+    elapsed: float | None = None
+    bytes_saved: int | None = None # not downloaded thanks to a time range
+    time_saved: float | None = None
+    preview_quality: Quality | None = None # set on a preview handed out before the requested quality
\ No newline at end of file
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Tuple
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.domain.enum.batch_delivery import BatchDelivery
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """Data transfer object for a batch of downloads, every URL may be a playlist."""
+    urls: Tuple[str, ...]
+    file_size_limit: int
+    format: Formats | None = None
+    quality: Quality = Quality.DEFAULT
+    delivery: BatchDelivery = BatchDelivery.LINKS
\ No newline at end of file
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
+from src.domain.models.time_range import TimeRange
 
 @dataclass(frozen=True)
 class DownloadRequest:
@@ -8,4 +9,8 @@ class DownloadRequest:
     url: str
     file_size_limit: int
     format: Formats | None = None
-    quality: Quality = Quality.DEFAULT
\ No newline at end of file
+    quality: Quality = Quality.DEFAULT
+    fit_to_limit: bool = False
+    time_range: TimeRange | None = None
+    allow_split: bool = True # whether the result may be delivered as several parts
+    auto_quality: bool = False # quality is only the highest allowed, lowered when it wouldn't be done in time
\ No newline at end of file
@@ -1,4 +1,7 @@
 from .cache_key import CacheKey
 from .cached_item import CachedItem
+from .stage_metrics import StageMetrics
+from .download_job import DownloadJob
+from .journal_entry import JournalEntry
 
-__all__ = ["CacheKey", "CachedItem"]
\ No newline at end of file
+__all__ = ["CacheKey", "CachedItem", "StageMetrics", "DownloadJob", "JournalEntry"]
\ No newline at end of file
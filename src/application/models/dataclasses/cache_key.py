@@ -2,10 +2,22 @@
 from dataclasses import dataclass
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
+from src.domain.models.time_range import TimeRange
 
 @dataclass(frozen=True)
 class CacheKey():
-    """Unique identifier for cached items based on URL, format, and quality."""
+    """Unique identifier for cached items based on URL, format, and quality.
+
+    size_limit is only set for variants produced to fit a given attachment limit,
+    so they never collide with the regular (full quality) entry, time_range only for clips.
+    attachment_limit is set for results kept as attachments (a file or parts), which only
+    suit requests with the same limit; remote links are keyed without it.
+    auto_quality is set for results whose quality was picked to be done in time, quality is then its ceiling.
+    """
     url: str
     format_value: Formats 
-    quality: Quality | None = None
\ No newline at end of file
+    quality: Quality | None = None
+    size_limit: int | None = None
+    time_range: TimeRange | None = None
+    attachment_limit: int | None = None
+    auto_quality: bool = False
\ No newline at end of file
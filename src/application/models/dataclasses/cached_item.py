@@ -1,12 +1,15 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Tuple
 from src.application.models.dataclasses import CacheKey
 
 @dataclass
 class CachedItem():
     key: CacheKey
     local_path: Path | None = None
+    part_paths: Tuple[Path, ...] = ()
     remote_url: str | None = None
+    title: str | None = None
     file_size: int | None = None
     created_at: str | None = None
     last_accessed: str | None = None
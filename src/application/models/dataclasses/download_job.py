@@ -0,0 +1,30 @@
+import time
+import uuid
+import asyncio
+from dataclasses import dataclass, field
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Dict, List
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.models import CancellationToken, DownloadedFile, MediaProbe, ProgressTracker
+
+@dataclass
+class DownloadJob():
+    """State of a download request while it moves through the pipeline stages."""
+    request: DownloadRequest
+    result: asyncio.Future[DownloadOutput]
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    context: Dict[str, Any] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.monotonic)
+    cancellation: CancellationToken = field(default_factory=CancellationToken)
+    progress: ProgressTracker = field(default_factory=ProgressTracker)
+    resources: AsyncExitStack = field(default_factory=AsyncExitStack)
+    probe: MediaProbe | None = None
+    stream: bool = False
+    temp_folder: Path | None = None
+    downloaded_file: DownloadedFile | None = None
+    destination: DownloadDestination | None = None
+    file_url: str | None = None
+    parts: List[Path] = field(default_factory=list)
\ No newline at end of file
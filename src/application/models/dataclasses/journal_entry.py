@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+from src.application.dto.request.download_request import DownloadRequest
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.models import DownloadedFile, MediaProbe
+
+@dataclass
+class JournalEntry():
+    """A download job that was accepted but hasn't delivered its result yet.
+
+    Besides the stage it entered, it keeps what the earlier stages produced,
+    so the job resumes at that stage instead of downloading again.
+    """
+    job_id: str
+    request: DownloadRequest
+    stage: str
+    context: Dict[str, Any] = field(default_factory=dict)
+    temp_path: Path | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+    probe: MediaProbe | None = None
+    stream: bool = False
+    downloaded_file: DownloadedFile | None = None
+    destination: DownloadDestination | None = None
+    file_url: str | None = None
+    parts: List[Path] = field(default_factory=list)
\ No newline at end of file
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+@dataclass
+class StageMetrics():
+    """Counters of a single pipeline stage."""
+    name: str
+    concurrency: int
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    active: int = 0
+    processed: int = 0
+    failed: int = 0
+    total_wait: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        handled = self.processed + self.failed
+        return self.total_wait / handled if handled else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        handled = self.processed + self.failed
+        return self.total_latency / handled if handled else 0.0
+
+    def record(self, wait: float, latency: float, failed: bool = False) -> None:
+        if failed:
+            self.failed += 1
+        else:
+            self.processed += 1
+        self.total_wait += wait
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
\ No newline at end of file
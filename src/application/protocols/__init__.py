@@ -1,8 +1,16 @@
+from .archive_service_protocol import ArchiveServiceProtocol, ArchiveWriterProtocol
 from .cache_storage_protocol import CacheStorageProtocol
 from .download_service_protocol import DownloadServiceProtocol
 from .download_usecase_protocol import DownloadUseCaseProtocol
+from .job_journal_protocol import JobJournalProtocol
+from .media_encoder_protocol import MediaEncoderProtocol
+from .media_url_matcher_protocol import MediaUrlMatcherProtocol
+from .media_post_processor_protocol import MediaPostProcessorProtocol
+from .media_splitter_protocol import MediaSplitterProtocol
+from .playlist_expander_protocol import PlaylistExpanderProtocol
 from .temp_service_protocol import TempServiceProtocol
 from .remote_storage_service_protocol import RemoteStorageServiceProtocol
+from .task_manager_protocol import TaskManagerProtocol
 from .url_validator_protocol import URLValidatorProtocol
 
-__all__ = ["CacheStorageProtocol", "DownloadServiceProtocol", "DownloadUseCaseProtocol", "TempServiceProtocol", "RemoteStorageServiceProtocol", "URLValidatorProtocol"]
\ No newline at end of file
+__all__ = ["ArchiveServiceProtocol", "ArchiveWriterProtocol", "CacheStorageProtocol", "DownloadServiceProtocol", "DownloadUseCaseProtocol", "JobJournalProtocol", "MediaEncoderProtocol", "MediaPostProcessorProtocol", "MediaUrlMatcherProtocol", "MediaSplitterProtocol", "PlaylistExpanderProtocol", "TempServiceProtocol", "RemoteStorageServiceProtocol", "TaskManagerProtocol", "URLValidatorProtocol"]
\ No newline at end of file
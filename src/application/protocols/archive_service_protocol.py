@@ -0,0 +1,27 @@
+from typing import Protocol
+from pathlib import Path
+from src.domain.models import GrowingFile
+
+class ArchiveWriterProtocol(Protocol):
+    """An archive being written sequentially, so it can be uploaded while it grows."""
+
+    def add_file(self, file_path: Path, name: str) -> None:
+        ...
+
+    def add_text(self, name: str, text: str) -> None:
+        ...
+
+    def close(self) -> None:
+        """Write the end of the archive and report the growing file as finished."""
+        ...
+
+    def abort(self, error: BaseException) -> None:
+        """Stop writing and report the error to the growing file."""
+        ...
+
+class ArchiveServiceProtocol(Protocol):
+    """Protocol for the service that creates archives. (Like zip)"""
+
+    def open_archive(self, path: Path, growing_file: GrowingFile) -> ArchiveWriterProtocol:
+        """Start an archive at path, reporting its progress to growing_file."""
+        ...
\ No newline at end of file
@@ -2,11 +2,30 @@ from typing import Protocol
 from pathlib import Path
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
-from src.domain.models import DownloadedFile
+from src.domain.models import CancellationToken, DownloadedFile, GrowingFile, MediaProbe, ProgressTracker, TimeRange
 
 class DownloadServiceProtocol(Protocol):
     """Protocol for download service."""
 
-    async def download(self, url: str, format_value: str | Formats, quality: Quality, output_folder: Path) -> DownloadedFile:
-        """Download file from URL to output_folder."""
+    async def probe(self, url: str, format_value: str | Formats, quality: Quality,
+                    cancellation: CancellationToken | None = None) -> MediaProbe:
+        """Extract what is known about the media (size, post-processing) without downloading it.
+
+        When cancellation is cancelled, the probe stops waiting and raises DownloadCancelled.
+        """
+        ...
+
+    async def download(self, url: str, format_value: str | Formats, quality: Quality, output_folder: Path,
+                       max_filesize: int | None = None, growing_file: GrowingFile | None = None,
+                       cancellation: CancellationToken | None = None, time_range: TimeRange | None = None,
+                       progress: ProgressTracker | None = None, deadline: float | None = None) -> DownloadedFile:
+        """Download file from URL to output_folder.
+
+        When max_filesize is given, formats whose estimated size fits it are preferred.
+        When growing_file is given, the file is written sequentially and reported to it while downloading.
+        When cancellation is cancelled, the download stops and raises DownloadCancelled.
+        When time_range is given, only that part of the media is fetched.
+        When progress is given, it's updated with the downloaded bytes while downloading.
+        When deadline is given, quality is the highest one picked, lowered to be done within deadline seconds.
+        """
         ...
\ No newline at end of file
@@ -1,8 +1,24 @@
-from typing import Protocol, runtime_checkable
+from typing import Any, Dict, List, Protocol, runtime_checkable
 from src.application.dto.output.download_output import DownloadOutput
 from src.application.dto.request.download_request import DownloadRequest
+from src.application.models.dataclasses import JournalEntry
+from src.domain.models import CancellationToken, ProgressTracker
 
 @runtime_checkable
 class DownloadUseCaseProtocol(Protocol):
-    async def execute(self, request: DownloadRequest) -> DownloadOutput:
+    async def execute(self, request: DownloadRequest, cancellation: CancellationToken | None = None,
+                      context: Dict[str, Any] | None = None, job_id: str | None = None,
+                      progress: ProgressTracker | None = None) -> DownloadOutput:
+        ...
+
+    def peek_cached(self, request: DownloadRequest) -> DownloadOutput | None:
+        """Synchronous cache lookup in memory, None on a miss."""
+        ...
+
+    async def pending_jobs(self) -> List[JournalEntry]:
+        """Jobs interrupted before delivering their result, to be resumed with execute(job_id=...)."""
+        ...
+
+    async def discard_job(self, job_id: str) -> None:
+        """Forget an interrupted job that won't be resumed, along with its files."""
         ...
\ No newline at end of file
@@ -0,0 +1,17 @@
+from typing import List, Protocol
+from src.application.models.dataclasses import JournalEntry
+
+class JobJournalProtocol(Protocol):
+    """Protocol for the persistent record of download jobs in flight."""
+
+    async def save(self, entry: JournalEntry) -> None:
+        """Create or update the entry of a job."""
+        ...
+
+    async def remove(self, job_id: str) -> None:
+        """Forget a job, once its result was delivered or it failed for good."""
+        ...
+
+    async def load(self) -> List[JournalEntry]:
+        """Every job that was not finished, like the ones interrupted by a restart."""
+        ...
\ No newline at end of file
@@ -0,0 +1,11 @@
+from typing import Protocol
+from pathlib import Path
+from src.domain.models import CancellationToken, DownloadedFile
+
+class MediaEncoderProtocol(Protocol):
+    """Protocol for media encoder service. (Like ffmpeg)"""
+
+    async def encode_to_size(self, downloaded_file: DownloadedFile, target_size: int, output_folder: Path,
+                             cancellation: CancellationToken | None = None) -> DownloadedFile:
+        """Re-encode a downloaded file so it fits in target_size bytes. Returns the encoded file."""
+        ...
\ No newline at end of file
@@ -0,0 +1,9 @@
+from typing import Protocol
+from src.domain.models import CancellationToken, DownloadedFile
+
+class MediaPostProcessorProtocol(Protocol):
+    """Protocol for the service that finishes raw downloads. (Like ffmpeg)"""
+
+    async def process(self, downloaded_file: DownloadedFile, cancellation: CancellationToken | None = None) -> DownloadedFile:
+        """Merge, remux or transcode the pending processing of a download. Returns the final file."""
+        ...
\ No newline at end of file
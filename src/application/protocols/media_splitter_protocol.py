@@ -0,0 +1,15 @@
+from typing import List, Protocol
+from pathlib import Path
+from src.domain.models import CancellationToken, DownloadedFile
+
+class MediaSplitterProtocol(Protocol):
+    """Protocol for the service that cuts media into playable parts. (Like ffmpeg)"""
+
+    async def split(self, downloaded_file: DownloadedFile, max_part_size: int, output_folder: Path,
+                    cancellation: CancellationToken | None = None) -> List[Path]:
+        """Cut the file, without re-encoding, into parts of at most max_part_size bytes. Returns the parts in order.
+
+        Raises:
+            MediaProcessingFailed: If it can't be split into small enough parts
+        """
+        ...
\ No newline at end of file
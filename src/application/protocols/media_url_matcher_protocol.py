@@ -0,0 +1,8 @@
+from typing import Protocol
+
+class MediaUrlMatcherProtocol(Protocol):
+    """Protocol for the service that tells, without any request, whether a URL points to supported media. (Like yt-dlp)"""
+
+    def is_supported(self, url: str) -> bool:
+        """True if a specific extractor handles the URL, a generic web page fallback doesn't count."""
+        ...
\ No newline at end of file
@@ -0,0 +1,9 @@
+from typing import AsyncIterator, Protocol
+
+class PlaylistExpanderProtocol(Protocol):
+    """Protocol for the service that turns a playlist URL into the URLs of its entries. (Like yt-dlp)"""
+
+    def expand(self, url: str, max_items: int) -> AsyncIterator[str]:
+        """Yield the entry URLs one by one, fetching the playlist pages only as they are needed.
+        A URL that is not a playlist yields itself."""
+        ...
\ No newline at end of file
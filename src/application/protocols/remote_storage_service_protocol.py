@@ -1,9 +1,17 @@
 from typing import Protocol
 from pathlib import Path
+from src.domain.models import CancellationToken, GrowingFile
 
 class RemoteStorageServiceProtocol(Protocol):
     """Protocol for storage service. (Like google drive)"""
     
-    async def upload(self, file_path: Path) -> str:
-        """Upload a file to the storage service. Returns the file URL."""
+    async def upload(self, file_path: Path, upload_id: str | None = None) -> str:
+        """Upload a file to the storage service, an interrupted upload with the same upload_id continues. Returns the file URL."""
+        ...
+
+    async def upload_growing(self, growing_file: GrowingFile, cancellation: CancellationToken | None = None) -> str:
+        """Upload a file while it is still being written, following it until it's finished. Returns the file URL.
+
+        When cancellation is cancelled, the upload stops and raises DownloadCancelled.
+        """
         ...
\ No newline at end of file
@@ -0,0 +1,17 @@
+from typing import ContextManager, Protocol
+from src.domain.models import CancellationToken
+
+class TaskManagerProtocol(Protocol):
+    """Protocol for the registry of running jobs that can be cancelled."""
+
+    def track(self, owner: int | None = None, timeout: float | None = None) -> ContextManager[CancellationToken]:
+        """Register a job for the duration of the context, yielding its cancellation token."""
+        ...
+
+    def cancel_owner(self, owner: int, reason: str) -> int:
+        """Cancel the jobs of an owner. Returns how many were cancelled."""
+        ...
+
+    def cancel_all(self, reason: str, resumable: bool = False) -> int:
+        """Cancel every running job. Returns how many were cancelled."""
+        ...
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Protocol, AsyncGenerator
+from typing import Optional, Protocol, AsyncGenerator
 from pathlib import Path
 from contextlib import asynccontextmanager
 
@@ -6,7 +6,11 @@ class TempServiceProtocol(Protocol):
     """Protocol for temporary file service."""
 
     @asynccontextmanager
-    async def create_session(self) -> AsyncGenerator[Path, None]:
-        """Create a temporary folder session that cleans up itself."""
+    async def create_session(self, session_id: Optional[str] = None) -> AsyncGenerator[Path, None]:
+        """Create a temporary folder session that cleans up itself, or reopen the one of session_id."""
         ...
-        yield Path()
\ No newline at end of file
+        yield Path()
+
+    def preserve(self, temp_path: Path) -> None:
+        """Keep the folder of a running session when it ends."""
+        ...
\ No newline at end of file
@@ -1,3 +1,5 @@
+from .cache_search_index import CacheSearchIndex
 from .cache_manager import CacheManager
+from .task_manager import TaskManager
 
-__all__ = ["CacheManager"]
\ No newline at end of file
+__all__ = ["CacheManager", "CacheSearchIndex", "TaskManager"]
\ No newline at end of file
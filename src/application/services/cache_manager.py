@@ -1,30 +1,60 @@
+import asyncio
 import logging
-from typing import Dict, Optional, overload, Any
+from typing import Dict, List, Optional, Sequence, Tuple, overload, Any
 from pathlib import Path
 from logging import Logger
 from src.application.models.dataclasses.cached_item import CachedItem
 from src.application.protocols.cache_storage_protocol import CacheStorageProtocol
+from src.application.services.cache_search_index import CacheSearchIndex
 from src.application.models.dataclasses.cache_key import CacheKey
 from src.domain.models.result import Result
+from src.domain.models.time_range import TimeRange
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
-from src.core.constants import UNKNOWN_FILE_SIZE, DEFAULT_STRING_DIVISOR
+from src.core.constants import UNKNOWN_FILE_SIZE, DEFAULT_STRING_DIVISOR, DEFAULT_KEY_VALUE_DIVISOR, DEFAULT_SEARCH_RESULTS
+
+SEARCH_INDEX_CHUNK = 2000
 
 class CacheManager():
-    """Manages cache logic with a external interface CacheStorage"""
+    """Manages cache logic with a external interface CacheStorage
+
+    A copy of the last index loaded or saved is kept in memory for peek_item. The async lookups
+    still read the storage, so entries written by another process (like an ingest run) are seen.
+    The search index, if any, follows every change of that copy.
+    """
     
-    def __init__(self, storage: CacheStorageProtocol, logger: Optional[Logger] = None) -> None:
+    def __init__(self, storage: CacheStorageProtocol, logger: Optional[Logger] = None,
+                 search_index: Optional[CacheSearchIndex] = None) -> None:
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.storage = storage
+        self.search_index = search_index
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
 
     async def _load_database_index(self) -> Dict[str, Dict[str, Any]]:
         self.logger.debug("Loading cache database index...")
-        return await self.storage.load_index()
+        index = await self.storage.load_index()
+        await self._replace_index(index)
+        return index
+
+    async def _replace_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        previous = self._index or {}
+        self._index = dict(index)
+        if self.search_index is None:
+            return
+        for key_str in previous.keys() - index.keys():
+            self.search_index.remove(self._url_of(key_str))
+        added = [(self._url_of(key_str), index[key_str].get("title")) for key_str in index.keys() - previous.keys()]
+        # a first load can be large, the loop gets a turn between chunks
+        for start in range(0, len(added), SEARCH_INDEX_CHUNK):
+            self.search_index.add_many(added[start:start + SEARCH_INDEX_CHUNK])
+            await asyncio.sleep(0)
+        self.search_index.sort()
 
     async def _save_database_index(self, index: Dict[str, Dict[str, Any]]) -> Result:
         self.logger.debug("Saving cache database index...")
         try:
             await self.storage.save_index(index)
+            await self._replace_index(index)
             return Result(ok=True)
         except Exception as error:
             self.logger.error(f"Failed to save cache index: {error}")
@@ -47,21 +77,52 @@ class CacheManager():
             return None
 
         self.logger.debug(f"Cache HIT for key: {key}")
+        if self.search_index:
+            self.search_index.touch(key.url)
         return self._deserialize_item({key_str: item_data})
 
+    def peek_item(self, key: CacheKey) -> Optional[CachedItem]:
+        """Looks a key up in the in-memory copy of the index, without any I/O.
+        Args:
+            key: (CacheKey) The indentifier to retrive
+        Returns:
+            CachedItem (Optional), None also when the index wasn't loaded yet
+        """
+        if self._index is None:
+            return None
+        key_str = self._key_to_str(key)
+        item_data = self._index.get(key_str)
+        if not item_data:
+            return None
+        if self.search_index:
+            self.search_index.touch(key.url)
+        return self._deserialize_item({key_str: item_data})
+
+    async def load(self) -> None:
+        """Loads the index ahead of the first lookup, so peeks and searches already find entries."""
+        await self._load_database_index()
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_RESULTS) -> List[Tuple[str, Optional[str]]]:
+        """Cached (url, title) pairs matching a typed query, most used first."""
+        if self.search_index is None:
+            return []
+        return self.search_index.search(query, limit)
+
     @overload
-    async def store_item(self, key: CacheKey, source_file: Path, remote_url: None, file_size: None = None) -> CachedItem: ...
+    async def store_item(self, key: CacheKey, source_file: Path, remote_url: None, file_size: None = None, title: Optional[str] = None) -> CachedItem: ...
 
     @overload
-    async def store_item(self, key: CacheKey, source_file: None, remote_url: str, file_size: int) -> CachedItem: ...
+    async def store_item(self, key: CacheKey, source_file: None, remote_url: str, file_size: int, title: Optional[str] = None) -> CachedItem: ...
 
-    async def store_item(self, key: CacheKey, source_file: Optional[Path], remote_url: Optional[str], file_size: Optional[int] = None) -> Optional[CachedItem]:
+    async def store_item(self, key: CacheKey, source_file: Optional[Path], remote_url: Optional[str], file_size: Optional[int] = None,
+                         title: Optional[str] = None) -> Optional[CachedItem]:
         """Index a item to cache
         Args:
             key: (CacheKey) The indentifier to store
             source_file: (Path) The file to index with the key
             remote_url: (str) The remote url to index with the key
             file_size: (int) The size of the file, if known
+            title: (str) The media title, for search
         Returns:
             CachedItem (Optional) """
         self.logger.debug(f"Storing cache item for key: {key}")
@@ -83,6 +144,7 @@ class CacheManager():
             key=key,
             local_path=source_path,
             remote_url=remote_url,
+            title=title,
             file_size=computed_file_size
         )
 
@@ -94,19 +156,72 @@ class CacheManager():
             self.logger.warning(f"Failed to save cache index: {result.message}")
             raise Exception(f"Failed to save cache index: {result.message}")
 
+        if self.search_index:
+            self.search_index.touch(key.url)
         self.logger.debug(f"Stored cache item: {cached_item}")
         return cached_item
 
+    async def store_parts(self, key: CacheKey, part_files: Sequence[Path], file_size: int, title: Optional[str] = None) -> CachedItem:
+        """Index the parts of a split file to cache, in order
+        Args:
+            key: (CacheKey) The indentifier to store
+            part_files: (Sequence[Path]) The parts to move to the cache
+            file_size: (int) The size of all parts together
+            title: (str) The media title, for search
+        Returns:
+            CachedItem"""
+        key_str = self._key_to_str(key)
+        part_paths = tuple([await self.storage.move_file_to_cache(key_str, part) for part in part_files])
+        cached_item = CachedItem(key=key, part_paths=part_paths, file_size=file_size, title=title)
+
+        index = await self._load_database_index()
+        index.update(self._serialize_item(cached_item))
+        result = await self._save_database_index(index)
+
+        if not result.ok:
+            self.logger.warning(f"Failed to save cache index: {result.message}")
+            raise Exception(f"Failed to save cache index: {result.message}")
+
+        if self.search_index:
+            self.search_index.touch(key.url)
+        self.logger.debug(f"Stored {len(part_paths)} cached parts: {cached_item}")
+        return cached_item
+
     def _key_to_str(self, key: CacheKey) -> str:
         """Converts a CacheKey object to a unique string representation"""
-        return f"{key.url}{DEFAULT_STRING_DIVISOR}{key.format_value.value}{DEFAULT_STRING_DIVISOR}{key.quality.value if key.quality else 'none'}"
+        key_str = f"{key.url}{DEFAULT_STRING_DIVISOR}{key.format_value.value}{DEFAULT_STRING_DIVISOR}{key.quality.value if key.quality else 'none'}"
+        # Optional parts are appended as name=value so older index entries keep the same key
+        for name, value in self._key_extras(key).items():
+            key_str += f"{DEFAULT_STRING_DIVISOR}{name}{DEFAULT_KEY_VALUE_DIVISOR}{value}"
+        return key_str
+
+    @staticmethod
+    def _url_of(key_str: str) -> str:
+        return key_str.split(DEFAULT_STRING_DIVISOR, 1)[0]
+
+    def _key_extras(self, key: CacheKey) -> Dict[str, str]:
+        """Returns the optional key parts that are set"""
+        extras: Dict[str, str] = {}
+        if key.size_limit is not None:
+            extras["limit"] = str(key.size_limit)
+        if key.time_range is not None:
+            start, end = key.time_range.start, key.time_range.end
+            # fixed precision, :g rounds long timestamps together and writes tiny ones with an exponent
+            extras["range"] = f"{start:.3f}-{end:.3f}" if end is not None else f"{start:.3f}-"
+        if key.attachment_limit is not None:
+            extras["attach"] = str(key.attachment_limit)
+        if key.auto_quality:
+            extras["auto"] = "1"
+        return extras
     
     def _serialize_item(self, item: CachedItem) -> Dict[str, Dict[str, Any]]:
         """Converts a CachedItem object to a dict data"""
         return {
             self._key_to_str(item.key): {
                 "local_path": str(item.local_path) if item.local_path else None,
+                "part_paths": [str(path) for path in item.part_paths],
                 "remote_url": item.remote_url,
+                "title": item.title,
                 "file_size": item.file_size,
             }
         }
@@ -116,20 +231,34 @@ class CacheManager():
         key_str = list(item_data.keys())[0]
         item_info = item_data[key_str]
 
-        url, format_str, quality_str = key_str.split(DEFAULT_STRING_DIVISOR)
+        url, format_str, quality_str, *extra_parts = key_str.split(DEFAULT_STRING_DIVISOR)
+        extras = dict(part.split(DEFAULT_KEY_VALUE_DIVISOR, 1) for part in extra_parts)
         key = CacheKey(
             url=url,
             format_value=Formats(format_str),
-            quality=Quality(quality_str) if quality_str != 'none' else None
+            quality=Quality(quality_str) if quality_str != 'none' else None,
+            size_limit=int(extras["limit"]) if "limit" in extras else None,
+            time_range=self._parse_range(extras["range"]) if "range" in extras else None,
+            attachment_limit=int(extras["attach"]) if "attach" in extras else None,
+            auto_quality="auto" in extras,
         )
 
         local_path = Path(item_info["local_path"]) if item_info.get("local_path") else None
+        part_paths = tuple(Path(path) for path in item_info.get("part_paths") or [])
         remote_url = item_info.get("remote_url")
+        title = item_info.get("title")
         file_size = item_info.get("file_size", UNKNOWN_FILE_SIZE)
 
         return CachedItem(
             key=key,
             local_path=local_path,
+            part_paths=part_paths,
             remote_url=remote_url,
+            title=title,
             file_size=file_size,
-        )
\ No newline at end of file
+        )
+
+    @staticmethod
+    def _parse_range(range_str: str) -> TimeRange:
+        start, end = range_str.split("-", 1)
+        return TimeRange(start=float(start), end=float(end) if end else None)
\ No newline at end of file
@@ -0,0 +1,211 @@
+import re
+import math
+import time
+import heapq
+import bisect
+import logging
+from logging import Logger
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from src.core.constants import DEFAULT_SEARCH_HALF_LIFE, DEFAULT_SEARCH_RESULTS
+
+URL_PREFIXES = ("https://", "http://", "www.")
+URL_SEPARATORS = re.compile(r"[/?=&#]+")
+SELECTIVE_MATCHES = 2000 # above this many candidates, entries are scanned by rank instead
+SCAN_LIMIT = 2000 # best ranked entries a scan looks at, worse ones aren't suggested to broad queries
+INSERT_LIMIT = 64 # above this many new entries, the sorted lists are sorted again instead of inserted into
+
+@dataclass
+class _SearchEntry:
+    url: str
+    title: str | None
+    refs: int = 0 # cache keys (formats, qualities, ...) pointing to this URL
+    rank: Tuple[int, float] = (0, 0.0)
+    keys: Tuple[str, ...] = () # normalized url and media id, for prefix lookups
+    folded_title: str = "" # lowercased, for substring lookups
+
+class CacheSearchIndex():
+    """In-memory index of the cached URLs and titles, for suggestions while typing.
+
+    URLs (scheme and www. stripped) and media ids (their last part) are kept sorted for prefix
+    lookups, titles are split into trigrams for lookups anywhere in them. Both are updated entry
+    by entry as the cache changes. Matches are ranked by frecency: every use adds one to a score
+    that halves every half_life seconds. Since every score decays at the same rate, the order never
+    changes with time alone, so the rank is stored as log2(score) + time / half_life and only
+    updated on use.
+
+    A query matching many entries (like "youtube") or too short for trigrams skips the candidate sets
+    and walks the entries from the best rank down, stopping as soon as enough of them match or after
+    SCAN_LIMIT entries, so a query matching nothing doesn't look at the whole index.
+
+    Large batches (like the first load) are appended to the sorted lists, which are sorted once by
+    sort(), or by the next call needing them.
+    """
+
+    def __init__(self, half_life: float = DEFAULT_SEARCH_HALF_LIFE, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.half_life = half_life
+        self._entries: Dict[str, _SearchEntry] = {}
+        self._prefixes: List[Tuple[str, str]] = [] # (normalized url or media id, url)
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._ranked: List[Tuple[Tuple[int, float], str]] = [] # (rank, url), best last
+        self._unsorted = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, url: str, title: str | None = None) -> None:
+        self.add_many([(url, title)])
+
+    def add_many(self, items: Iterable[Tuple[str, str | None]]) -> None:
+        """Same as add for every (url, title), with a single merge of the trigram sets.
+        Past INSERT_LIMIT new entries, the sorted lists are only sorted again once needed."""
+        pending: Dict[str, List[str]] = {}
+        new_urls = [url for url, title in items if self._add(url, title, pending)]
+        for trigram, urls in pending.items():
+            self._trigrams.setdefault(trigram, set()).update(urls)
+        if len(new_urls) > INSERT_LIMIT or self._unsorted:
+            self._prefixes.extend(item for url in new_urls for item in self._prefix_items(url))
+            self._ranked.extend((self._entries[url].rank, url) for url in new_urls)
+            self._unsorted = self._unsorted or bool(new_urls)
+            return
+        for url in new_urls:
+            for item in self._prefix_items(url):
+                bisect.insort(self._prefixes, item)
+            bisect.insort(self._ranked, (self._entries[url].rank, url))
+
+    def sort(self) -> None:
+        """Sorts what add_many appended, ahead of the next lookup."""
+        if self._unsorted:
+            self._prefixes.sort()
+            self._ranked.sort()
+            self._unsorted = False
+
+    def remove(self, url: str) -> None:
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+        self.sort()
+        for item in self._prefix_items(url):
+            self._discard(self._prefixes, item)
+        del self._entries[url]
+        self._discard(self._ranked, (entry.rank, url))
+        self._unindex_title(url, entry.title)
+
+    def touch(self, url: str) -> None:
+        """Records a use of the URL for the ranking."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return
+        now = time.time() / self.half_life
+        used, rank = entry.rank
+        # score now is 2 ** (rank - now), one more use adds 1
+        score = 2 ** (rank - now) + 1 if used else 1
+        self.sort()
+        self._discard(self._ranked, (entry.rank, url))
+        entry.rank = (1, math.log2(score) + now)
+        bisect.insort(self._ranked, (entry.rank, url))
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_RESULTS) -> List[Tuple[str, str | None]]:
+        """Best (url, title) matches for what was typed, every entry when the query is empty."""
+        self.sort()
+        query = query.strip().lower()
+        prefix = self._normalize_url(query)
+        start = bisect.bisect_left(self._prefixes, (prefix, ""))
+        end = bisect.bisect_left(self._prefixes, (prefix + "￿", ""))
+        postings = self._postings(query)
+
+        if end - start > SELECTIVE_MATCHES or (postings is not None and len(postings[0]) > SELECTIVE_MATCHES):
+            best = self._scan_by_rank(query, prefix, limit)
+        else:
+            candidates = {url for _, url in self._prefixes[start:end]}
+            if postings is None:
+                # too short for trigrams, titles are only looked up among the best ranked entries
+                candidates.update(self._scan_by_rank(query, prefix, limit))
+            else:
+                # trigrams can match out of order, the candidates are checked for the real substring
+                candidates |= {url for url in postings[0].intersection(*postings[1:]) if query in self._entries[url].folded_title}
+            best = heapq.nlargest(limit, candidates, key=lambda url: self._entries[url].rank)
+        return [(url, self._entries[url].title) for url in best]
+
+    def _add(self, url: str, title: str | None, postings: Dict[str, Any]) -> bool:
+        """Counts one more key for the URL, True if it's new and still has to be put in the sorted lists.
+        New trigrams go to postings, the index itself or lists merged into it afterwards."""
+        entry = self._entries.get(url)
+        if entry is None:
+            # never used entries rank below used ones, newer first
+            normalized = self._normalize_url(url)
+            media_id = URL_SEPARATORS.split(normalized.rstrip("/?=&#"))[-1]
+            self._entries[url] = _SearchEntry(url=url, title=title, refs=1, rank=(0, time.time()),
+                                              keys=tuple({normalized, media_id}), folded_title=title.lower() if title else "")
+            self._index_title(url, title, postings)
+            return True
+        if title and title != entry.title:
+            self._unindex_title(url, entry.title)
+            entry.title = title
+            entry.folded_title = title.lower()
+            self._index_title(url, title, postings)
+        entry.refs += 1
+        return False
+
+    def _postings(self, query: str) -> List[Set[str]] | None:
+        """Sets of the URLs having each trigram of the query, smallest first; None if the query is too short."""
+        trigrams = self._trigrams_of(query)
+        if not trigrams:
+            return None
+        return sorted((self._trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+
+    def _scan_by_rank(self, query: str, prefix: str, limit: int) -> List[str]:
+        best: List[str] = []
+        for _, url in self._ranked[:-SCAN_LIMIT - 1:-1]:
+            entry = self._entries[url]
+            if not query or query in entry.folded_title or any(key.startswith(prefix) for key in entry.keys):
+                best.append(url)
+                if len(best) == limit:
+                    break
+        return best
+
+    def _index_title(self, url: str, title: str | None, postings: Dict[str, Any]) -> None:
+        if not title:
+            return
+        if postings is self._trigrams:
+            for trigram in self._trigrams_of(title.lower()):
+                self._trigrams.setdefault(trigram, set()).add(url)
+        else:
+            for trigram in self._trigrams_of(title.lower()):
+                postings.setdefault(trigram, []).append(url)
+
+    def _unindex_title(self, url: str, title: str | None) -> None:
+        if not title:
+            return
+        for trigram in self._trigrams_of(title.lower()):
+            urls = self._trigrams.get(trigram)
+            if urls is None:
+                continue
+            urls.discard(url)
+            if not urls:
+                del self._trigrams[trigram]
+
+    def _prefix_items(self, url: str) -> List[Tuple[str, str]]:
+        return [(key, url) for key in self._entries[url].keys]
+
+    @staticmethod
+    def _discard(items: List[Tuple], item: Tuple) -> None:
+        position = bisect.bisect_left(items, item)
+        if position < len(items) and items[position] == item:
+            del items[position]
+
+    @staticmethod
+    def _trigrams_of(text: str) -> Set[str]:
+        return {text[index:index + 3] for index in range(len(text) - 2)}
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        url = url.lower()
+        for prefix in URL_PREFIXES:
+            if url.startswith(prefix):
+                url = url[len(prefix):]
+        return url
\ No newline at end of file
@@ -2,10 +2,12 @@ from .download_request_validator import DownloadRequestValidator
 from .download_cache_service import DownloadCacheService
 from .downloader_service import DownloaderService
 from .download_storage_strategy import StorageDecisionStrategy, SizeBasedStorageDecisionStrategy
+from .speculative_probe_service import SpeculativeProbeService
 
 __all__ = [
     "DownloadRequestValidator",
     "DownloadCacheService",
     "DownloaderService",
     "StorageDecisionStrategy",
+    "SpeculativeProbeService",
 ]
\ No newline at end of file
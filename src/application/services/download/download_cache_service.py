@@ -1,4 +1,6 @@
-from typing import Optional
+from pathlib import Path
+from dataclasses import replace
+from typing import List, Optional, Sequence
 from src.application.services import CacheManager
 from src.application.protocols.remote_storage_service_protocol import RemoteStorageServiceProtocol
 from src.application.dto.request.download_request import DownloadRequest
@@ -6,6 +8,7 @@ from src.application.dto.output.download_output import DownloadOutput
 from src.application.models.dataclasses.cached_item import CachedItem
 from src.application.models.dataclasses.cache_key import CacheKey
 from src.domain.enum.download_destination import DownloadDestination
+from src.domain.enum.quality import Quality
 from src.domain.models import DownloadedFile
 
 
@@ -15,34 +18,86 @@ class DownloadCacheService():
     def __init__(self, cache_manager: CacheManager):
         self.cache_manager = cache_manager
 
-    def create_cache_key(self, request: DownloadRequest) -> CacheKey:
-        if request.format.is_audio():
-            return CacheKey(
-                url=request.url,
-                format_value=request.format,
-                quality=None,
-            )
+    def create_cache_key(self, request: DownloadRequest, attached: bool = False, quality: Optional[Quality] = None) -> CacheKey:
+        """Args:
+            attached: Key of a result delivered as attachments, which depends on the request's limit
+            quality: The quality delivered, a result lowered to finish in time is keyed like a request
+                for that quality, later requests leaving the quality to us may have the time for more"""
+        if quality is not None and quality != request.quality:
+            request = replace(request, quality=quality, auto_quality=False)
+        size_limit = request.file_size_limit if request.fit_to_limit else None
+        # a fitted variant already has the limit in its key
+        attachment_limit = request.file_size_limit if attached and not request.fit_to_limit else None
         return CacheKey(
             url=request.url,
             format_value=request.format,
-            quality=request.quality,
+            quality=None if request.format.is_audio() else request.quality,
+            size_limit=size_limit,
+            time_range=request.time_range,
+            attachment_limit=attachment_limit,
+            auto_quality=request.auto_quality and not request.format.is_audio(),
         )
 
     async def get_cached_output(self, request: DownloadRequest) -> Optional[DownloadOutput]:
-        cache_key = self.create_cache_key(request)
-        cached_item = await self.cache_manager.get_item(cache_key)
+        for cache_key in self._lookup_keys(request):
+            output = self._to_output(request, await self.cache_manager.get_item(cache_key))
+            if output:
+                return output
+        return None
+
+    def peek_cached_output(self, request: DownloadRequest) -> Optional[DownloadOutput]:
+        """Synchronous lookup in the in-memory index, a miss here may still be a hit for get_cached_output."""
+        for cache_key in self._lookup_keys(request):
+            output = self._to_output(request, self.cache_manager.peek_item(cache_key))
+            if output:
+                return output
+        return None
+
+    def _lookup_keys(self, request: DownloadRequest) -> List[CacheKey]:
+        """The attachments made for this limit first, then the entry shared by every limit."""
+        keys = [self.create_cache_key(request, attached=True)]
+        shared_key = self.create_cache_key(request)
+        if shared_key != keys[0]:
+            keys.append(shared_key)
+        return keys
+
+    def _to_output(self, request: DownloadRequest, cached_item: Optional[CachedItem]) -> Optional[DownloadOutput]:
         if cached_item:
+            if cached_item.part_paths:
+                if not request.allow_split or not self._fits(request, cached_item.part_paths):
+                    # the parts are no use to this caller, downloading again gives it its own result
+                    return None
+                return DownloadOutput(file_paths=cached_item.part_paths, file_size=cached_item.file_size)
             if cached_item.remote_url:
                 return DownloadOutput(file_path=None, file_url=cached_item.remote_url, file_size=cached_item.file_size)
             if cached_item.local_path:
+                if not self._fits(request, (cached_item.local_path,)):
+                    return None
                 return DownloadOutput(file_path=cached_item.local_path, file_url=None, file_size=cached_item.file_size)
         return None
 
-    async def store_download(self, cache_key: CacheKey, downloaded_file: DownloadedFile, destination: DownloadDestination, storage_service: RemoteStorageServiceProtocol) -> DownloadOutput:
+    @staticmethod
+    def _fits(request: DownloadRequest, paths: Sequence[Path]) -> bool:
+        """Also false for files gone from disk. Entries cached before keys carried the limit may have been made for a bigger one."""
+        try:
+            return all(path.stat().st_size <= request.file_size_limit for path in paths)
+        except OSError:
+            return False
+
+    async def store_download(self, cache_key: CacheKey, downloaded_file: DownloadedFile, destination: DownloadDestination, storage_service: RemoteStorageServiceProtocol,
+                             title: Optional[str] = None) -> DownloadOutput:
         if destination == DownloadDestination.REMOTE:
             final_url = await storage_service.upload(downloaded_file.file_path)
-            cached = await self.cache_manager.store_item(key=cache_key, source_file=None, remote_url=final_url, file_size=downloaded_file.file_size)
+            cached = await self.cache_manager.store_item(key=cache_key, source_file=None, remote_url=final_url, file_size=downloaded_file.file_size, title=title)
             return DownloadOutput(file_path=None, file_url=cached.remote_url, file_size=downloaded_file.file_size)
         else:
-            cached = await self.cache_manager.store_item(key=cache_key, source_file=downloaded_file.file_path, remote_url=None, file_size=downloaded_file.file_size)
-            return DownloadOutput(file_path=cached.local_path, file_url=None, file_size=cached.file_size)
\ No newline at end of file
+            cached = await self.cache_manager.store_item(key=cache_key, source_file=downloaded_file.file_path, remote_url=None, file_size=downloaded_file.file_size, title=title)
+            return DownloadOutput(file_path=cached.local_path, file_url=None, file_size=cached.file_size)
+
+    async def store_uploaded(self, cache_key: CacheKey, file_url: str, file_size: int, title: Optional[str] = None) -> DownloadOutput:
+        cached = await self.cache_manager.store_item(key=cache_key, source_file=None, remote_url=file_url, file_size=file_size, title=title)
+        return DownloadOutput(file_path=None, file_url=cached.remote_url, file_size=file_size)
+
+    async def store_parts(self, cache_key: CacheKey, part_files: Sequence[Path], file_size: int, title: Optional[str] = None) -> DownloadOutput:
+        cached = await self.cache_manager.store_parts(key=cache_key, part_files=part_files, file_size=file_size, title=title)
+        return DownloadOutput(file_paths=cached.part_paths, file_size=file_size)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from src.application.protocols.url_validator_protocol import URLValidatorProtocol
 from src.application.dto.request.download_request import DownloadRequest
-from src.domain.exceptions import UrlException, BlacklistException
+from src.domain.exceptions import UrlException, BlacklistException, InvalidTimeRange
 
 class DownloadRequestValidator():
     """Validates download requests for URL validity and blacklist status."""
@@ -19,10 +19,18 @@ class DownloadRequestValidator():
         Raises:
             UrlException: If the URL is invalid.
             BlacklistException: If the URL is blacklisted.
+            InvalidTimeRange: If the clip range is empty or negative.
         """
         if not self.url_validator.is_valid(request.url):
             raise UrlException(f"Invalid URL: {request.url}")
         
         for site in self.blacklist_sites:
             if site in request.url:
-                raise BlacklistException(f"URL is blacklisted: {request.url}")
\ No newline at end of file
+                raise BlacklistException(f"URL is blacklisted: {request.url}")
+
+        time_range = request.time_range
+        if time_range is not None:
+            if time_range.start < 0:
+                raise InvalidTimeRange(f"Clip start can't be negative: {time_range.start}")
+            if time_range.end is not None and time_range.end <= time_range.start:
+                raise InvalidTimeRange(f"Clip end must come after its start: {time_range}")
\ No newline at end of file
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from src.application.dto.request.download_request import DownloadRequest
 from src.application.models.dataclasses.download_storage_decision import DownloadStorageDecision
 from src.domain.models import DownloadedFile
+from src.core.constants import DEFAULT_MAX_SPLIT_PARTS, DEFAULT_SPLIT_SIZE_MARGIN
 
 
 class StorageDecisionStrategy(ABC):
@@ -11,13 +12,31 @@ class StorageDecisionStrategy(ABC):
     async def decide(self, request: DownloadRequest, downloaded_file: DownloadedFile) -> DownloadStorageDecision:
         pass
 
+    def allows_split(self, request: DownloadRequest, file_size: int) -> bool:
+        """Whether a file of this size would be delivered as several parts."""
+        return False
+
 
 class SizeBasedStorageDecisionStrategy(StorageDecisionStrategy):
-    """Storage decision strategy based on file size."""
+    """Storage decision strategy based on file size.
+
+    Files a few times over the limit are split into parts sent as attachments, which is faster
+    than a remote upload. Only bigger files go remote.
+    """
+
+    def __init__(self, max_split_parts: int = DEFAULT_MAX_SPLIT_PARTS, split_margin: float = DEFAULT_SPLIT_SIZE_MARGIN) -> None:
+        self.max_split_parts = max_split_parts
+        self.split_margin = split_margin
 
     async def decide(self, request: DownloadRequest, downloaded_file: DownloadedFile) -> DownloadStorageDecision:
         from src.domain.enum.download_destination import DownloadDestination
-        if downloaded_file.file_size > request.file_size_limit:
-            return DownloadStorageDecision(destination=DownloadDestination.REMOTE)
-        else:
-            return DownloadStorageDecision(destination=DownloadDestination.LOCAL)
\ No newline at end of file
+        if downloaded_file.file_size <= request.file_size_limit:
+            return DownloadStorageDecision(destination=DownloadDestination.LOCAL)
+        if self.allows_split(request, downloaded_file.file_size):
+            return DownloadStorageDecision(destination=DownloadDestination.SPLIT)
+        return DownloadStorageDecision(destination=DownloadDestination.REMOTE)
+
+    def allows_split(self, request: DownloadRequest, file_size: int) -> bool:
+        # parts are cut at keyframes, so they don't fill the limit exactly
+        max_split_size = request.file_size_limit * self.max_split_parts * self.split_margin
+        return request.allow_split and request.file_size_limit < file_size <= max_split_size
\ No newline at end of file
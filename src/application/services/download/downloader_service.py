@@ -2,7 +2,7 @@ from logging import Logger
 from pathlib import Path
 from src.application.protocols import DownloadServiceProtocol
 from src.application.dto.request.download_request import DownloadRequest
-from src.domain.models import DownloadedFile
+from src.domain.models import CancellationToken, DownloadedFile, GrowingFile, MediaProbe, ProgressTracker
 
 class DownloaderService():
     """Downloads media to a specified output path"""
@@ -11,6 +11,18 @@ class DownloaderService():
         self.logger = logger
         self.download_service = download_service
 
-    async def download(self, request: DownloadRequest, output_path: Path) -> DownloadedFile:
-        """Download to the specified output path"""
-        return await self.download_service.download(request.url, request.format, request.quality, output_path)
\ No newline at end of file
+    async def probe(self, request: DownloadRequest, cancellation: CancellationToken | None = None) -> MediaProbe:
+        """Probe the requested media without downloading it, giving up once cancellation is cancelled"""
+        return await self.download_service.probe(request.url, request.format, request.quality,
+                                                 cancellation=cancellation)
+
+    async def download(self, request: DownloadRequest, output_path: Path, growing_file: GrowingFile | None = None,
+                       cancellation: CancellationToken | None = None, progress: ProgressTracker | None = None,
+                       deadline: float | None = None) -> DownloadedFile:
+        """Download to the specified output path, within deadline seconds when the request leaves the quality to us"""
+        max_filesize = request.file_size_limit if request.fit_to_limit else None
+        return await self.download_service.download(request.url, request.format, request.quality, output_path,
+                                                    max_filesize=max_filesize, growing_file=growing_file,
+                                                    cancellation=cancellation, time_range=request.time_range,
+                                                    progress=progress,
+                                                    deadline=deadline if request.auto_quality else None)
\ No newline at end of file
@@ -0,0 +1,116 @@
+import re
+import time
+import asyncio
+from logging import Logger
+from typing import Dict, Optional
+from src.application.protocols import DownloadUseCaseProtocol, MediaUrlMatcherProtocol
+from src.application.services import TaskManager
+from src.application.services.download.downloader_service import DownloaderService
+from src.application.services.download.download_request_validator import DownloadRequestValidator
+from src.application.dto.request.download_request import DownloadRequest
+from src.domain.enum.formats import Formats
+from src.core.constants import (
+    DEFAULT_INFO_CACHE_TTL,
+    DEFAULT_INTERACTION_DEADLINE,
+    DEFAULT_PREFETCH_AUDIO_SIZE,
+    DEFAULT_SPECULATIVE_IDLE_POLL,
+    DEFAULT_SPECULATIVE_MAX_URLS,
+    DEFAULT_SPECULATIVE_QUEUE_SIZE,
+)
+
+URL_PATTERN = re.compile(r"https?://[^\s<>]+")
+# punctuation closing the sentence around a link, not part of it
+URL_TRAILING_CHARACTERS = ".,;:!?)]}'\"|*_~`"
+
+class SpeculativeProbeService():
+    """Probes media links seen in chat before anyone asks for them, so /download finds them already extracted.
+
+    Links are filtered offline (URL, blacklist, a matching extractor) and probed one at a time, only while
+    no download is running. Links past a full queue are dropped and a link is probed once per info cache lifetime.
+    With a download usecase, short audio is also downloaded ahead and ends up in the download cache.
+    """
+
+    def __init__(self, downloader_service: DownloaderService, validator: DownloadRequestValidator,
+                 url_matcher: MediaUrlMatcherProtocol, task_manager: TaskManager, logger: Logger,
+                 download_usecase: Optional[DownloadUseCaseProtocol] = None,
+                 prefetch_audio_size: int = DEFAULT_PREFETCH_AUDIO_SIZE, queue_size: int = DEFAULT_SPECULATIVE_QUEUE_SIZE,
+                 max_urls: int = DEFAULT_SPECULATIVE_MAX_URLS, idle_poll: float = DEFAULT_SPECULATIVE_IDLE_POLL,
+                 recent_ttl: float = DEFAULT_INFO_CACHE_TTL) -> None:
+        self.downloader_service = downloader_service
+        self.validator = validator
+        self.url_matcher = url_matcher
+        self.task_manager = task_manager
+        self.logger = logger
+        self.download_usecase = download_usecase
+        self.prefetch_audio_size = prefetch_audio_size
+        self.queue_size = queue_size
+        self.max_urls = max_urls
+        self.idle_poll = idle_poll
+        self.recent_ttl = recent_ttl
+        self._queue: asyncio.Queue[DownloadRequest] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        self._recent: Dict[str, float] = {}
+
+    def submit(self, text: str, file_size_limit: int) -> int:
+        """Queue the links found in a message without waiting for them. Returns how many were queued."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.queue_size)
+            self._worker = asyncio.create_task(self._run(self._queue))
+
+        now = time.monotonic()
+        self._recent = {url: seen_at for url, seen_at in self._recent.items() if now - seen_at < self.recent_ttl}
+        queued = 0
+        for match in URL_PATTERN.findall(text)[:self.max_urls]:
+            url = match.rstrip(URL_TRAILING_CHARACTERS)
+            if url in self._recent:
+                continue
+            # audio is what a prefetch would download, the extraction it caches serves any format
+            request = DownloadRequest(url=url, file_size_limit=file_size_limit, format=Formats.MP3)
+            try:
+                self.validator.validate(request)
+                self._queue.put_nowait(request)
+            except asyncio.QueueFull:
+                self.logger.debug(f"Speculative probe queue is full, dropping {url}")
+                break
+            except Exception:
+                # invalid or blacklisted
+                continue
+            self._recent[url] = now
+            queued += 1
+        return queued
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self, queue: asyncio.Queue[DownloadRequest]) -> None:
+        while True:
+            request = await queue.get()
+            try:
+                await self._wait_idle()
+                await self._probe(request)
+            except Exception as error:
+                self.logger.debug(f"Speculative probe of {request.url} failed: {error}")
+
+    async def _wait_idle(self) -> None:
+        """Requested downloads come first, probes only start while none is running."""
+        while self.task_manager.active:
+            await asyncio.sleep(self.idle_poll)
+
+    async def _probe(self, request: DownloadRequest) -> None:
+        # loading the extractors' patterns and matching against them takes a moment
+        if not await asyncio.to_thread(self.url_matcher.is_supported, request.url):
+            return
+        probe = await self.downloader_service.probe(request)
+        self.logger.info(f"Probed {request.url} ahead of any request ({probe.title})")
+
+        if self.download_usecase is None or probe.estimated_size is None or probe.estimated_size > self.prefetch_audio_size:
+            return
+        with self.task_manager.track(timeout=DEFAULT_INTERACTION_DEADLINE) as cancellation:
+            await self.download_usecase.execute(request, cancellation)
+        self.logger.info(f"Prefetched the audio of {request.url} ({probe.estimated_size} bytes)")
\ No newline at end of file
@@ -0,0 +1,4 @@
+from .pipeline_stage import PipelineStage
+from .pipeline import Pipeline
+
+__all__ = ["Pipeline", "PipelineStage"]
\ No newline at end of file
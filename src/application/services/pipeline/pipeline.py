@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from logging import Logger
+from typing import Awaitable, Callable, Dict, Generic, List, Optional
+from src.application.models.dataclasses import StageMetrics
+from src.application.services.pipeline.pipeline_stage import JobT, PipelineStage
+
+# called once per job, with the error that stopped it or None when it went through every stage it needed
+JobDoneCallback = Callable[[JobT, Optional[BaseException]], Awaitable[None]]
+
+class Pipeline(Generic[JobT]):
+    """Runs jobs through ordered stages connected by bounded queues.
+
+    Every stage has its own workers, so a slow stage only holds its own slots. When a stage's queue
+    is full the workers of the stage before it wait to hand the job over, which slows the whole
+    pipeline down to the pace of its slowest stage instead of piling up work in memory.
+    """
+
+    def __init__(self, stages: List[PipelineStage[JobT]], on_done: JobDoneCallback[JobT],
+                 logger: Optional[Logger] = None) -> None:
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.stages: Dict[str, PipelineStage[JobT]] = {stage.name: stage for stage in stages}
+        self.first_stage = stages[0].name
+        self.on_done = on_done
+        self._workers: List[asyncio.Task[None]] = []
+
+    async def submit(self, job: JobT, stage: Optional[str] = None) -> None:
+        """Queue a job at the first stage (or the given one), waiting while that stage is full."""
+        self.start()
+        await self.stages[stage or self.first_stage].put(job)
+
+    def start(self) -> None:
+        """Start the workers of every stage, does nothing if they are running."""
+        if self._workers:
+            return
+        for stage in self.stages.values():
+            for index in range(stage.concurrency):
+                self._workers.append(asyncio.create_task(self._work(stage), name=f"pipeline-{stage.name}-{index}"))
+        self.logger.info(f"Pipeline started: {', '.join(f'{s.name}={s.concurrency}' for s in self.stages.values())}")
+
+    async def stop(self) -> None:
+        """Cancel the workers, jobs still queued are dropped."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def metrics(self) -> List[StageMetrics]:
+        return [stage.metrics for stage in self.stages.values()]
+
+    async def _work(self, stage: PipelineStage[JobT]) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            queued_at, job = await stage.get()
+            started_at = loop.time()
+            stage.metrics.active += 1
+            try:
+                next_stage = await stage.handler(job)
+            except BaseException as error:
+                # a handler's own cancellation fails its job only, the worker goes on unless it's being stopped
+                stage.metrics.record(started_at - queued_at, loop.time() - started_at, failed=True)
+                self.logger.debug(f"Stage '{stage.name}' failed a job: {error!r}")
+                await self._finish(job, error)
+                if asyncio.current_task().cancelling():
+                    raise
+                continue
+            finally:
+                stage.metrics.active -= 1
+                stage.queue.task_done()
+
+            stage.metrics.record(started_at - queued_at, loop.time() - started_at)
+            if next_stage is None:
+                await self._finish(job, None)
+            else:
+                await self.stages[next_stage].put(job)
+
+    async def _finish(self, job: JobT, error: Optional[BaseException]) -> None:
+        try:
+            await self.on_done(job, error)
+        except Exception as callback_error:
+            self.logger.error(f"Failed to finish a pipeline job: {callback_error}", exc_info=True)
\ No newline at end of file
@@ -0,0 +1,37 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, Tuple, TypeVar
+from src.application.models.dataclasses import StageMetrics
+from src.core.constants import DEFAULT_PIPELINE_QUEUE_SIZE
+
+JobT = TypeVar("JobT")
+
+# a handler returns the name of the next stage, or None when the job is done
+StageHandler = Callable[[JobT], Awaitable[str | None]]
+
+class PipelineStage(Generic[JobT]):
+    """A named step of a pipeline, with its own bounded queue and number of workers."""
+
+    def __init__(self, name: str, handler: StageHandler[JobT], concurrency: int = 1,
+                 queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE) -> None:
+        if concurrency < 1:
+            raise ValueError(f"Stage '{name}' needs at least one worker")
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.queue: asyncio.Queue[Tuple[float, JobT]] = asyncio.Queue(maxsize=queue_size)
+        self.metrics = StageMetrics(name=name, concurrency=concurrency)
+
+    async def put(self, job: JobT) -> None:
+        """Queue a job, waiting while the queue is full."""
+        await self.queue.put((asyncio.get_running_loop().time(), job))
+        self._update_depth()
+
+    async def get(self) -> Tuple[float, JobT]:
+        """Take the next job and the loop time it was queued at."""
+        item = await self.queue.get()
+        self._update_depth()
+        return item
+
+    def _update_depth(self) -> None:
+        self.metrics.queue_depth = self.queue.qsize()
+        self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, self.metrics.queue_depth)
\ No newline at end of file
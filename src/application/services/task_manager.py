@@ -0,0 +1,47 @@
+import logging
+from logging import Logger
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from src.domain.models import CancellationToken
+
+class TaskManager():
+    """Keeps the cancellation tokens of running jobs, so they can be stopped by owner or all at once."""
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._tokens: Dict[CancellationToken, int | None] = {}
+
+    @property
+    def active(self) -> int:
+        return len(self._tokens)
+
+    @contextmanager
+    def track(self, owner: int | None = None, timeout: float | None = None) -> Iterator[CancellationToken]:
+        """
+        Register a job for the duration of the context.
+
+        Args:
+            owner: Who started the job (like a Discord user id), used by cancel_owner
+            timeout: Seconds until the job is cancelled on its own
+        """
+        token = CancellationToken(timeout=timeout)
+        self._tokens[token] = owner
+        try:
+            yield token
+        finally:
+            self._tokens.pop(token, None)
+
+    def cancel_owner(self, owner: int, reason: str) -> int:
+        tokens = [token for token, token_owner in self._tokens.items() if token_owner == owner]
+        for token in tokens:
+            token.cancel(reason)
+        self.logger.info(f"Cancelled {len(tokens)} jobs of {owner}: {reason}")
+        return len(tokens)
+
+    def cancel_all(self, reason: str, resumable: bool = False) -> int:
+        """Cancel every running job, resumable ones keep their progress for the next start."""
+        tokens = list(self._tokens)
+        for token in tokens:
+            token.cancel(reason, resumable=resumable)
+        self.logger.info(f"Cancelled {len(tokens)} running jobs: {reason}")
+        return len(tokens)
\ No newline at end of file
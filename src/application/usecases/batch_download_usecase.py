@@ -0,0 +1,161 @@
+import time
+import asyncio
+from logging import Logger
+from dataclasses import replace
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from src.application.protocols import (
+    ArchiveServiceProtocol,
+    ArchiveWriterProtocol,
+    DownloadUseCaseProtocol,
+    PlaylistExpanderProtocol,
+    RemoteStorageServiceProtocol,
+    TempServiceProtocol,
+)
+from src.application.dto.request.batch_request import BatchRequest
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.batch_output import BatchItemOutput, BatchOutput
+from src.domain.enum import BatchDelivery
+from src.domain.models import CancellationToken, GrowingFile
+from src.domain.exceptions import DownloadCancelled
+from src.core.constants import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_MAX_ITEMS,
+    BATCH_ARCHIVE_NAME,
+    BATCH_LINKS_FILE_NAME,
+)
+
+class BatchDownloadUsecase():
+    """Usecase for downloading many URLs (or playlists) as one request.
+
+    Playlists are expanded lazily: the next entry is only pulled once a slot of the batch is free,
+    so a long playlist never has all its entries listed, downloaded or kept on disk at once.
+    Every item goes through the regular download usecase, cache lookup included.
+    """
+
+    def __init__(self, download_usecase: DownloadUseCaseProtocol, playlist_expander: PlaylistExpanderProtocol,
+                 storage_service: RemoteStorageServiceProtocol, temp_service: TempServiceProtocol,
+                 archive_service: ArchiveServiceProtocol, logger: Logger,
+                 concurrency: int = DEFAULT_BATCH_CONCURRENCY, max_items: int = DEFAULT_BATCH_MAX_ITEMS) -> None:
+        self.download_usecase = download_usecase
+        self.playlist_expander = playlist_expander
+        self.storage_service = storage_service
+        self.temp_service = temp_service
+        self.archive_service = archive_service
+        self.logger = logger
+        self.concurrency = concurrency
+        self.max_items = max_items
+
+    async def execute(self, batch: BatchRequest, cancellation: CancellationToken | None = None,
+                      context: Dict[str, Any] | None = None) -> BatchOutput:
+        """
+        Args:
+            batch: URLs to download and how to deliver them
+            cancellation: Stops every item of the batch
+            context: Where the results go, passed to every item
+
+        Raises:
+            DownloadCancelled: If the batch was cancelled
+        """
+        start_time = time.perf_counter()
+        cancellation = cancellation or CancellationToken()
+
+        if batch.delivery == BatchDelivery.ZIP:
+            async with self.temp_service.create_session() as temp_folder:
+                growing_file = GrowingFile()
+                archive = await asyncio.to_thread(self.archive_service.open_archive,
+                                                  temp_folder / BATCH_ARCHIVE_NAME, growing_file)
+                upload_task = asyncio.create_task(self.storage_service.upload_growing(growing_file, cancellation))
+                try:
+                    items = await self._run_items(batch, cancellation, context, archive)
+                    await asyncio.to_thread(self._finish_archive, archive, items)
+                    archive_url = await upload_task
+                except BaseException as error:
+                    await asyncio.to_thread(archive.abort, error)
+                    upload_task.cancel()
+                    raise
+        else:
+            items = await self._run_items(batch, cancellation, context, None)
+            items = await asyncio.gather(*(self._to_link(item) for item in items))
+            archive_url = None
+
+        elapsed = time.perf_counter() - start_time
+        failed = sum(1 for item in items if item.error)
+        self.logger.info(f"Batch of {len(items)} items finished in {elapsed:.2f}s ({failed} failed)")
+        return BatchOutput(items=tuple(items), archive_url=archive_url, elapsed=elapsed)
+
+    async def _run_items(self, batch: BatchRequest, cancellation: CancellationToken, context: Dict[str, Any] | None,
+                         archive: Optional[ArchiveWriterProtocol]) -> List[BatchItemOutput]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        archive_lock = asyncio.Lock()
+        tasks: List[asyncio.Task[BatchItemOutput]] = []
+        # an item delivered on its own after a restart would be lost to the batch, so it isn't resumed
+        item_context = {**(context or {}), "source": "batch"}
+
+        async def run_item(index: int, url: str) -> BatchItemOutput:
+            try:
+                # an item is archived or linked as one file, never in parts
+                request = DownloadRequest(url=url, file_size_limit=batch.file_size_limit, format=batch.format,
+                                          quality=batch.quality, allow_split=False)
+                output = await self.download_usecase.execute(request, cancellation, item_context)
+                if archive is not None and output.file_path:
+                    # the lock keeps entries whole, the archive is written strictly in order
+                    async with archive_lock:
+                        await asyncio.to_thread(archive.add_file, output.file_path, f"{index:03d} - {output.file_path.name}")
+                return BatchItemOutput(url=url, output=output)
+            except DownloadCancelled:
+                raise
+            except Exception as error:
+                self.logger.warning(f"Batch item {url} failed: {error}")
+                return BatchItemOutput(url=url, error=str(error))
+            finally:
+                semaphore.release()
+
+        try:
+            index = 0
+            async for url in self._expand(batch.urls):
+                # waiting for a free slot holds the loop, so entries are pulled at most one ahead of the running items
+                await semaphore.acquire()
+                cancellation.raise_if_cancelled()
+                index += 1
+                tasks.append(asyncio.create_task(run_item(index, url)))
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _expand(self, urls: Tuple[str, ...]) -> AsyncIterator[str]:
+        remaining = self.max_items
+        for url in urls:
+            if remaining <= 0:
+                self.logger.info(f"Batch is limited to {self.max_items} items, skipping the rest")
+                return
+            async for entry_url in self.playlist_expander.expand(url, remaining):
+                remaining -= 1
+                yield entry_url
+
+    async def _to_link(self, item: BatchItemOutput) -> BatchItemOutput:
+        """Items that were kept locally are uploaded, so every item of the batch is a link."""
+        output = item.output
+        if output is None or output.file_url or not output.file_path:
+            return item
+        try:
+            file_url = await self.storage_service.upload(output.file_path)
+        except Exception as error:
+            self.logger.warning(f"Failed to upload batch item {item.url}: {error}")
+            return replace(item, error=str(error))
+        return replace(item, output=replace(output, file_url=file_url))
+
+    @staticmethod
+    def _finish_archive(archive: ArchiveWriterProtocol, items: List[BatchItemOutput]) -> None:
+        """Lists what couldn't be put in the archive (remote-only items and failures), then closes it."""
+        lines = []
+        for item in items:
+            if item.error:
+                lines.append(f"{item.url}\tfailed: {item.error}")
+            elif item.output and item.output.file_url and not item.output.file_path:
+                lines.append(f"{item.url}\t{item.output.file_url}")
+        if lines:
+            archive.add_text(BATCH_LINKS_FILE_NAME, "\n".join(lines) + "\n")
+        archive.close()
\ No newline at end of file
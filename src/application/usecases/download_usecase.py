@@ -1,23 +1,50 @@
+import time
+import asyncio
+from dataclasses import replace
 from logging import Logger
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from src.application.services.download import DownloaderService
 from src.application.services import CacheManager
+from src.application.services.pipeline import Pipeline, PipelineStage
 from src.application.protocols import RemoteStorageServiceProtocol
 from src.application.protocols import TempServiceProtocol
+from src.application.protocols import MediaEncoderProtocol
+from src.application.protocols import MediaPostProcessorProtocol
+from src.application.protocols import JobJournalProtocol
+from src.application.protocols import MediaSplitterProtocol
 from src.application.services.download import DownloadRequestValidator
 from src.application.services.download import StorageDecisionStrategy
 from src.application.services.download import DownloadCacheService
 from src.application.dto.request.download_request import DownloadRequest
 from src.application.dto.output.download_output import DownloadOutput
+from src.application.models.dataclasses import DownloadJob, JournalEntry, StageMetrics
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.models import CancellationToken, GrowingFile, MediaProbe, ProgressTracker
+from src.domain.exceptions import DownloadCancelled, MediaProcessingFailed
+from src.core.constants import DEFAULT_STAGE_CONCURRENCY, DEFAULT_PIPELINE_QUEUE_SIZE, DEFAULT_QUALITY_DEADLINE
 
 
 class DownloadUsecase():
-    """Usecase for downloading files with caching and storage handling."""
+    """Usecase for downloading files with caching and storage handling.
+
+    Cache misses go through a pipeline of stages (probe, fetch, postprocess, route, split, upload, deliver),
+    each one with its own concurrency limit, so a slow upload doesn't hold a download slot.
+    """
     
     def __init__(self, downloader_service: DownloaderService,
                  cache_manager: CacheManager, storage_service: RemoteStorageServiceProtocol,
                  temp_service: TempServiceProtocol, validator: DownloadRequestValidator,
                  decision_strategy: StorageDecisionStrategy, download_cache_service: DownloadCacheService,
-                 logger: Logger) -> None:
+                 media_encoder: MediaEncoderProtocol, media_processor: MediaPostProcessorProtocol,
+                 media_splitter: MediaSplitterProtocol, journal: JobJournalProtocol, logger: Logger,
+                 stage_concurrency: Optional[Dict[str, int]] = None,
+                 queue_size: int = DEFAULT_PIPELINE_QUEUE_SIZE,
+                 quality_deadline: float | None = DEFAULT_QUALITY_DEADLINE) -> None:
+        """
+        Args:
+            quality_deadline: Seconds a request leaving the quality to us should take,
+                its cancellation deadline applies too
+        """
         self.downloader_service = downloader_service
         self.cache_manager = cache_manager
         self.storage_service = storage_service
@@ -25,22 +52,337 @@ class DownloadUsecase():
         self.validator = validator
         self.decision_strategy = decision_strategy
         self.download_cache_service = download_cache_service
+        self.media_encoder = media_encoder
+        self.media_processor = media_processor
+        self.media_splitter = media_splitter
+        self.journal = journal
         self.logger = logger
+        self.quality_deadline = quality_deadline
+
+        concurrency = {**DEFAULT_STAGE_CONCURRENCY, **(stage_concurrency or {})}
+        handlers = {
+            "probe": self._probe_stage,
+            "fetch": self._fetch_stage,
+            "postprocess": self._postprocess_stage,
+            "route": self._route_stage,
+            "split": self._split_stage,
+            "upload": self._upload_stage,
+            "deliver": self._deliver_stage,
+        }
+        self.pipeline: Pipeline[DownloadJob] = Pipeline(
+            stages=[PipelineStage(name, self._stage(name, handler), concurrency[name], queue_size)
+                    for name, handler in handlers.items()],
+            on_done=self._finish_job,
+            logger=logger,
+        )
 
         self.logger.info("DownloadUsecase initialized")
 
-    async def execute(self, request: DownloadRequest) -> DownloadOutput:
+    async def execute(self, request: DownloadRequest, cancellation: CancellationToken | None = None,
+                      context: Dict[str, Any] | None = None, job_id: str | None = None,
+                      progress: ProgressTracker | None = None) -> DownloadOutput:
+        """
+        Args:
+            request: What to download
+            cancellation: Stops the job when cancelled or when its deadline passes
+            context: Where the result goes (like the Discord channel and user), kept in the journal
+            job_id: Id of a journaled job to resume at the stage it was in, its temp folder and files are reused
+            progress: Receives the stage the job is in and the bytes downloaded so far
+
+        Raises:
+            DownloadCancelled: As soon as cancellation is cancelled or its deadline passes,
+                the job itself stops and cleans up in the background
+        """
         self._validate_request(request)
 
         cached_output = await self.download_cache_service.get_cached_output(request)
         if cached_output:
+            if job_id:
+                await self.journal.remove(job_id)
             return cached_output
 
-        async with self.temp_service.create_session() as temp_folder:
-            downloaded_file = await self.downloader_service.download(request, temp_folder)
-            decision = await self.decision_strategy.decide(request, downloaded_file)
-            cache_key = self.download_cache_service.create_cache_key(request)
-            return await self.download_cache_service.store_download(cache_key, downloaded_file, decision.destination, self.storage_service)
+        loop = asyncio.get_running_loop()
+        cancellation = cancellation or CancellationToken()
+        job = DownloadJob(request=request, result=loop.create_future(), cancellation=cancellation, context=context or {},
+                          progress=progress or ProgressTracker())
+        stage = self.pipeline.first_stage
+        if job_id:
+            job.job_id = job_id
+            stage = await self._restore(job)
+        await self._journal(job, stage)
+
+        remaining = cancellation.remaining()
+        deadline_timer = loop.call_later(remaining, cancellation.cancel, "deadline exceeded") if remaining is not None else None
+        unregister_cancel = cancellation.on_cancel(lambda reason: loop.call_soon_threadsafe(self._reject_job, job, reason))
+        try:
+            await self.pipeline.submit(job, stage)
+            return await job.result
+        except asyncio.CancelledError:
+            # nobody is waiting for the result anymore
+            cancellation.cancel("caller went away")
+            raise
+        finally:
+            unregister_cancel()
+            if deadline_timer:
+                deadline_timer.cancel()
+
+    def peek_cached(self, request: DownloadRequest) -> DownloadOutput | None:
+        """Cache lookup without any I/O, for answering hits right away. None on a miss or an invalid request,
+        execute() then gives the full answer."""
+        try:
+            self._validate_request(request)
+        except Exception:
+            return None
+        return self.download_cache_service.peek_cached_output(request)
+
+    async def pending_jobs(self) -> List[JournalEntry]:
+        """Jobs that were interrupted (by a restart or a crash) before delivering their result."""
+        return await self.journal.load()
+
+    async def discard_job(self, job_id: str) -> None:
+        """Forget an interrupted job that won't be resumed, along with its files."""
+        await self.journal.remove(job_id)
+        # reopening the session without preserving it removes the folder
+        async with self.temp_service.create_session(job_id):
+            pass
+
+    def metrics(self) -> List[StageMetrics]:
+        """Queue depth and latency of every pipeline stage."""
+        return self.pipeline.metrics()
+
+    def _stage(self, name: str, handler: Callable[[DownloadJob], Awaitable[str | None]]) -> Callable[[DownloadJob], Awaitable[str | None]]:
+        """Journal and report the stage a job enters, and skip it if the job was cancelled while it waited in the queue."""
+        async def run(job: DownloadJob) -> str | None:
+            job.cancellation.raise_if_cancelled()
+            job.progress.set_stage(name)
+            await self._journal(job, name)
+            return await handler(job)
+        return run
+
+    async def _forget(self, job: DownloadJob) -> None:
+        """Remove the entry of a finished job, a failure only leaves a stale entry behind."""
+        try:
+            await self.journal.remove(job.job_id)
+        except OSError as error:
+            self.logger.error(f"Failed to remove job {job.job_id} from the journal: {error}")
+
+    async def _journal(self, job: DownloadJob, stage: str) -> None:
+        await self.journal.save(JournalEntry(
+            job_id=job.job_id,
+            request=job.request,
+            stage=stage,
+            context=job.context,
+            temp_path=job.temp_folder,
+            probe=job.probe,
+            stream=job.stream,
+            downloaded_file=job.downloaded_file,
+            destination=job.destination,
+            file_url=job.file_url,
+            parts=list(job.parts),
+        ))
+
+    async def _restore(self, job: DownloadJob) -> str:
+        """Bring back what the stages before the journaled one produced. Returns the stage to resume at.
+
+        A job whose files are gone is fetched again, the fetch still continues the partial files left in its folder.
+        """
+        entry = next((entry for entry in await self.journal.load() if entry.job_id == job.job_id), None)
+        if entry is None or entry.stage == self.pipeline.first_stage:
+            return self.pipeline.first_stage
+
+        job.probe = entry.probe
+        job.stream = entry.stream
+        if entry.stage == "fetch":
+            return "fetch"
+        job.downloaded_file = entry.downloaded_file
+        job.destination = entry.destination
+        job.file_url = entry.file_url
+        job.parts = list(entry.parts)
+        if not self._has_files(job, entry.stage):
+            self.logger.warning(f"Files of job {job.job_id} at {entry.stage} are gone, fetching {job.request.url} again")
+            job.downloaded_file, job.destination, job.file_url, job.parts = None, None, None, []
+            return "fetch"
+
+        # the stages after the fetch work in the folder the fetch opened
+        job.temp_folder = await job.resources.enter_async_context(self.temp_service.create_session(job.job_id))
+        self.logger.info(f"Resuming job {job.job_id} of {job.request.url} at {entry.stage}")
+        return entry.stage
+
+    @staticmethod
+    def _has_files(job: DownloadJob, stage: str) -> bool:
+        """Whether what the stage works on is still on disk."""
+        downloaded_file = job.downloaded_file
+        if downloaded_file is None:
+            return False
+        if stage == "deliver" and job.file_url:
+            return True
+        if stage == "deliver" and job.parts:
+            return all(part.exists() for part in job.parts)
+        if stage == "postprocess" and downloaded_file.pending_processing:
+            return all(path.exists() for path in downloaded_file.pending_processing.inputs)
+        return downloaded_file.file_path.exists()
+
+    def _reject_job(self, job: DownloadJob, reason: str) -> None:
+        if not job.result.done():
+            job.result.set_exception(DownloadCancelled(f"Download cancelled: {reason}"))
+
+    async def _probe_stage(self, job: DownloadJob) -> str:
+        if not job.request.fit_to_limit:
+            job.probe = await self.downloader_service.probe(job.request, job.cancellation)
+            job.stream = self._should_stream(job.request, job.probe)
+        return "fetch"
+
+    async def _fetch_stage(self, job: DownloadJob) -> str:
+        job.temp_folder = await job.resources.enter_async_context(self.temp_service.create_session(job.job_id))
+        await self._journal(job, "fetch")
+        if job.stream:
+            await self._stream_to_remote(job)
+            return "deliver"
+
+        job.downloaded_file = await self.downloader_service.download(job.request, job.temp_folder,
+                                                                     cancellation=job.cancellation, progress=job.progress,
+                                                                     deadline=self._get_fetch_deadline(job))
+        if job.downloaded_file.pending_processing or self._needs_fit(job):
+            return "postprocess"
+        return "route"
+
+    async def _postprocess_stage(self, job: DownloadJob) -> str:
+        if job.downloaded_file.pending_processing:
+            job.downloaded_file = await self.media_processor.process(job.downloaded_file, job.cancellation)
+
+        if self._needs_fit(job):
+            request = job.request
+            self.logger.info(f"No format of {request.url} fits {request.file_size_limit} bytes, re-encoding to size")
+            job.downloaded_file = await self.media_encoder.encode_to_size(job.downloaded_file, request.file_size_limit,
+                                                                          job.temp_folder, job.cancellation)
+        return "route"
+
+    async def _route_stage(self, job: DownloadJob) -> str:
+        if job.downloaded_file.processing_mode:
+            self.logger.info(f"{job.request.url} was processed as {job.downloaded_file.processing_mode.value}")
+        decision = await self.decision_strategy.decide(job.request, job.downloaded_file)
+        job.destination = decision.destination
+        if job.destination == DownloadDestination.SPLIT:
+            return "split"
+        return "upload" if job.destination == DownloadDestination.REMOTE else "deliver"
+
+    async def _split_stage(self, job: DownloadJob) -> str:
+        try:
+            job.parts = await self.media_splitter.split(job.downloaded_file, job.request.file_size_limit,
+                                                        job.temp_folder, job.cancellation)
+        except MediaProcessingFailed as error:
+            self.logger.warning(f"Could not split {job.request.url}, uploading it instead: {error}")
+            job.destination = DownloadDestination.REMOTE
+            return "upload"
+        return "deliver"
+
+    async def _upload_stage(self, job: DownloadJob) -> str:
+        job.file_url = await self.storage_service.upload(job.downloaded_file.file_path, upload_id=job.job_id)
+        return "deliver"
+
+    async def _deliver_stage(self, job: DownloadJob) -> None:
+        # links suit any limit, attachments only the limit they were made for
+        cache_key = self.download_cache_service.create_cache_key(job.request, attached=not job.file_url,
+                                                                 quality=job.downloaded_file.quality)
+        # downloaded files are named after the media title
+        title = job.probe.title if job.probe and job.probe.title else job.downloaded_file.file_path.stem
+        if job.parts:
+            output = await self.download_cache_service.store_parts(cache_key, job.parts, job.downloaded_file.file_size, title)
+        elif job.file_url:
+            output = await self.download_cache_service.store_uploaded(cache_key, job.file_url, job.downloaded_file.file_size, title)
+        else:
+            output = await self.download_cache_service.store_download(
+                cache_key, job.downloaded_file, DownloadDestination.LOCAL, self.storage_service, title,
+            )
+        bytes_saved = self._get_bytes_saved(job)
+        if bytes_saved:
+            self.logger.info(f"Clip {job.request.time_range} of {job.request.url} saved ~{bytes_saved} bytes")
+            output = replace(output, bytes_saved=bytes_saved)
+        if not job.result.done():
+            job.result.set_result(output)
+
+    async def _finish_job(self, job: DownloadJob, error: Optional[BaseException]) -> None:
+        """Release the job's temp folder and hand the error, if any, to the waiting caller.
+
+        A job interrupted on shutdown keeps its folder and journal entry, so it resumes on the next start.
+        """
+        interrupted = isinstance(error, DownloadCancelled) and job.cancellation.resumable
+        if isinstance(error, DownloadCancelled):
+            self.logger.info(f"Job for {job.request.url} stopped: {error}")
+        if interrupted and job.temp_folder:
+            self.temp_service.preserve(job.temp_folder)
+        try:
+            if not interrupted:
+                await self._forget(job)
+            await job.resources.aclose()
+        finally:
+            if error is not None and not job.result.done():
+                job.result.set_exception(error)
+            self.logger.debug("Pipeline stages: " + ", ".join(
+                f"{m.name}(queued={m.queue_depth}, active={m.active}/{m.concurrency}, avg={m.average_latency:.2f}s)"
+                for m in self.metrics()
+            ))
+
+    def _get_bytes_saved(self, job: DownloadJob) -> int | None:
+        """How much less a clip downloaded than the whole media would have, estimated from the probe."""
+        if job.request.time_range is None or job.probe is None or job.probe.estimated_size is None:
+            return None
+        return max(job.probe.estimated_size - job.downloaded_file.file_size, 0)
+
+    def _get_fetch_deadline(self, job: DownloadJob) -> float | None:
+        """Seconds left for the fetch and its post-processing, so the job is still delivered in time.
+
+        The nearest of the configured deadline and the job's own, minus what the stages after the
+        fetch are expected to take with the jobs already queued in front of them.
+        """
+        deadlines = [deadline for deadline in (
+            self.quality_deadline - (time.monotonic() - job.started_at) if self.quality_deadline is not None else None,
+            job.cancellation.remaining(),
+        ) if deadline is not None]
+        if not deadlines:
+            return None
+        # counted even for results kept locally, a late link is worse than a lower quality
+        downstream = sum(
+            metrics.average_latency * (1 + metrics.queue_depth / metrics.concurrency)
+            for metrics in self.metrics() if metrics.name in ("upload", "deliver")
+        )
+        return max(min(deadlines) - downstream, 0.0)
+
+    def _needs_fit(self, job: DownloadJob) -> bool:
+        return job.request.fit_to_limit and job.downloaded_file.file_size > job.request.file_size_limit
+
+    def _should_stream(self, request: DownloadRequest, probe: MediaProbe) -> bool:
+        """A file can be uploaded while downloading when it's going remote anyway and nothing rewrites it afterwards."""
+        return (
+            request.time_range is None
+            and not self.decision_strategy.allows_split(request, probe.estimated_size or 0)
+            and not probe.requires_postprocessing
+            and probe.estimated_size is not None
+            and probe.estimated_size > request.file_size_limit
+        )
+
+    async def _stream_to_remote(self, job: DownloadJob) -> None:
+        """Downloads and uploads at the same time, the upload follows the file as it's written."""
+        self.logger.info(f"Streaming {job.request.url} to remote storage while downloading")
+        growing_file = GrowingFile()
+        download_task = asyncio.create_task(
+            self.downloader_service.download(job.request, job.temp_folder, growing_file=growing_file,
+                                             cancellation=job.cancellation, progress=job.progress,
+                                             deadline=self._get_fetch_deadline(job))
+        )
+
+        try:
+            job.file_url = await self.storage_service.upload_growing(growing_file, job.cancellation)
+        except DownloadCancelled:
+            await asyncio.gather(download_task, return_exceptions=True)
+            raise
+        except Exception as error:
+            # a broken download is raised from the task below, anything else falls back to a plain upload
+            downloaded_file = await download_task
+            self.logger.warning(f"Streamed upload failed, uploading the finished file instead: {error}")
+            job.file_url = await self.storage_service.upload(downloaded_file.file_path, upload_id=job.job_id)
+
+        job.downloaded_file = await download_task
             
     def _validate_request(self, request: DownloadRequest):
         self.validator.validate(request)
\ No newline at end of file
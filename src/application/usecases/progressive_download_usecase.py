@@ -0,0 +1,79 @@
+import asyncio
+from logging import Logger
+from dataclasses import replace
+from contextlib import suppress
+from typing import Any, AsyncIterator, Dict
+from src.application.protocols import DownloadUseCaseProtocol
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.domain.enum import Quality
+from src.domain.models import CancellationToken, ProgressTracker
+from src.domain.exceptions import DownloadCancelled
+from src.core.constants import DEFAULT_PREVIEW_QUALITY
+
+QUALITY_ORDER = list(Quality)
+
+class ProgressiveDownloadUsecase():
+    """Usecase handing out a small preview first while the requested quality downloads.
+
+    The preview and the requested quality run side by side as two regular downloads, so both end up cached.
+    The preview is only handed out when it's ready before the full result. Audio, requests already at the
+    preview quality and cache hits are downloaded once.
+    """
+
+    def __init__(self, download_usecase: DownloadUseCaseProtocol, logger: Logger,
+                 preview_quality: Quality = Quality(DEFAULT_PREVIEW_QUALITY)) -> None:
+        self.download_usecase = download_usecase
+        self.logger = logger
+        self.preview_quality = preview_quality
+
+    async def execute(self, request: DownloadRequest, cancellation: CancellationToken | None = None,
+                      context: Dict[str, Any] | None = None,
+                      progress: ProgressTracker | None = None) -> AsyncIterator[DownloadOutput]:
+        """
+        Yields the preview, marked with preview_quality, if it came first, then the requested quality.
+
+        Args:
+            request: What to download
+            cancellation: Stops both downloads
+            context: Where the results go, passed to both downloads
+            progress: Receives the progress of the requested quality
+
+        Raises:
+            DownloadCancelled: If the downloads were cancelled
+        """
+        cancellation = cancellation or CancellationToken()
+        preview_request = self._preview_request(request)
+        if preview_request is None or self.download_usecase.peek_cached(request):
+            yield await self.download_usecase.execute(request, cancellation, context, progress=progress)
+            return
+
+        # the preview is dropped once the full result is in, without cancelling the full download
+        preview_cancellation = cancellation.child()
+        full_task = asyncio.create_task(self.download_usecase.execute(request, cancellation, context, progress=progress))
+        # a preview is no use after a restart, tagged so it isn't resumed
+        preview_context = {**(context or {}), "source": "preview"}
+        preview_task = asyncio.create_task(self.download_usecase.execute(preview_request, preview_cancellation, preview_context))
+        try:
+            await asyncio.wait((full_task, preview_task), return_when=asyncio.FIRST_COMPLETED)
+            if not full_task.done():
+                if preview_task.exception() is None:
+                    yield replace(preview_task.result(), preview_quality=self.preview_quality)
+                else:
+                    self.logger.warning(f"Preview of {request.url} failed: {preview_task.exception()}")
+            yield await full_task
+        finally:
+            preview_cancellation.cancel("preview no longer needed")
+            for task in (full_task, preview_task):
+                task.cancel()
+            with suppress(asyncio.CancelledError, DownloadCancelled):
+                await asyncio.gather(full_task, preview_task, return_exceptions=True)
+
+    def _preview_request(self, request: DownloadRequest) -> DownloadRequest | None:
+        """The same request at the preview quality, None when it wouldn't be any smaller."""
+        if request.format is not None and request.format.is_audio():
+            return None
+        if QUALITY_ORDER.index(request.quality) <= QUALITY_ORDER.index(self.preview_quality):
+            return None
+        return replace(request, quality=self.preview_quality, fit_to_limit=False, allow_split=False,
+                       auto_quality=False)
\ No newline at end of file
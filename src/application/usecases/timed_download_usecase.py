@@ -1,23 +1,45 @@
 import time
 import logging
 from dataclasses import replace
+from typing import Any, Dict, List
 from src.application.dto.output.download_output import DownloadOutput
 from src.application.dto.request.download_request import DownloadRequest
 from src.application.protocols.download_usecase_protocol import DownloadUseCaseProtocol
+from src.application.models.dataclasses import JournalEntry
+from src.domain.models import CancellationToken, ProgressTracker
 
 class TimedDownloadUseCase():
     def __init__(self, usecase: DownloadUseCaseProtocol, logger: logging.Logger):
         self.usecase = usecase
         self.logger = logger
 
-    async def execute(self, request: DownloadRequest) -> DownloadOutput:
+    async def execute(self, request: DownloadRequest, cancellation: CancellationToken | None = None,
+                      context: Dict[str, Any] | None = None, job_id: str | None = None,
+                      progress: ProgressTracker | None = None) -> DownloadOutput:
         start_time = time.perf_counter()
         
-        result = await self.usecase.execute(request)
+        result = await self.usecase.execute(request, cancellation, context, job_id, progress)
         elapsed_time = time.perf_counter() - start_time
 
         self.logger.info(f"Download process for {request.url} finished in {elapsed_time:.4f}s")
 
-        result_with_time = replace(result, elapsed=elapsed_time)
+        time_saved = None
+        if result.bytes_saved and result.file_size:
+            # assumes the rest of the media would have come at the same speed
+            time_saved = elapsed_time * result.bytes_saved / result.file_size
+        result_with_time = replace(result, elapsed=elapsed_time, time_saved=time_saved)
 
-        return result_with_time
\ No newline at end of file
+        return result_with_time
+
+    def peek_cached(self, request: DownloadRequest) -> DownloadOutput | None:
+        start_time = time.perf_counter()
+        result = self.usecase.peek_cached(request)
+        if result is None:
+            return None
+        return replace(result, elapsed=time.perf_counter() - start_time)
+
+    async def pending_jobs(self) -> List[JournalEntry]:
+        return await self.usecase.pending_jobs()
+
+    async def discard_job(self, job_id: str) -> None:
+        await self.usecase.discard_job(job_id)
\ No newline at end of file
@@ -1,13 +1,24 @@
+import argparse
 import logging
+from pathlib import Path
 from typing import cast, Iterable, Any
 from discord.ext.commands import Bot, AutoShardedBot
 from src.bootstrap.models.application import Application
+from src.bootstrap.models.ingest_application import IngestApplication
 from src.bootstrap.modules.compositors import ArgParserCompositor, DiscordExtensionCompositor, LoggingConfigurator
 from src.bootstrap.modules.builders import LoggingBuilder, SettingsBuilder, ExtensionServicesBuilder, DriveBuilder
 from src.infrastructure.services.config.models import ApplicationSettings
 from src.infrastructure.services.discord import BaseBot
 from src.infrastructure.services.discord.factories.bot_factory import BotFactory
 from src.infrastructure.services.drive.google_drive_login_service import GoogleDriveLoginService
+from src.infrastructure.services.ytdlp import YtdlpCacheWarmer
+from src.infrastructure.services.aria2 import Aria2RpcDaemon
+from src.application.services import TaskManager
+from src.application.usecases.timed_download_usecase import TimedDownloadUseCase
+from src.domain.models.settings import DownloadSettings
+from src.domain.enum import Formats, Quality
+from src.presentation.cli import IngestCommand
+from src.core.constants import JOURNAL_FILE, INGEST_JOURNAL_FILE
 
 class ApplicationBuilder:
     """Builds the application and all its runtime dependencies."""
@@ -48,14 +59,15 @@ class ApplicationBuilder:
         return drive_login_service
 
     def _build_extension_services(
-        self, settings: ApplicationSettings, drive_login_service: GoogleDriveLoginService
+        self, settings: ApplicationSettings, drive_login_service: GoogleDriveLoginService,
+        journal_file: Path = JOURNAL_FILE,
     ) -> Iterable[Any]:
         """Builds services for extensions."""
         if not self.logger:
             raise RuntimeError("Logger must be configured before building extension services.")
 
         self.logger.info("Building extension services")
-        return ExtensionServicesBuilder(settings=settings, drive_login=drive_login_service).build()
+        return ExtensionServicesBuilder(settings=settings, drive_login=drive_login_service, journal_file=journal_file).build()
 
     async def _build_discord(
         self, settings: ApplicationSettings, extension_services: Iterable[Any]
@@ -92,7 +104,7 @@ class ApplicationBuilder:
 
         settings = self._build_settings()
         drive_login_service = await self._build_google_drive(settings)
-        extension_services = self._build_extension_services(settings, drive_login_service)
+        extension_services = list(self._build_extension_services(settings, drive_login_service))
         bot = await self._build_discord(settings, extension_services)
 
         if bot is None or settings is None or drive_login_service is None:
@@ -104,4 +116,44 @@ class ApplicationBuilder:
             bot=cast(AutoShardedBot, bot),
             drive=drive_login_service,
             settings=settings,
+            task_manager=next((service for service in extension_services if isinstance(service, TaskManager)), None),
+            cache_warmer=next((service for service in extension_services if isinstance(service, YtdlpCacheWarmer)), None),
+            aria2_daemon=next((service for service in extension_services if isinstance(service, Aria2RpcDaemon)), None),
         )
+
+    async def build_ingest(self, cli_args: argparse.Namespace) -> IngestApplication:
+        """Builds the headless runtime for `main.py ingest`, with the same services as the bot."""
+        self._configure_logging()
+
+        if not self.logger:
+            raise RuntimeError("Logging configuration failed.")
+
+        settings = self._build_settings()
+        drive_login_service = await self._build_google_drive(settings)
+        # ingest jobs are journaled apart, the bot would resume them with nowhere to deliver them
+        extension_services = list(self._build_extension_services(settings, drive_login_service, INGEST_JOURNAL_FILE))
+
+        usecase = next((service for service in extension_services if isinstance(service, TimedDownloadUseCase)), None)
+        download_settings = next((service for service in extension_services if isinstance(service, DownloadSettings)), None)
+        task_manager = next((service for service in extension_services if isinstance(service, TaskManager)), None)
+        if usecase is None or download_settings is None or task_manager is None:
+            raise RuntimeError("Ingest not fully built")
+
+        self.logger.info("Assembling ingest application")
+
+        command = IngestCommand(
+            download_usecase=usecase,
+            download_settings=download_settings,
+            task_manager=task_manager,
+            logger=self.logger,
+            parallelism=cli_args.parallel,
+            default_format=Formats(cli_args.format) if cli_args.format else None,
+            default_quality=Quality(cli_args.quality) if cli_args.quality else Quality.DEFAULT,
+        )
+        return IngestApplication(
+            command=command,
+            drive=drive_login_service,
+            task_manager=task_manager,
+            input_path=cli_args.input,
+            report_path=cli_args.report,
+        )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from .builder import Builder
 from .application import Application
 from .compositor import Compositor
+from .ingest_application import IngestApplication
 
-__all__ = ["Builder", "Compositor", "Application"]
\ No newline at end of file
+__all__ = ["Builder", "Compositor", "Application", "IngestApplication"]
\ No newline at end of file
@@ -1,18 +1,28 @@
+import asyncio
 import logging
+from typing import Any
 from discord.ext.commands import AutoShardedBot
 from src.core.constants import DEFAULT_DISCORD_RECONNECT
 from src.infrastructure.services.config.models.application_settings import ApplicationSettings
 from src.infrastructure.services.drive.google_drive_login_service import GoogleDriveLoginService
+from src.infrastructure.services.ytdlp import YtdlpCacheWarmer
+from src.infrastructure.services.aria2 import Aria2RpcDaemon
+from src.application.services import TaskManager
 from src.utils import AsciiArt
 
 class Application():
     """Represents the entire application runtime"""
 
     def __init__(self, bot: AutoShardedBot, drive: GoogleDriveLoginService,
-                 settings: ApplicationSettings) -> None:
+                 settings: ApplicationSettings, task_manager: TaskManager | None = None,
+                 cache_warmer: YtdlpCacheWarmer | None = None, aria2_daemon: Aria2RpcDaemon | None = None) -> None:
         self.bot = bot
         self.drive = drive
         self.settings = settings
+        self.task_manager = task_manager
+        self.cache_warmer = cache_warmer
+        self.aria2_daemon = aria2_daemon
+        self._warm_up_task: asyncio.Task[Any] | None = None
         self.logger = logging.getLogger(self.__class__.__name__)
         
     async def run(self) -> None:
@@ -21,6 +31,9 @@ class Application():
             raise RuntimeError("Application has not been built. Call build() before running.")
         
         AsciiArt.print_ascii_art(self.logger)
+        if self.cache_warmer:
+            # runs alongside the login, the first extractions find the solver scripts and player already cached
+            self._warm_up_task = asyncio.create_task(self._warm_up(self.cache_warmer))
         self.logger.info("Starting Discord bot...")
         try:
             if not self.settings.bot_settings:
@@ -40,10 +53,23 @@ class Application():
             exc_info=error,
         )
 
+    async def _warm_up(self, cache_warmer: YtdlpCacheWarmer) -> None:
+        try:
+            await cache_warmer.warm_up()
+        except Exception as error:
+            self.logger.warning(f"yt-dlp cache warm-up failed: {error}", exc_info=error)
+
     async def shutdown(self) -> None:
         self.logger.info("Starting shutdown process")
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+        if self.task_manager:
+            self.task_manager.cancel_all("the bot is shutting down", resumable=True)
         if self.bot:
             self.logger.info("Closing discord bot connection")
             await self.bot.close()
         if self.drive:
-            self.drive.close_connection()
\ No newline at end of file
+            self.drive.close_connection()
+        if self.aria2_daemon:
+            # after the bot, the interrupted downloads keep their partial files and .aria2 state to resume
+            await asyncio.to_thread(self.aria2_daemon.close)
\ No newline at end of file
@@ -0,0 +1,45 @@
+import sys
+import asyncio
+import logging
+from typing import AsyncIterator, TextIO
+from src.infrastructure.services.drive.google_drive_login_service import GoogleDriveLoginService
+from src.application.services import TaskManager
+from src.presentation.cli import IngestCommand
+from src.core.constants import INGEST_STDIN
+
+class IngestApplication():
+    """Headless runtime: feeds lines of a file (or stdin) to the ingest command, no Discord involved."""
+
+    def __init__(self, command: IngestCommand, drive: GoogleDriveLoginService, task_manager: TaskManager,
+                 input_path: str, report_path: str) -> None:
+        self.command = command
+        self.drive = drive
+        self.task_manager = task_manager
+        self.input_path = input_path
+        self.report_path = report_path
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def run(self) -> None:
+        """Runs the application"""
+        source = sys.stdin if self.input_path == INGEST_STDIN else open(self.input_path, encoding="utf-8")
+        report = sys.stdout if self.report_path == INGEST_STDIN else open(self.report_path, "a", encoding="utf-8")
+        try:
+            self.logger.info(f"Ingesting from {self.input_path}, report in {self.report_path}")
+            await self.command.run(self._read_lines(source), report)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if report is not sys.stdout:
+                report.close()
+
+    async def shutdown(self) -> None:
+        # not resumable, nothing picks ingest jobs up again
+        self.task_manager.cancel_all("ingest is shutting down")
+        if self.drive:
+            self.drive.close_connection()
+
+    @staticmethod
+    async def _read_lines(source: TextIO) -> AsyncIterator[str]:
+        # a blocking readline off the loop, so a slow pipe doesn't stall running downloads
+        while line := await asyncio.to_thread(source.readline):
+            yield line
\ No newline at end of file
@@ -1,4 +1,6 @@
+import shutil
 import logging
+from pathlib import Path
 from typing import Iterable, Any
 from src.bootstrap.models import Builder
 
@@ -6,23 +8,33 @@ from src.infrastructure.services.config.models import ApplicationSettings
 
 from src.application.usecases.download_usecase import DownloadUsecase
 from src.application.usecases.timed_download_usecase import TimedDownloadUseCase
-from src.application.services import CacheManager
-from src.application.services.download import DownloaderService, DownloadRequestValidator, DownloadCacheService, SizeBasedStorageDecisionStrategy
+from src.application.usecases.batch_download_usecase import BatchDownloadUsecase
+from src.application.usecases.progressive_download_usecase import ProgressiveDownloadUsecase
+from src.application.services import CacheManager, CacheSearchIndex, TaskManager
+from src.application.services.download import DownloaderService, DownloadRequestValidator, DownloadCacheService, SizeBasedStorageDecisionStrategy, SpeculativeProbeService
 from src.domain.models.settings import DownloadSettings
-from src.infrastructure.services.ytdlp import YtdlpDownloadService, YtdlpFormatMapper
+from src.infrastructure.services.ytdlp import YtdlpDownloadService, YtdlpFormatMapper, YtdlpSizeFitter, YtdlpProfileSelector, YtdlpPlaylistExpander, YtdlpCacheWarmer, YtdlpUrlMatcher
+from src.infrastructure.services.archive import ZipArchiveService
+from src.infrastructure.services.ffmpeg import FFmpegProcessPool, FFmpegSizeEncoder, FFmpegPostProcessor, FFmpegSegmentSplitter
+from src.infrastructure.services.network import BandwidthBudget
+from src.infrastructure.services.aria2 import Aria2RpcDaemon
 from src.infrastructure.services.url_validator import UrlValidator
 from src.infrastructure.services.temp_service import TempService
 from src.infrastructure.services.cache import JSONCacheStorage
+from src.infrastructure.services.journal import JSONJobJournal
 from src.infrastructure.services.drive.google_drive_login_service import GoogleDriveLoginService
 from src.infrastructure.services.drive.google_drive_uploader_service import GoogleDriveUploaderService
+from src.core.constants import ARIA2C_BINARY, JOURNAL_FILE
 
 class ExtensionServicesBuilder(Builder):
     """Builds services related to extensions that gonna be used by Discord Module"""
 
-    def __init__(self, settings: ApplicationSettings, drive_login: GoogleDriveLoginService) -> None:
+    def __init__(self, settings: ApplicationSettings, drive_login: GoogleDriveLoginService,
+                 journal_file: Path = JOURNAL_FILE) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.settings = settings
         self.drive_login = drive_login
+        self.journal_file = journal_file
 
     def build(self) -> Iterable[Any]:
         """Builds and returns services for extensions."""
@@ -31,9 +43,18 @@ class ExtensionServicesBuilder(Builder):
         if self.settings.download_settings is None:
             raise RuntimeError("Download settings must be configured to build services.")
         
-        cache_manager = CacheManager(storage=JSONCacheStorage(logger=self.logger))
+        cache_manager = CacheManager(storage=JSONCacheStorage(logger=self.logger), search_index=CacheSearchIndex())
+        # started on the first download that uses it, without aria2c the native downloader is used anyway
+        aria2_daemon = Aria2RpcDaemon() if shutil.which(ARIA2C_BINARY) else None
         downloader_service = DownloaderService(
-            download_service=YtdlpDownloadService(ytdlp_format_mapper=YtdlpFormatMapper()),
+            download_service=YtdlpDownloadService(
+                ytdlp_format_mapper=YtdlpFormatMapper(),
+                size_fitter=YtdlpSizeFitter(),
+                defer_postprocessing=True,
+                bandwidth_budget=BandwidthBudget(),
+                profile_selector=YtdlpProfileSelector(),
+                aria2_daemon=aria2_daemon,
+            ),
             logger=self.logger
         )
         validator = DownloadRequestValidator(
@@ -45,8 +66,10 @@ class ExtensionServicesBuilder(Builder):
         storage_service = GoogleDriveUploaderService(
             login_service=self.drive_login,
             drive_folder_id=self.settings.drive_settings.folder_id,
+            chunk_size=self.settings.drive_settings.upload_chunk_size,
         )
         temp_service = TempService()
+        ffmpeg_pool = FFmpegProcessPool()
 
         usecase = DownloadUsecase(
             downloader_service=downloader_service,
@@ -56,17 +79,55 @@ class ExtensionServicesBuilder(Builder):
             validator=validator,
             decision_strategy=decision_strategy,
             download_cache_service=download_cache_service,
-            logger=self.logger
+            media_encoder=FFmpegSizeEncoder(process_pool=ffmpeg_pool),
+            media_processor=FFmpegPostProcessor(process_pool=ffmpeg_pool),
+            media_splitter=FFmpegSegmentSplitter(process_pool=ffmpeg_pool),
+            journal=JSONJobJournal(journal_file=self.journal_file),
+            logger=self.logger,
+            quality_deadline=self.settings.download_settings.quality_deadline,
         )
 
         timed_usecase = TimedDownloadUseCase(usecase=usecase, logger=self.logger)
+        progressive_usecase = ProgressiveDownloadUsecase(download_usecase=timed_usecase, logger=self.logger)
+        batch_usecase = BatchDownloadUsecase(
+            download_usecase=usecase,
+            playlist_expander=YtdlpPlaylistExpander(),
+            storage_service=storage_service,
+            temp_service=temp_service,
+            archive_service=ZipArchiveService(),
+            logger=self.logger,
+        )
+
+        task_manager = TaskManager()
+        download_settings = self.settings.download_settings
+        # the listener only submits links when speculative_probe is enabled
+        speculative_probe = SpeculativeProbeService(
+            downloader_service=downloader_service,
+            validator=validator,
+            url_matcher=YtdlpUrlMatcher(),
+            task_manager=task_manager,
+            logger=self.logger,
+            download_usecase=usecase if download_settings.prefetch_audio else None,
+        )
 
         extension_services: tuple[Any, ...] = (
             timed_usecase,
+            progressive_usecase,
+            batch_usecase,
             DownloadSettings(
-                file_size_limit=self.settings.download_settings.file_size_limit,
-                blacklist_sites=self.settings.download_settings.blacklist_sites,
+                file_size_limit=download_settings.file_size_limit,
+                blacklist_sites=download_settings.blacklist_sites,
+                speculative_probe=download_settings.speculative_probe,
+                prefetch_audio=download_settings.prefetch_audio,
+                quality_deadline=download_settings.quality_deadline,
+                warmup_url=download_settings.warmup_url,
+                warmup_offline=download_settings.warmup_offline,
             ),
+            task_manager,
+            speculative_probe,
+            cache_manager,
+            YtdlpCacheWarmer(warmup_url=download_settings.warmup_url, offline=download_settings.warmup_offline),
+            *((aria2_daemon,) if aria2_daemon else ()),
         )
 
         self.logger.info("Extension services built successfully")
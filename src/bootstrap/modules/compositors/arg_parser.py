@@ -1,7 +1,14 @@
 import argparse
 from src.bootstrap.models import Compositor
+from src.domain.enum import Formats, Quality
 
-from src.core.constants import DEFAULT_DEBUG_FLAG
+from src.core.constants import (
+    DEFAULT_DEBUG_FLAG,
+    INGEST_COMMAND,
+    INGEST_STDIN,
+    DEFAULT_INGEST_PARALLELISM,
+    DEFAULT_INGEST_REPORT,
+)
 
 class ArgParserCompositor(Compositor):
     """Parse all CLI arguments"""
@@ -17,6 +24,45 @@ class ArgParserCompositor(Compositor):
             help="Enable debug logging"
         )
 
+        subparsers = self.parser.add_subparsers(dest="command")
+        ingest = subparsers.add_parser(
+            INGEST_COMMAND,
+            help="Run downloads from a file or stdin without Discord and write a JSONL report",
+        )
+        ingest.add_argument(
+            *DEFAULT_DEBUG_FLAG,
+            action="store_true",
+            default=argparse.SUPPRESS,
+            help="Enable debug logging"
+        )
+        ingest.add_argument(
+            "input",
+            nargs="?",
+            default=INGEST_STDIN,
+            help="File with one 'URL [format] [quality]' per line, '-' for stdin"
+        )
+        ingest.add_argument(
+            "-j", "--parallel",
+            type=int,
+            default=DEFAULT_INGEST_PARALLELISM,
+            help="How many downloads run at once"
+        )
+        ingest.add_argument(
+            "-o", "--report",
+            default=str(DEFAULT_INGEST_REPORT),
+            help="Where the JSONL report is written, '-' for stdout"
+        )
+        ingest.add_argument(
+            "--format",
+            choices=[format.value for format in Formats],
+            help="Format of the lines that don't give one"
+        )
+        ingest.add_argument(
+            "--quality",
+            choices=[quality.value for quality in Quality],
+            help="Quality of the lines that don't give one"
+        )
+
     def compose(self) -> argparse.Namespace:
         """Parse cli"""
-        return self.parser.parse_args()
+        return self.parser.parse_args()
\ No newline at end of file
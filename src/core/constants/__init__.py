@@ -1,32 +1,117 @@
 """This module defines all default costants.. normaly used as fallback values."""
 
-from .cache_constants import CACHE_DIR, CACHE_INDEX_FILE
-from .cli_constants import DEFAULT_DEBUG_FLAG
+from .aria2_constants import ARIA2C_BINARY, DEFAULT_ARIA2_RPC_HOST, DEFAULT_ARIA2_MAX_DOWNLOADS, DEFAULT_ARIA2_START_TIMEOUT, DEFAULT_ARIA2_RPC_TIMEOUT, DEFAULT_ARIA2_POLL_INTERVAL, DEFAULT_ARIA2_PRIORITY_SIZE
+from .batch_constants import DEFAULT_BATCH_CONCURRENCY, DEFAULT_BATCH_MAX_ITEMS, BATCH_ARCHIVE_NAME, BATCH_LINKS_FILE_NAME
+from .cache_constants import CACHE_DIR, CACHE_INDEX_FILE, DEFAULT_SEARCH_HALF_LIFE, DEFAULT_SEARCH_RESULTS
+from .cli_constants import DEFAULT_DEBUG_FLAG, INGEST_COMMAND, INGEST_STDIN, DEFAULT_INGEST_PARALLELISM, DEFAULT_INGEST_REPORT
 from .config_loaders_constants import DEFAULT_ENV_CONFIG_PATH, DEFAULT_LOADERS_PATH, DEFAULT_YAML_CONFIG_PATH, YAML_FILE_ENCODING, DEFAULT_MAPPERS_PATH
-from .conventional_constants import UNKNOWN_FILE_SIZE, DEFAULT_STRING_DIVISOR, DEFAULT_DOWNLOAD_BLACKLIST_SITES
-from .discord_constants import DEFAULT_COMMANDS_PATH, DEFAULT_DISCORD_RECONNECT
-from .drive_constants import DRIVE_BASE_FILE_UPLOAD_URL, DRIVE_MAX_RETRY_COUNT
+from .conventional_constants import UNKNOWN_FILE_SIZE, DEFAULT_STRING_DIVISOR, DEFAULT_KEY_VALUE_DIVISOR, DEFAULT_DOWNLOAD_BLACKLIST_SITES
+from .discord_constants import DEFAULT_COMMANDS_PATH, DEFAULT_DISCORD_RECONNECT, DEFAULT_INTERACTION_DEADLINE, DEFAULT_MAX_SPLIT_PARTS, DEFAULT_INSTANT_REPLY_MAX_UPLOAD, DEFAULT_PROGRESS_EDIT_INTERVAL
+from .drive_constants import DRIVE_BASE_FILE_UPLOAD_URL, DRIVE_MAX_RETRY_COUNT, DRIVE_STREAM_CHUNK_SIZE, DRIVE_STREAM_POLL_INTERVAL, DRIVE_CHUNK_GRANULARITY, DRIVE_UPLOAD_CHUNK_SIZE, DRIVE_UPLOAD_SESSIONS_FILE, DRIVE_UPLOAD_SESSION_TTL
+from .ffmpeg_constants import FFMPEG_BINARY, FFPROBE_BINARY, DEFAULT_FIT_SIZE_MARGIN, DEFAULT_FIT_AUDIO_BITRATE, DEFAULT_FIT_MIN_VIDEO_BITRATE, DEFAULT_FFMPEG_POOL_SIZE, DEFAULT_FFMPEG_THREADS, DEFAULT_FFMPEG_NICENESS, DEFAULT_FFMPEG_IONICE_CLASS, DEFAULT_FFMPEG_IONICE_LEVEL, DEFAULT_SPLIT_SIZE_MARGIN, DEFAULT_SPLIT_ATTEMPTS
+from .journal_constants import JOURNAL_DIR, JOURNAL_FILE, INGEST_JOURNAL_FILE
+from .network_constants import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_JOB_CONNECTIONS, DEFAULT_MAX_DOWNLOAD_RATE, DEFAULT_ARIA2C_MIN_SPLIT_SIZE
+from .pipeline_constants import DEFAULT_PIPELINE_QUEUE_SIZE, DEFAULT_STAGE_CONCURRENCY, DEFAULT_QUALITY_DEADLINE
+from .preview_constants import DEFAULT_PREVIEW_QUALITY
+from .speculative_constants import DEFAULT_SPECULATIVE_QUEUE_SIZE, DEFAULT_SPECULATIVE_MAX_URLS, DEFAULT_SPECULATIVE_IDLE_POLL, DEFAULT_PREFETCH_AUDIO_SIZE
 from .temp_constants import DEFAULT_TEMP_DIR
-from .ytdlp_constants import DEFAULT_DOWNLOAD_FORMAT, DEFAULT_YT_DLP_SETTINGS, DEFAULT_DOWNLOAD_FILESIZE_LIMIT
+from .ytdlp_constants import DEFAULT_DOWNLOAD_FORMAT, DEFAULT_YT_DLP_SETTINGS, DEFAULT_DOWNLOAD_FILESIZE_LIMIT, DEFAULT_INFO_CACHE_TTL, DEFAULT_INFO_CACHE_SIZE
+from .ytdlp_constants import DEFAULT_DOWNLOAD_RETRIES, DEFAULT_RETRY_BACKOFF, DEFAULT_RETRY_MAX_BACKOFF
+from .ytdlp_constants import YTDLP_CACHE_DIR, EJS_VENDOR_DIR, EJS_RELEASE_URL, DEFAULT_WARMUP_URL
+from .ytdlp_constants import DOWNLOADER_PROFILES_FILE, DEFAULT_DOWNLOADER_PROFILE, DEFAULT_DOWNLOADER_PROFILES, DEFAULT_PROFILE_EXPLORATION, DEFAULT_THROUGHPUT_SMOOTHING
+from .ytdlp_constants import DEFAULT_AUTO_QUALITY_CEILING, DEFAULT_ASSUMED_THROUGHPUT, DEFAULT_PROCESSING_RATES, DEFAULT_DEADLINE_MARGIN
 from .redis_constants import DEFAULT_REDIS_HOST, DEFAULT_REDIS_PORT, DEFAULT_REDIS_USERNAME, DEFAULT_REDIS_PASSWORD, DEFAULT_REDIS_CACHE_DB, DEFAULT_REDIS_LOGIN_DB
 
 __all__ = [
+    "ARIA2C_BINARY",
+    "DEFAULT_ARIA2_RPC_HOST",
+    "DEFAULT_ARIA2_MAX_DOWNLOADS",
+    "DEFAULT_ARIA2_START_TIMEOUT",
+    "DEFAULT_ARIA2_RPC_TIMEOUT",
+    "DEFAULT_ARIA2_POLL_INTERVAL",
+    "DEFAULT_ARIA2_PRIORITY_SIZE",
+    "DEFAULT_BATCH_CONCURRENCY",
+    "DEFAULT_BATCH_MAX_ITEMS",
+    "BATCH_ARCHIVE_NAME",
+    "BATCH_LINKS_FILE_NAME",
     "CACHE_DIR",
     "CACHE_INDEX_FILE",
+    "DEFAULT_SEARCH_HALF_LIFE",
+    "DEFAULT_SEARCH_RESULTS",
     "DEFAULT_DEBUG_FLAG",
+    "INGEST_COMMAND",
+    "INGEST_STDIN",
+    "DEFAULT_INGEST_PARALLELISM",
+    "DEFAULT_INGEST_REPORT",
     "DEFAULT_ENV_CONFIG_PATH",
     "DEFAULT_LOADERS_PATH",
     "DEFAULT_YAML_CONFIG_PATH",
     "YAML_FILE_ENCODING",
     "UNKNOWN_FILE_SIZE",
     "DEFAULT_STRING_DIVISOR",
+    "DEFAULT_KEY_VALUE_DIVISOR",
     "DEFAULT_COMMANDS_PATH",
     "DEFAULT_DISCORD_RECONNECT",
+    "DEFAULT_INTERACTION_DEADLINE",
+    "DEFAULT_INSTANT_REPLY_MAX_UPLOAD",
+    "DEFAULT_PROGRESS_EDIT_INTERVAL",
     "DRIVE_BASE_FILE_UPLOAD_URL",
     "DRIVE_MAX_RETRY_COUNT",
+    "DRIVE_STREAM_CHUNK_SIZE",
+    "DRIVE_STREAM_POLL_INTERVAL",
+    "DRIVE_CHUNK_GRANULARITY",
+    "DRIVE_UPLOAD_CHUNK_SIZE",
+    "DRIVE_UPLOAD_SESSIONS_FILE",
+    "DRIVE_UPLOAD_SESSION_TTL",
+    "FFMPEG_BINARY",
+    "FFPROBE_BINARY",
+    "DEFAULT_FIT_SIZE_MARGIN",
+    "DEFAULT_FIT_AUDIO_BITRATE",
+    "DEFAULT_FIT_MIN_VIDEO_BITRATE",
+    "DEFAULT_FFMPEG_POOL_SIZE",
+    "DEFAULT_FFMPEG_THREADS",
+    "DEFAULT_FFMPEG_NICENESS",
+    "DEFAULT_FFMPEG_IONICE_CLASS",
+    "DEFAULT_FFMPEG_IONICE_LEVEL",
+    "DEFAULT_SPLIT_SIZE_MARGIN",
+    "DEFAULT_SPLIT_ATTEMPTS",
+    "DEFAULT_MAX_SPLIT_PARTS",
+    "JOURNAL_DIR",
+    "JOURNAL_FILE",
+    "INGEST_JOURNAL_FILE",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_JOB_CONNECTIONS",
+    "DEFAULT_MAX_DOWNLOAD_RATE",
+    "DEFAULT_ARIA2C_MIN_SPLIT_SIZE",
+    "DEFAULT_PIPELINE_QUEUE_SIZE",
+    "DEFAULT_STAGE_CONCURRENCY",
+    "DEFAULT_QUALITY_DEADLINE",
+    "DEFAULT_PREVIEW_QUALITY",
+    "DEFAULT_SPECULATIVE_QUEUE_SIZE",
+    "DEFAULT_SPECULATIVE_MAX_URLS",
+    "DEFAULT_SPECULATIVE_IDLE_POLL",
+    "DEFAULT_PREFETCH_AUDIO_SIZE",
     "DEFAULT_TEMP_DIR",
     "DEFAULT_DOWNLOAD_FORMAT",
     "DEFAULT_YT_DLP_SETTINGS",
+    "DEFAULT_INFO_CACHE_TTL",
+    "DEFAULT_INFO_CACHE_SIZE",
+    "DEFAULT_DOWNLOAD_RETRIES",
+    "DEFAULT_RETRY_BACKOFF",
+    "DEFAULT_RETRY_MAX_BACKOFF",
+    "YTDLP_CACHE_DIR",
+    "EJS_VENDOR_DIR",
+    "EJS_RELEASE_URL",
+    "DEFAULT_WARMUP_URL",
+    "DOWNLOADER_PROFILES_FILE",
+    "DEFAULT_DOWNLOADER_PROFILE",
+    "DEFAULT_DOWNLOADER_PROFILES",
+    "DEFAULT_PROFILE_EXPLORATION",
+    "DEFAULT_THROUGHPUT_SMOOTHING",
+    "DEFAULT_AUTO_QUALITY_CEILING",
+    "DEFAULT_ASSUMED_THROUGHPUT",
+    "DEFAULT_PROCESSING_RATES",
+    "DEFAULT_DEADLINE_MARGIN",
     "DEFAULT_DOWNLOAD_BLACKLIST_SITES"
     "DEFAULT_DOWNLOAD_FILESIZE_LIMIT",
     "DEFAULT_REDIS_HOST",
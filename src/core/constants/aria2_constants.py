@@ -0,0 +1,7 @@
+ARIA2C_BINARY = "aria2c"
+DEFAULT_ARIA2_RPC_HOST = "127.0.0.1"
+DEFAULT_ARIA2_MAX_DOWNLOADS = 8 # running in the daemon at once, the others wait in its queue
+DEFAULT_ARIA2_START_TIMEOUT = 10.0 # seconds for the daemon to answer its first call
+DEFAULT_ARIA2_RPC_TIMEOUT = 10.0
+DEFAULT_ARIA2_POLL_INTERVAL = 0.5 # seconds between two status polls of a running download
+DEFAULT_ARIA2_PRIORITY_SIZE = 50 * 1024 * 1024 # downloads expected to be smaller go to the front of the queue
\ No newline at end of file
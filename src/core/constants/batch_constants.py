@@ -0,0 +1,4 @@
+DEFAULT_BATCH_CONCURRENCY = 3 # items of one batch downloading at once, the pipeline limits still apply
+DEFAULT_BATCH_MAX_ITEMS = 50 # playlists are cut after this many entries
+BATCH_ARCHIVE_NAME = "batch.zip"
+BATCH_LINKS_FILE_NAME = "links.txt" # inside the archive, for the items that only exist remotely
\ No newline at end of file
@@ -1,4 +1,6 @@
 from pathlib import Path
 
 CACHE_DIR = Path(".cache")
-CACHE_INDEX_FILE = CACHE_DIR / "index.json"
\ No newline at end of file
+CACHE_INDEX_FILE = CACHE_DIR / "index.json"
+DEFAULT_SEARCH_HALF_LIFE = 3 * 24 * 60 * 60 # seconds for a use to count half in the suggestion ranking
+DEFAULT_SEARCH_RESULTS = 25 # most choices Discord shows for an autocomplete
\ No newline at end of file
@@ -1,2 +1,7 @@
+from pathlib import Path
 
-DEFAULT_DEBUG_FLAG = ("-d", "--debug")
\ No newline at end of file
+DEFAULT_DEBUG_FLAG = ("-d", "--debug")
+INGEST_COMMAND = "ingest"
+INGEST_STDIN = "-"
+DEFAULT_INGEST_PARALLELISM = 4
+DEFAULT_INGEST_REPORT = Path("ingest_report.jsonl")
\ No newline at end of file
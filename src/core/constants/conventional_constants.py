@@ -1,4 +1,5 @@
 
 UNKNOWN_FILE_SIZE = 0
 DEFAULT_STRING_DIVISOR = "|"
+DEFAULT_KEY_VALUE_DIVISOR = "="
 DEFAULT_DOWNLOAD_BLACKLIST_SITES = []
\ No newline at end of file
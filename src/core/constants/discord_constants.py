@@ -1,4 +1,8 @@
 from pathlib import Path
 
 DEFAULT_COMMANDS_PATH = Path("src/presentation/discord/commands")
-DEFAULT_DISCORD_RECONNECT = True
\ No newline at end of file
+DEFAULT_DISCORD_RECONNECT = True
+DEFAULT_INTERACTION_DEADLINE = 14 * 60 # interaction tokens expire after 15 minutes, keep one to send the answer
+DEFAULT_MAX_SPLIT_PARTS = 10 # attachments Discord takes in one message
+DEFAULT_INSTANT_REPLY_MAX_UPLOAD = 8 * 1024 * 1024 # a cached file sent as the first response has to reach Discord within 3 seconds
+DEFAULT_PROGRESS_EDIT_INTERVAL = 3.0 # edits of an interaction response share a webhook rate limit of a few per second
\ No newline at end of file
@@ -1,3 +1,10 @@
+from pathlib import Path
 
 DRIVE_MAX_RETRY_COUNT = 3
-DRIVE_BASE_FILE_UPLOAD_URL = "https://drive.google.com/file/d/"
\ No newline at end of file
+DRIVE_STREAM_CHUNK_SIZE = 8 * 1024 * 1024 # must be a multiple of 256KB
+DRIVE_STREAM_POLL_INTERVAL = 0.5
+DRIVE_BASE_FILE_UPLOAD_URL = "https://drive.google.com/file/d/"
+DRIVE_CHUNK_GRANULARITY = 256 * 1024 # chunk sizes of a resumable upload are multiples of this
+DRIVE_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024 # bytes sent per request, a failure only re-sends the chunk in flight
+DRIVE_UPLOAD_SESSIONS_FILE = Path(".drive") / "upload_sessions.json"
+DRIVE_UPLOAD_SESSION_TTL = 6 * 24 * 60 * 60 # Drive keeps a resumable session for a week
\ No newline at end of file
@@ -0,0 +1,14 @@
+import os
+
+FFMPEG_BINARY = "ffmpeg"
+FFPROBE_BINARY = "ffprobe"
+DEFAULT_FIT_SIZE_MARGIN = 0.95 # keep some room for container overhead and estimate errors
+DEFAULT_FIT_AUDIO_BITRATE = 128_000
+DEFAULT_FIT_MIN_VIDEO_BITRATE = 100_000
+DEFAULT_FFMPEG_POOL_SIZE = os.cpu_count() or 1 # ffmpeg processes running at once
+DEFAULT_FFMPEG_THREADS = 1 # per process, the pool already uses every core
+DEFAULT_FFMPEG_NICENESS = 10 # keeps the bot and the network fetches responsive
+DEFAULT_FFMPEG_IONICE_CLASS = 2 # best-effort
+DEFAULT_FFMPEG_IONICE_LEVEL = 7 # lowest priority inside the class
+DEFAULT_SPLIT_SIZE_MARGIN = 0.9 # segments are cut at keyframes after the target time, so they overshoot a bit
+DEFAULT_SPLIT_ATTEMPTS = 3 # shorter segments are tried when one still came out too big
\ No newline at end of file
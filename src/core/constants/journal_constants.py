@@ -0,0 +1,5 @@
+from pathlib import Path
+
+JOURNAL_DIR = Path(".journal")
+JOURNAL_FILE = JOURNAL_DIR / "jobs.json"
+INGEST_JOURNAL_FILE = JOURNAL_DIR / "ingest_jobs.json" # kept apart, the bot has nowhere to deliver ingest jobs
\ No newline at end of file
@@ -0,0 +1,4 @@
+DEFAULT_MAX_CONNECTIONS = 32 # open at once by every download together, origin sites throttle above that
+DEFAULT_MAX_JOB_CONNECTIONS = 16 # a single download never gets more, even when it runs alone
+DEFAULT_MAX_DOWNLOAD_RATE = None # bytes per second for every download together, None means unlimited
+DEFAULT_ARIA2C_MIN_SPLIT_SIZE = "1M"
\ No newline at end of file
@@ -0,0 +1,13 @@
+import os
+
+DEFAULT_PIPELINE_QUEUE_SIZE = 16 # jobs waiting in front of each stage before the previous one blocks
+DEFAULT_STAGE_CONCURRENCY = {
+    "probe": 8,
+    "fetch": 4,
+    "postprocess": os.cpu_count() or 1,
+    "route": 8,
+    "split": os.cpu_count() or 1,
+    "upload": 2,
+    "deliver": 8,
+}
+DEFAULT_QUALITY_DEADLINE = 5 * 60 # seconds an auto quality request should take at most, the interaction deadline still applies
\ No newline at end of file
@@ -0,0 +1 @@
+DEFAULT_PREVIEW_QUALITY = "360p" # small enough to download in seconds and to attach under any limit
\ No newline at end of file
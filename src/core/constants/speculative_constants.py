@@ -0,0 +1,4 @@
+DEFAULT_SPECULATIVE_QUEUE_SIZE = 32 # links waiting for a probe, newer ones are dropped once it's full
+DEFAULT_SPECULATIVE_MAX_URLS = 3 # links taken from a single message
+DEFAULT_SPECULATIVE_IDLE_POLL = 2.0 # seconds between checks for running downloads before a probe starts
+DEFAULT_PREFETCH_AUDIO_SIZE = 8 * 1024 * 1024 # audio estimated under this is downloaded ahead when prefetching is on
\ No newline at end of file
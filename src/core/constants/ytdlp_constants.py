@@ -1,19 +1,50 @@
+from pathlib import Path
 from yt_dlp.utils import match_filter_func
 
+YTDLP_CACHE_DIR = Path(".cache") / "yt-dlp" # shared by every worker, keeps the solver scripts and player caches
+EJS_VENDOR_DIR = Path("vendor") / "ejs" # local copy of the yt-dlp/ejs release files, used before fetching them
+EJS_RELEASE_URL = "https://github.com/yt-dlp/ejs/releases/download/{version}/{filename}"
+DEFAULT_WARMUP_URL = "https://www.youtube.com/watch?v=jNQXAC9IVRw" # extracted once at startup to cache the player
+
 DEFAULT_YT_DLP_SETTINGS = {
     'js_runtimes': {
         'node': {}
     },
     'cookiefile': 'cookies.txt',
     'remote_components': ['ejs:github'],
+    'cachedir': str(YTDLP_CACHE_DIR),
     'postprocessors': [],
     'noplaylist': True,
     'no_warnings': True,
-    'concurrent_fragment_downloads': 10,
-    'continue_dl': True,
-    'external_downloader': 'aria2c',
-    'external_downloader_args': {'default': ['-x', '16', '-s', '16', '-k', '1M']},
+    'continuedl': True,
+    # the downloader comes from the profile picked for the site, connection counts from the bandwidth budget
     'match_filter': match_filter_func("!is_live"),
 }
+DEFAULT_INFO_CACHE_TTL = 300 # seconds, media URLs from extractors expire after a while
+DEFAULT_INFO_CACHE_SIZE = 256
 DEFAULT_DOWNLOAD_FORMAT = "mp4" # change this later to a better method
-DEFAULT_DOWNLOAD_FILESIZE_LIMIT = 25 * 1024 * 1024
\ No newline at end of file
+DEFAULT_DOWNLOAD_FILESIZE_LIMIT = 25 * 1024 * 1024
+DEFAULT_DOWNLOAD_RETRIES = 3 # extra attempts after a transient failure, partial files are resumed
+DEFAULT_RETRY_BACKOFF = 2.0 # seconds before the first retry, doubled on every next one
+DEFAULT_RETRY_MAX_BACKOFF = 30.0
+
+DOWNLOADER_PROFILES_FILE = Path(".cache") / "downloader_profiles.json"
+DEFAULT_DOWNLOADER_PROFILE = "aria2c" # used for sites without any measured download yet
+DEFAULT_DOWNLOADER_PROFILES = {
+    # good for progressive HTTP, several ranges of the same file at once
+    "aria2c": {"external_downloader": True, "max_connections": None, "http_chunk_size": None},
+    # yt-dlp's own downloader, usually better for HLS/DASH fragments
+    "native": {"external_downloader": False, "max_connections": None, "http_chunk_size": None},
+    # small ranged requests get around sites that throttle long single requests
+    "native_chunked": {"external_downloader": False, "max_connections": 4, "http_chunk_size": 10 * 1024 * 1024},
+}
+DEFAULT_PROFILE_EXPLORATION = 0.1 # share of downloads that try another profile than the best known one
+DEFAULT_THROUGHPUT_SMOOTHING = 0.3 # weight of the newest measure in the moving average
+DEFAULT_AUTO_QUALITY_CEILING = "1080p" # highest quality picked when the user leaves the quality to the bot
+DEFAULT_ASSUMED_THROUGHPUT = 2 * 1024 * 1024 # bytes per second, for sites without any measured download yet
+DEFAULT_PROCESSING_RATES = { # bytes of input per second ffmpeg gets through, per processing mode
+    "COPY": 200 * 1024 * 1024,
+    "REMUX": 100 * 1024 * 1024,
+    "TRANSCODE": 2 * 1024 * 1024,
+}
+DEFAULT_DEADLINE_MARGIN = 0.8 # share of the deadline a quality may be expected to take
\ No newline at end of file
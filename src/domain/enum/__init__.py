@@ -1,5 +1,7 @@
 from .formats import Formats
 from .error_types import ErrorTypes
 from .quality import Quality
+from .processing_mode import ProcessingMode
+from .batch_delivery import BatchDelivery
 
-__all__ = ["Formats", "ErrorTypes", "Quality"]
\ No newline at end of file
+__all__ = ["Formats", "ErrorTypes", "Quality", "ProcessingMode", "BatchDelivery"]
\ No newline at end of file
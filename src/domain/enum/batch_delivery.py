@@ -0,0 +1,6 @@
+from enum import Enum
+
+class BatchDelivery(Enum):
+    """How the files of a batch are handed to the user."""
+    ZIP = "zip"
+    LINKS = "links"
\ No newline at end of file
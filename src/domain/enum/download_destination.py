@@ -6,3 +6,4 @@ class DownloadDestination(Enum):
     """
     LOCAL = "LOCAL"
     REMOTE = "REMOTE"
+    SPLIT = "SPLIT" # sent as several attachments, each under the size limit
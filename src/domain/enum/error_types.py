@@ -7,8 +7,11 @@ class ErrorTypes(Enum):
     DISCORD_ERROR = "DISCORD_ERROR"
     DOWNLOAD_ERROR = "DOWNLOAD_ERROR"
     DOWNLOAD_FAILED = "DOWNLOAD_FAILED"
+    DOWNLOAD_CANCELLED = "DOWNLOAD_CANCELLED"
+    PROCESSING_FAILED = "PROCESSING_FAILED"
     LOADER_ERROR = "LOADER_ERROR"
     STORAGE_ERROR = "STORAGE_ERROR"
     UPLOAD_FAILED = "UPLOAD_FAILED"
     BLACKLISTED_SEARCH = "BLACKLISTED_SEARCH"
-    INVALID_URL = "INVALID_URL"
\ No newline at end of file
+    INVALID_URL = "INVALID_URL"
+    INVALID_TIME_RANGE = "INVALID_TIME_RANGE"
\ No newline at end of file
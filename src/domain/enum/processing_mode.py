@@ -0,0 +1,9 @@
+from enum import Enum
+
+class ProcessingMode(Enum):
+    """
+    How the downloaded streams end up in the requested format.
+    """
+    COPY = "COPY"  # streams are used as they are, at most merged into their own container
+    REMUX = "REMUX"  # streams are copied into another container, no re-encoding
+    TRANSCODE = "TRANSCODE"  # at least one stream is re-encoded
\ No newline at end of file
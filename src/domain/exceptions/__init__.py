@@ -15,10 +15,14 @@ from .storage_exceptions import (
 from .download_exceptions import (
     DownloadFailed,
     DownloadError,
+    DownloadCancelled,
+    MediaProcessingFailed,
 )
 from .blacklist_exception import BlacklistException
 from .url_exception import UrlException
+from .time_range_exception import InvalidTimeRange
 
 __all__ = ["ApplicationBaseException", "EnvFailedLoad", "YamlFailedLoad", "ConfigError", "BotException",
            "DiscordException", "StorageError", "UploadFailed",
-           "DownloadFailed", "DownloadError", "BlacklistException", "UrlException"]
\ No newline at end of file
+           "DownloadFailed", "DownloadError", "DownloadCancelled", "MediaProcessingFailed", "BlacklistException", "UrlException",
+           "InvalidTimeRange"]
\ No newline at end of file
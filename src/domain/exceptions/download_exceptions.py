@@ -10,3 +10,13 @@ class DownloadFailed(DownloadError):
     """Raised when a download fails for any reason."""
     def __init__(self, *args: object) -> None:
         super().__init__(*args, error_type=ErrorTypes.DOWNLOAD_FAILED)
+
+class DownloadCancelled(DownloadError):
+    """Raised when a download is cancelled or runs past its deadline."""
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args, error_type=ErrorTypes.DOWNLOAD_CANCELLED)
+
+class MediaProcessingFailed(DownloadError):
+    """Raised when post-processing a downloaded file (encode, remux, split) fails."""
+    def __init__(self, *args: object) -> None:
+        super().__init__(*args, error_type=ErrorTypes.PROCESSING_FAILED)
@@ -0,0 +1,7 @@
+from src.domain.exceptions import ApplicationBaseException
+from src.domain.enum.error_types import ErrorTypes
+
+class InvalidTimeRange(ApplicationBaseException):
+    """Raised when a requested clip start/end can't be parsed or makes no sense"""
+    def __init__(self, *args: object, error_type: ErrorTypes = ErrorTypes.INVALID_TIME_RANGE) -> None:
+        super().__init__(*args, error_type=error_type)
\ No newline at end of file
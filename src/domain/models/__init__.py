@@ -1,4 +1,12 @@
+from .cancellation_token import CancellationToken
 from .download_file import DownloadedFile
+from .download_progress import DownloadProgress
+from .growing_file import GrowingFile
+from .media_probe import MediaProbe
+from .pending_processing import PendingProcessing
+from .progress_tracker import ProgressTracker
 from .result import Result
+from .time_range import TimeRange
 
-__all__ = ["DownloadedFile", "Result"]
\ No newline at end of file
+__all__ = ["CancellationToken", "DownloadedFile", "DownloadProgress", "GrowingFile", "MediaProbe", "PendingProcessing",
+           "ProgressTracker", "Result", "TimeRange"]
\ No newline at end of file
@@ -0,0 +1,98 @@
+import time
+import threading
+from typing import Callable, List
+from src.domain.exceptions import DownloadCancelled
+
+CancelCallback = Callable[[str], None]
+
+class CancellationToken():
+    """Signals a running job that it should stop, optionally once a deadline passes.
+
+    Cancelling is cooperative: the job checks the token between steps and registers callbacks
+    to interrupt whatever it's blocked on (like killing a child process).
+    Every method is thread-safe, callbacks run in the thread that cancels.
+    """
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._reason: str | None = None
+        self._resumable = False
+        self._callbacks: List[CancelCallback] = []
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+
+    @property
+    def is_cancelled(self) -> bool:
+        if not self._event.is_set() and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("deadline exceeded")
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str | None:
+        return self._reason
+
+    @property
+    def resumable(self) -> bool:
+        """Whether the job was only interrupted (like on shutdown) and should be picked up again later."""
+        return self._resumable
+
+    def remaining(self) -> float | None:
+        """Seconds left until the deadline, None if there is no deadline."""
+        if self.deadline is None:
+            return None
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def cancel(self, reason: str = "cancelled", resumable: bool = False) -> None:
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._reason = reason
+            self._resumable = resumable
+            self._event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback(reason)
+            except Exception:
+                # one broken callback must not keep the others from stopping their work
+                pass
+
+    def on_cancel(self, callback: CancelCallback) -> Callable[[], None]:
+        """Register a callback, called right away if already cancelled. Returns a function that unregisters it."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+
+        callback(self._reason or "cancelled")
+        return lambda: None
+
+    def child(self) -> "CancellationToken":
+        """A token cancelled along with this one (and sharing its deadline) that can also be cancelled alone."""
+        child = CancellationToken()
+        child.deadline = self.deadline
+        self.on_cancel(lambda reason: child.cancel(reason, self._resumable))
+        return child
+
+    def wait(self, timeout: float) -> bool:
+        """Sleeps up to timeout seconds, waking up early on cancel. Returns whether the token is cancelled."""
+        remaining = self.remaining()
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        self._event.wait(timeout)
+        return self.is_cancelled
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raises:
+            DownloadCancelled: If the token was cancelled or its deadline passed
+        """
+        if self.is_cancelled:
+            raise DownloadCancelled(f"Download cancelled: {self._reason}")
+
+    def _remove_callback(self, callback: CancelCallback) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
\ No newline at end of file
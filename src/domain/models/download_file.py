@@ -1,7 +1,15 @@
 from dataclasses import dataclass
 from pathlib import Path
+from src.domain.enum.processing_mode import ProcessingMode
+from src.domain.enum.quality import Quality
+from src.domain.models.pending_processing import PendingProcessing
 
 @dataclass(frozen=True)
 class DownloadedFile:
     file_path: Path
-    file_size: int
\ No newline at end of file
+    file_size: int
+    processing_mode: ProcessingMode | None = None
+    pending_processing: PendingProcessing | None = None
+    retries: int = 0
+    bytes_salvaged: int = 0 # partial data that was resumed instead of downloaded again
+    quality: Quality | None = None # the video quality downloaded, below the requested one when lowered to finish in time
\ No newline at end of file
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class DownloadProgress:
+    """Where a running job is, as last reported by its worker."""
+    stage: str
+    downloaded_bytes: int = 0
+    total_bytes: int | None = None
+    speed: float | None = None
+    eta: float | None = None
+
+    @property
+    def fraction(self) -> float | None:
+        """Share of the current file downloaded, None while the total is unknown."""
+        if not self.total_bytes:
+            return None
+        return min(self.downloaded_bytes / self.total_bytes, 1.0)
\ No newline at end of file
@@ -0,0 +1,70 @@
+import threading
+from pathlib import Path
+
+class GrowingFile():
+    """A file that is still being written by one side (a download) while another side reads it (an upload).
+
+    The writer reports where the file is and when it's done, the reader waits on it.
+    Every method is thread-safe, the writer usually runs inside an executor thread.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._path: Path | None = None
+        self._final_size: int | None = None
+        self._error: BaseException | None = None
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    @property
+    def final_size(self) -> int | None:
+        """The complete size in bytes, only known once the writer finished."""
+        return self._final_size
+
+    @property
+    def error(self) -> BaseException | None:
+        return self._error
+
+    @property
+    def is_finished(self) -> bool:
+        return self._final_size is not None
+
+    def set_path(self, path: Path) -> None:
+        """Called by the writer as soon as it knows where the file is written."""
+        with self._condition:
+            if self._path != path:
+                self._path = path
+                self._condition.notify_all()
+
+    def finish(self, path: Path, final_size: int) -> None:
+        """Called by the writer once the file is complete and won't change anymore."""
+        with self._condition:
+            self._path = path
+            self._final_size = final_size
+            self._condition.notify_all()
+
+    def fail(self, error: BaseException) -> None:
+        """Called by the writer if it gave up, readers will get the error raised."""
+        with self._condition:
+            self._error = error
+            self._condition.notify_all()
+
+    def wait_for_path(self, timeout: float | None = None) -> Path:
+        """Blocks until the writer reported a path (or failed)."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._path is not None or self._error is not None, timeout)
+            self.raise_if_failed()
+            if self._path is None:
+                raise TimeoutError("Timed out waiting for the file to be created")
+            return self._path
+
+    def wait(self, timeout: float) -> None:
+        """Blocks until the writer reports something new or the timeout expires."""
+        with self._condition:
+            self._condition.wait(timeout)
+
+    def raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
\ No newline at end of file
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class MediaProbe:
+    """What is known about a media before downloading it."""
+    title: str | None = None
+    duration: float | None = None
+    estimated_size: int | None = None
+    extension: str | None = None
+    requires_postprocessing: bool = True
\ No newline at end of file
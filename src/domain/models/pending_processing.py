@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+from src.domain.enum.processing_mode import ProcessingMode
+
+@dataclass(frozen=True)
+class PendingProcessing:
+    """Post-processing left to do on the raw streams of a download."""
+    inputs: Tuple[Path, ...]
+    output_path: Path
+    mode: ProcessingMode
+    audio_only: bool = False
\ No newline at end of file
@@ -0,0 +1,40 @@
+from typing import Tuple
+from src.domain.enum.quality import Quality
+from src.domain.models.download_progress import DownloadProgress
+
+Counters = Tuple[int, int | None, float | None, float | None]
+
+class ProgressTracker():
+    """Latest progress of a job, written by its worker thread and read from the event loop.
+
+    Only the newest value is kept: every update replaces the previous one with a single attribute
+    store, which is atomic, so the writer never takes a lock or allocates more than a tuple.
+    Readers that poll less often than the worker writes simply skip the values in between.
+    """
+
+    def __init__(self, stage: str = "queued") -> None:
+        self._stage = stage
+        self._counters: Counters = (0, None, None, None)
+        self._quality: Quality | None = None
+
+    @property
+    def quality(self) -> Quality | None:
+        """The video quality being downloaded once picked, lower than the requested one when it was lowered."""
+        return self._quality
+
+    def set_quality(self, quality: Quality) -> None:
+        self._quality = quality
+
+    def set_stage(self, stage: str) -> None:
+        """A new stage starts, its byte counters start from zero."""
+        self._counters = (0, None, None, None)
+        self._stage = stage
+
+    def update(self, downloaded_bytes: int, total_bytes: int | None = None, speed: float | None = None,
+               eta: float | None = None) -> None:
+        self._counters = (downloaded_bytes, total_bytes, speed, eta)
+
+    def snapshot(self) -> DownloadProgress:
+        downloaded_bytes, total_bytes, speed, eta = self._counters
+        return DownloadProgress(stage=self._stage, downloaded_bytes=downloaded_bytes, total_bytes=total_bytes,
+                                speed=speed, eta=eta)
\ No newline at end of file
@@ -5,4 +5,9 @@ from typing import List
 class DownloadSettings:
     """All settings related to downloading files"""
     file_size_limit: int = 25 * 1024 * 1024 # 25MB default
-    blacklist_sites: List[str] = field(default_factory=list)
\ No newline at end of file
+    blacklist_sites: List[str] = field(default_factory=list)
+    speculative_probe: bool = False # probe media links posted in chat before they're requested
+    prefetch_audio: bool = False # also download the audio of short media found that way
+    quality_deadline: float | None = 5 * 60 # seconds a request leaving the quality to us should take, None for no limit
+    warmup_url: str | None = None # extracted once at startup to cache the player, None to skip
+    warmup_offline: bool = False # warm the yt-dlp cache from local files only
\ No newline at end of file
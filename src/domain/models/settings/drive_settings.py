@@ -4,4 +4,5 @@ from pathlib import Path # domain shouldn't know about Path's existence, but I'l
 @dataclass(frozen=True)
 class DriveSettings:
     credentials_path: Path
-    folder_id: str
\ No newline at end of file
+    folder_id: str
+    upload_chunk_size: int = 32 * 1024 * 1024 # bytes per request of a resumable upload, rounded to 256KB
\ No newline at end of file
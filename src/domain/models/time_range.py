@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+@dataclass(frozen=True)
+class TimeRange:
+    """Part of a media to download, in seconds. No end means until the end of the media."""
+    start: float = 0.0
+    end: float | None = None
+
+    def length(self, duration: float | None) -> float | None:
+        """Seconds covered by the range, None if it runs until an unknown end."""
+        end = self.end if self.end is not None else duration
+        if end is None:
+            return None
+        if duration is not None:
+            end = min(end, duration)
+        return max(end - self.start, 0.0)
+
+    def fraction(self, duration: float | None) -> float | None:
+        """Share of the whole media covered by the range, None if the duration is unknown."""
+        length = self.length(duration)
+        if length is None or not duration:
+            return None
+        return length / duration
+
+    def __str__(self) -> str:
+        end = self._format(self.end) if self.end is not None else "end"
+        return f"{self._format(self.start)}-{end}"
+
+    @staticmethod
+    def _format(seconds: float) -> str:
+        minutes, seconds = divmod(round(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .streaming_zip_writer import StreamingZipWriter, ZipArchiveService
+
+__all__ = ["StreamingZipWriter", "ZipArchiveService"]
\ No newline at end of file
@@ -0,0 +1,71 @@
+import zipfile
+import logging
+from pathlib import Path
+from logging import Logger
+from typing import BinaryIO, Optional
+from src.domain.models import GrowingFile
+
+class AppendOnlyFile():
+    """File wrapper without seek().
+
+    zipfile then writes each entry's sizes after its data (data descriptors) instead of
+    seeking back to patch the header, so bytes already written are never changed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._file: BinaryIO = open(path, "wb")
+
+    def write(self, data: bytes) -> int:
+        return self._file.write(data)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+class StreamingZipWriter():
+    """Zip archive written strictly sequentially, reported to a GrowingFile so it is uploaded while written.
+
+    Entries are stored, not compressed: they are media files that don't compress anyway.
+    """
+
+    def __init__(self, path: Path, growing_file: GrowingFile, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.path = path
+        self.growing_file = growing_file
+        self._file = AppendOnlyFile(path)
+        self._zip = zipfile.ZipFile(self._file, "w", compression=zipfile.ZIP_STORED, allowZip64=True)
+        self.growing_file.set_path(path)
+
+    def add_file(self, file_path: Path, name: str) -> None:
+        self._zip.write(file_path, arcname=name)
+        self._file.flush()
+        self.logger.debug(f"Added {file_path.name} to {self.path.name} as {name}")
+
+    def add_text(self, name: str, text: str) -> None:
+        self._zip.writestr(name, text)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._zip.close()
+        self._file.close()
+        self.growing_file.finish(self.path, self.path.stat().st_size)
+
+    def abort(self, error: BaseException) -> None:
+        try:
+            self._file.close()
+        finally:
+            self.growing_file.fail(error)
+
+class ZipArchiveService():
+    """Creates streaming zip archives."""
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def open_archive(self, path: Path, growing_file: GrowingFile) -> StreamingZipWriter:
+        return StreamingZipWriter(path, growing_file, logger=self.logger)
\ No newline at end of file
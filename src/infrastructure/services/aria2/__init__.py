@@ -0,0 +1,3 @@
+from .aria2_rpc_daemon import Aria2RpcDaemon
+
+__all__ = ["Aria2RpcDaemon"]
\ No newline at end of file
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import socket
+import secrets
+import logging
+import threading
+import subprocess
+import urllib.error
+import urllib.request
+from logging import Logger
+from typing import Any, Dict, List, Optional
+from src.domain.exceptions import DownloadFailed
+from src.core.constants import (
+    ARIA2C_BINARY,
+    DEFAULT_ARIA2_RPC_HOST,
+    DEFAULT_ARIA2_MAX_DOWNLOADS,
+    DEFAULT_ARIA2_START_TIMEOUT,
+    DEFAULT_ARIA2_RPC_TIMEOUT,
+    DEFAULT_MAX_DOWNLOAD_RATE,
+)
+
+class Aria2RpcDaemon():
+    """One long-lived aria2c process shared by every download, driven over its local JSON-RPC interface.
+
+    The process is started on the first call and again if it died, it listens on loopback only,
+    behind a random secret, and exits with this process. Every method is thread-safe and blocking,
+    downloads call them from their executor threads.
+    """
+
+    def __init__(self, max_downloads: int = DEFAULT_ARIA2_MAX_DOWNLOADS, max_rate: int | None = DEFAULT_MAX_DOWNLOAD_RATE,
+                 host: str = DEFAULT_ARIA2_RPC_HOST, start_timeout: float = DEFAULT_ARIA2_START_TIMEOUT,
+                 rpc_timeout: float = DEFAULT_ARIA2_RPC_TIMEOUT, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.max_downloads = max_downloads
+        self.max_rate = max_rate
+        self.host = host
+        self.start_timeout = start_timeout
+        self.rpc_timeout = rpc_timeout
+        self._lock = threading.Lock()
+        self._process: subprocess.Popen[bytes] | None = None
+        self._port: int | None = None
+        self._secret = secrets.token_hex(16)
+
+    def add_uri(self, uris: List[str], options: Dict[str, str], position: int | None = None) -> str:
+        """Queue a download, at position in the waiting queue (the end by default). Returns its gid."""
+        params: List[Any] = [uris, options]
+        if position is not None:
+            params.append(position)
+        return self._call("aria2.addUri", params)
+
+    def tell_status(self, gid: str, keys: List[str] | None = None) -> Dict[str, Any]:
+        return self._call("aria2.tellStatus", [gid, keys] if keys else [gid])
+
+    def change_option(self, gid: str, options: Dict[str, str]) -> None:
+        self._call("aria2.changeOption", [gid, options])
+
+    def remove(self, gid: str) -> None:
+        """Stop a download and drop its result, the partial file stays for a later resume."""
+        try:
+            self._call("aria2.forceRemove", [gid])
+        except DownloadFailed as error:
+            # it already finished or failed
+            self.logger.debug(f"Failed to remove aria2c download {gid}: {error}")
+            return
+        try:
+            self._call("aria2.removeDownloadResult", [gid])
+        except DownloadFailed:
+            pass
+
+    def close(self) -> None:
+        """Stop the daemon, the running downloads are interrupted."""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=self.rpc_timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        self.logger.info("aria2c daemon stopped")
+
+    def _call(self, method: str, params: List[Any]) -> Any:
+        """
+        Raises:
+            DownloadFailed: If the daemon can't be started, can't be reached or answers with an error
+        """
+        port = self._ensure_started()
+        payload = json.dumps({
+            "jsonrpc": "2.0", "id": secrets.token_hex(4), "method": method, "params": [f"token:{self._secret}", *params],
+        }).encode()
+        request = urllib.request.Request(f"http://{self.host}:{port}/jsonrpc", data=payload,
+                                         headers={"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=self.rpc_timeout) as response:
+                answer = json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            # aria2c answers RPC errors with a 4xx status and the error in the body
+            answer = json.loads(error.read() or b"{}")
+        except (urllib.error.URLError, OSError, ValueError) as error:
+            raise DownloadFailed(f"aria2c daemon unreachable: {error}") from error
+
+        if "error" in answer:
+            raise DownloadFailed(f"aria2c {method} failed: {answer['error'].get('message')}")
+        return answer.get("result")
+
+    def _ensure_started(self) -> int:
+        with self._lock:
+            if self._process is not None and self._process.poll() is None and self._port is not None:
+                return self._port
+            if self._process is not None:
+                self.logger.warning(f"aria2c daemon exited with code {self._process.returncode}, restarting it")
+            self._port = self._start()
+            return self._port
+
+    def _start(self) -> int:
+        """Lock must be held."""
+        port = self._free_port()
+        command = [
+            ARIA2C_BINARY, "--enable-rpc", "--rpc-listen-all=false", f"--rpc-listen-port={port}",
+            f"--rpc-secret={self._secret}", f"--stop-with-process={os.getpid()}",
+            f"--max-concurrent-downloads={self.max_downloads}",
+            f"--max-overall-download-limit={self.max_rate or 0}",
+            "--max-connection-per-server=16", "--continue=true", "--file-allocation=none",
+            "--auto-file-renaming=false", "--allow-overwrite=true", "--http-accept-gzip=true",
+            "--console-log-level=warn", "--summary-interval=0", "--quiet=true",
+        ]
+        try:
+            self._process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                             stderr=subprocess.DEVNULL)
+        except OSError as error:
+            raise DownloadFailed(f"Could not start aria2c: {error}") from error
+
+        deadline = time.monotonic() + self.start_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise DownloadFailed(f"aria2c daemon exited with code {self._process.returncode} on start")
+            try:
+                with socket.create_connection((self.host, port), timeout=self.rpc_timeout):
+                    self.logger.info(f"aria2c daemon listening on {self.host}:{port}")
+                    return port
+            except OSError:
+                time.sleep(0.05)
+
+        self._process.kill()
+        raise DownloadFailed(f"aria2c daemon did not start listening within {self.start_timeout:.0f}s")
+
+    def _free_port(self) -> int:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind((self.host, 0))
+            return probe.getsockname()[1]
\ No newline at end of file
@@ -5,7 +5,7 @@ from logging import Logger
 from src.infrastructure.services.config.models import ApplicationSettings
 from src.domain.models.settings import DownloadSettings
 from src.infrastructure.services.config.interfaces.protocols import MapperProtocol
-from src.core.constants import DEFAULT_DOWNLOAD_FILESIZE_LIMIT, DEFAULT_DOWNLOAD_BLACKLIST_SITES
+from src.core.constants import DEFAULT_DOWNLOAD_FILESIZE_LIMIT, DEFAULT_DOWNLOAD_BLACKLIST_SITES, DEFAULT_QUALITY_DEADLINE, DEFAULT_WARMUP_URL
 
 class DownloadSettingsMapper(MapperProtocol):
     """Maps download-related settings into ApplicationSettings.download_settings"""
@@ -23,7 +23,12 @@ class DownloadSettingsMapper(MapperProtocol):
 
             download_settings = DownloadSettings(
                 file_size_limit=download_config.get("file_size_limit", DEFAULT_DOWNLOAD_FILESIZE_LIMIT),
-                blacklist_sites=download_config.get("blacklist_sites", DEFAULT_DOWNLOAD_BLACKLIST_SITES)
+                blacklist_sites=download_config.get("blacklist_sites", DEFAULT_DOWNLOAD_BLACKLIST_SITES),
+                speculative_probe=download_config.get("speculative_probe", False),
+                prefetch_audio=download_config.get("prefetch_audio", False),
+                quality_deadline=download_config.get("quality_deadline", DEFAULT_QUALITY_DEADLINE),
+                warmup_url=download_config.get("warmup_url", DEFAULT_WARMUP_URL),
+                warmup_offline=download_config.get("warmup_offline", False),
             )
 
             new_settings = dataclasses.replace(settings, download_settings=download_settings)
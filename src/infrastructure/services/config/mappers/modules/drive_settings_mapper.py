@@ -6,6 +6,7 @@ from pathlib import Path
 from src.infrastructure.services.config.models import ApplicationSettings
 from src.domain.models.settings.drive_settings import DriveSettings
 from src.infrastructure.services.config.interfaces.protocols import MapperProtocol
+from src.core.constants import DRIVE_UPLOAD_CHUNK_SIZE
 
 class DriveSettingsMapper(MapperProtocol):
     """Maps Google Drive settings into ApplicationSettings.drive_settings"""
@@ -26,7 +27,8 @@ class DriveSettingsMapper(MapperProtocol):
 
             drive_settings = DriveSettings(
                 credentials_path=credentials_path_obj,
-                folder_id=drive_config.get("folder_id")
+                folder_id=drive_config.get("folder_id"),
+                upload_chunk_size=drive_config.get("upload_chunk_size", DRIVE_UPLOAD_CHUNK_SIZE),
             )
 
             new_settings = dataclasses.replace(settings, drive_settings=drive_settings)
@@ -0,0 +1,80 @@
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from logging import Logger
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from src.core.constants import DRIVE_UPLOAD_SESSIONS_FILE, DRIVE_UPLOAD_SESSION_TTL
+
+@dataclass(frozen=True)
+class DriveUploadSession:
+    """A resumable upload session and the bytes Drive acknowledged so far."""
+    uri: str
+    offset: int
+    created_at: float
+    size: int # of the file being uploaded, a file of another size can't continue the session
+
+class DriveUploadSessionStore():
+    """Resumable upload sessions kept in a JSON file, rewritten atomically on every change.
+
+    Sessions are keyed by whatever identifies the upload to the caller, so they are found again after
+    a restart. Sessions older than Drive keeps them are dropped. Thread-safe, the uploads save their
+    progress from executor threads.
+    """
+
+    def __init__(self, sessions_file: Path = DRIVE_UPLOAD_SESSIONS_FILE, ttl: float = DRIVE_UPLOAD_SESSION_TTL,
+                 logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.sessions_file = sessions_file
+        self.ttl = ttl
+        self._sessions: Dict[str, Dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> DriveUploadSession | None:
+        with self._lock:
+            data = self._load_sessions().get(key)
+        if data is None or time.time() - data["created_at"] >= self.ttl:
+            return None
+        return DriveUploadSession(uri=data["uri"], offset=data["offset"], created_at=data["created_at"],
+                                  size=data.get("size", -1))
+
+    def save(self, key: str, session: DriveUploadSession) -> None:
+        with self._lock:
+            sessions = self._load_sessions()
+            now = time.time()
+            for expired in [other for other, data in sessions.items() if now - data["created_at"] >= self.ttl]:
+                del sessions[expired]
+            sessions[key] = {"uri": session.uri, "offset": session.offset, "created_at": session.created_at,
+                             "size": session.size}
+            self._write(sessions)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            sessions = self._load_sessions()
+            if sessions.pop(key, None) is not None:
+                self._write(sessions)
+
+    def _load_sessions(self) -> Dict[str, Dict[str, Any]]:
+        """Lock must be held."""
+        if self._sessions is not None:
+            return self._sessions
+        self._sessions = {}
+        if self.sessions_file.exists():
+            try:
+                self._sessions = json.loads(self.sessions_file.read_text(encoding="utf-8"))
+            except Exception as error:
+                self.logger.warning(f"Failed to load upload sessions: {error}")
+        return self._sessions
+
+    def _write(self, sessions: Dict[str, Dict[str, Any]]) -> None:
+        """Lock must be held."""
+        temp_file = self.sessions_file.with_suffix(".tmp")
+        try:
+            self.sessions_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(sessions, indent=2), encoding="utf-8")
+            os.replace(temp_file, self.sessions_file)
+        except Exception as error:
+            self.logger.error(f"Failed to save upload sessions: {error}")
\ No newline at end of file
@@ -1,26 +1,45 @@
+import json
+import time
 import asyncio
 import logging
 from logging import Logger
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from src.infrastructure.services.drive.google_drive_login_service import GoogleDriveLoginService
-from src.core.constants import DRIVE_MAX_RETRY_COUNT, DRIVE_BASE_FILE_UPLOAD_URL
+from src.infrastructure.services.drive.drive_upload_session_store import DriveUploadSession, DriveUploadSessionStore
+from src.infrastructure.services.drive.growing_file_media_upload import GrowingFileMediaUpload
+from src.domain.models import CancellationToken, GrowingFile
+from src.domain.exceptions import DownloadCancelled, UploadFailed
+from src.core.constants import DRIVE_MAX_RETRY_COUNT, DRIVE_BASE_FILE_UPLOAD_URL, DRIVE_STREAM_CHUNK_SIZE, DRIVE_UPLOAD_CHUNK_SIZE, DRIVE_CHUNK_GRANULARITY
+
+# statuses of a resumable session that no longer exists, the upload has to start over
+EXPIRED_SESSION_STATUSES = {404, 410}
 
 class GoogleDriveUploaderService():
     """Service for uploading files to Google Drive."""
     
-    def __init__(self, login_service: GoogleDriveLoginService, drive_folder_id: str, max_retries: Optional[int] = DRIVE_MAX_RETRY_COUNT, logger: Optional[Logger] = None) -> None:
+    def __init__(self, login_service: GoogleDriveLoginService, drive_folder_id: str, max_retries: Optional[int] = DRIVE_MAX_RETRY_COUNT,
+                 stream_chunk_size: int = DRIVE_STREAM_CHUNK_SIZE, chunk_size: int = DRIVE_UPLOAD_CHUNK_SIZE,
+                 session_store: Optional[DriveUploadSessionStore] = None, logger: Optional[Logger] = None) -> None:
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.login_service = login_service
         self.drive_folder_id = drive_folder_id
         self.max_retries = max_retries
+        self.stream_chunk_size = stream_chunk_size
+        # Drive only takes chunks in multiples of 256KB
+        self.chunk_size = max(chunk_size // DRIVE_CHUNK_GRANULARITY, 1) * DRIVE_CHUNK_GRANULARITY
+        self.session_store = session_store or DriveUploadSessionStore(logger=self.logger)
         self.logger.info("GoogleDriveUploaderService initialized")
 
-    async def upload(self, file_path: Path) -> str:
+    async def upload(self, file_path: Path, upload_id: Optional[str] = None) -> str:
         """
-        Uploads a file to Google Drive with retry logic and reconnection attempt.
-        Returns the file ID.
+        Uploads a file to Google Drive chunk by chunk, with retry logic and reconnection attempt.
+        The session and the acknowledged offset are saved after every chunk, so retries and
+        restarts continue from the last byte Drive has instead of sending the file again.
+        Without an upload_id, only an untouched file continues its session.
+        Returns the file URL.
         """
         self.logger.info(f"Starting upload for file: {file_path}")
 
@@ -36,33 +55,11 @@ class GoogleDriveUploaderService():
             try:
                 drive_service = await self.login_service.get_instance_drive()
 
-                file_metadata = {
-                    'name': file_path.name, 
-                    'parents': [self.drive_folder_id]
-                }
-                
-                media = MediaFileUpload(str(file_path), resumable=True)
-
-                def _sync_upload():
-                    request = drive_service.files().create(
-                        body=file_metadata,
-                        media_body=media,
-                        fields='id'
-                    )
-                    response = request.execute()
-                    return response.get('id')
-
                 self.logger.debug(f"Executing upload attempt {attempt + 1}/{self.max_retries}...")
-                file_id = await asyncio.to_thread(_sync_upload)
+                file_id = await asyncio.to_thread(self._upload_chunks, drive_service, file_path,
+                                                  self._session_key(file_path, upload_id))
 
-                def _make_public():
-                    drive_service.permissions().create(
-                        fileId=file_id,
-                        body={'role': 'reader', 'type': 'anyone'},
-                        fields='id'
-                    ).execute()
-
-                await asyncio.to_thread(_make_public)
+                await self._make_public(drive_service, file_id)
                 
                 self.logger.info(f"File uploaded successfully. ID: {file_id}")
                 return "%s%s" % (DRIVE_BASE_FILE_UPLOAD_URL, file_id)
@@ -81,4 +78,129 @@ class GoogleDriveUploaderService():
                 else:
                     self.logger.critical(f"All upload attempts failed for {file_path}.")
 
-        raise last_error
\ No newline at end of file
+        raise last_error
+
+    def _upload_chunks(self, drive_service: Any, file_path: Path, session_key: str) -> str:
+        """Send the file in chunks, continuing the saved session of session_key if there is one."""
+        file_size = file_path.stat().st_size
+        media = MediaFileUpload(str(file_path), chunksize=self.chunk_size, resumable=True)
+        request = drive_service.files().create(
+            body={'name': file_path.name, 'parents': [self.drive_folder_id]},
+            media_body=media,
+            fields='id'
+        )
+        session = self.session_store.get(session_key)
+        if session is not None and session.size != file_size:
+            self.logger.info(f"{file_path.name} changed since its upload started, starting over")
+            session = None
+        created_at = session.created_at if session else time.time()
+
+        try:
+            response = None
+            if session is not None:
+                offset, response = self._query_session(request.http, session, file_size)
+                self.logger.info(f"Resuming upload of {file_path.name} from byte {offset}")
+                # the media is read from resumable_progress on, the bytes Drive has are not sent again
+                request.resumable_uri = session.uri
+                request.resumable_progress = offset
+            while response is None:
+                # a failed chunk is retried inside the same session, already sent bytes are kept
+                _, response = request.next_chunk(num_retries=self.max_retries)
+                if response is None:
+                    self.session_store.save(session_key, DriveUploadSession(request.resumable_uri, request.resumable_progress,
+                                                                            created_at, file_size))
+        except HttpError as error:
+            if error.resp.status in EXPIRED_SESSION_STATUSES:
+                self.logger.warning(f"Upload session of {file_path.name} expired, the next attempt starts over")
+                self.session_store.remove(session_key)
+            raise
+        finally:
+            media.stream().close()
+
+        self.session_store.remove(session_key)
+        return response.get('id')
+
+    def _query_session(self, http: Any, session: DriveUploadSession, file_size: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Asks Drive how much of a session it committed, it may be past the saved offset.
+
+        Returns:
+            The offset to continue from, and the created file if the upload was already complete
+
+        Raises:
+            HttpError: If Drive doesn't know the session anymore
+        """
+        headers = {"Content-Length": "0", "Content-Range": f"bytes */{file_size}"}
+        response, content = http.request(session.uri, "PUT", headers=headers)
+        if response.status in (200, 201):
+            return file_size, json.loads(content)
+        if response.status != 308:
+            raise HttpError(response, content, uri=session.uri)
+        # no range while Drive has none of the bytes
+        committed = response.get("range")
+        return (int(committed.rsplit("-", 1)[1]) + 1 if committed else 0), None
+
+    @staticmethod
+    def _session_key(file_path: Path, upload_id: Optional[str]) -> str:
+        """The caller's id of the upload, or the file's path, size and modification time while it's untouched."""
+        if upload_id is not None:
+            return upload_id
+        stat = file_path.stat()
+        return f"{file_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+    async def upload_growing(self, growing_file: GrowingFile, cancellation: Optional[CancellationToken] = None) -> str:
+        """
+        Uploads a file while it is still being written, chunk by chunk, in a single resumable session.
+        The upload is only committed once the writer finished the file.
+        Returns the file URL.
+
+        Raises:
+            DownloadCancelled: If cancellation is cancelled, no chunk is sent after it
+        """
+        file_path = await asyncio.to_thread(growing_file.wait_for_path)
+        self.logger.info(f"Starting streamed upload for file: {file_path}")
+
+        drive_service = await self.login_service.get_instance_drive()
+        media = GrowingFileMediaUpload(growing_file, chunksize=self.stream_chunk_size)
+
+        def _sync_upload():
+            request = drive_service.files().create(
+                body={'name': file_path.name, 'parents': [self.drive_folder_id]},
+                media_body=media,
+                fields='id'
+            )
+            response = None
+            while response is None:
+                media.wait_for_chunk(request.resumable_progress, cancellation)
+                if cancellation is not None:
+                    cancellation.raise_if_cancelled()
+                # a failed chunk is retried inside the same session, already sent bytes are kept
+                _, response = request.next_chunk(num_retries=self.max_retries)
+            return response.get('id')
+
+        try:
+            file_id = await asyncio.to_thread(_sync_upload)
+        except DownloadCancelled:
+            raise
+        except Exception as error:
+            if growing_file.error is not None:
+                raise
+            raise UploadFailed(f"Streamed upload of {file_path.name} failed: {error}") from error
+        finally:
+            media.close()
+
+        await self._make_public(drive_service, file_id)
+
+        self.logger.info(f"File streamed successfully. ID: {file_id}")
+        return "%s%s" % (DRIVE_BASE_FILE_UPLOAD_URL, file_id)
+
+    async def _make_public(self, drive_service: Any, file_id: str) -> None:
+        """Allows anyone with the link to read the file."""
+        def _sync_make_public():
+            drive_service.permissions().create(
+                fileId=file_id,
+                body={'role': 'reader', 'type': 'anyone'},
+                fields='id'
+            ).execute()
+
+        await asyncio.to_thread(_sync_make_public)
@@ -0,0 +1,86 @@
+import mimetypes
+from typing import BinaryIO, Optional
+from googleapiclient.http import MediaUpload
+from src.domain.models import CancellationToken, GrowingFile
+from src.core.constants import DRIVE_STREAM_CHUNK_SIZE, DRIVE_STREAM_POLL_INTERVAL
+
+DEFAULT_MIMETYPE = "application/octet-stream"
+
+class GrowingFileMediaUpload(MediaUpload):
+    """Resumable MediaUpload that reads a file while it's still being written.
+
+    The total size is sent as unknown ('*') until the writer finished, so the last chunk
+    is only committed once the file is complete. Call wait_for_chunk() before every next_chunk(),
+    so a chunk is only read when it is full and the last one is only read when the size is known.
+    """
+
+    def __init__(self, growing_file: GrowingFile, chunksize: int = DRIVE_STREAM_CHUNK_SIZE,
+                 poll_interval: float = DRIVE_STREAM_POLL_INTERVAL) -> None:
+        super().__init__()
+        self._growing_file = growing_file
+        self._chunksize = chunksize
+        self._poll_interval = poll_interval
+        self._fd: Optional[BinaryIO] = None
+        self._mimetype = mimetypes.guess_type(growing_file.path.name)[0] if growing_file.path else None
+
+    def chunksize(self) -> int:
+        return self._chunksize
+
+    def mimetype(self) -> str:
+        return self._mimetype or DEFAULT_MIMETYPE
+
+    def size(self) -> int | None:
+        return self._growing_file.final_size
+
+    def resumable(self) -> bool:
+        return True
+
+    def has_stream(self) -> bool:
+        return False
+
+    def wait_for_chunk(self, begin: int, cancellation: Optional[CancellationToken] = None) -> None:
+        """Blocks until the chunk starting at begin can be sent.
+
+        Strictly more than a chunk must be written, so a chunk ending exactly at the end of the
+        file is never sent before the file size is known.
+
+        Raises:
+            DownloadCancelled: If cancellation is cancelled while waiting
+        """
+        while not self._growing_file.is_finished:
+            if cancellation is not None:
+                cancellation.raise_if_cancelled()
+            self._growing_file.raise_if_failed()
+            written = self._written_size()
+            if written < begin:
+                raise IOError("File being uploaded shrank, it was rewritten by the writer")
+            if written > begin + self._chunksize:
+                return
+            self._growing_file.wait(self._poll_interval)
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        fd = self._open()
+        fd.seek(begin)
+        return fd.read(length)
+
+    def close(self) -> None:
+        if self._fd:
+            self._fd.close()
+            self._fd = None
+
+    def _open(self) -> BinaryIO:
+        # the descriptor is kept open, so the reader doesn't care if the writer renames the file
+        if self._fd is None:
+            path = self._growing_file.wait_for_path()
+            self._fd = open(path, "rb")
+        return self._fd
+
+    def _written_size(self) -> int:
+        path = self._growing_file.path
+        if path is None or not path.exists():
+            return 0
+        return path.stat().st_size
+
+    def to_json(self) -> str:
+        """Settings of the upload, the writer's state and the open descriptor are left out."""
+        return self._to_json(strip=["_growing_file", "_fd"])
@@ -0,0 +1,6 @@
+from .ffmpeg_process_pool import FFmpegProcessPool
+from .ffmpeg_size_encoder import FFmpegSizeEncoder
+from .ffmpeg_post_processor import FFmpegPostProcessor
+from .ffmpeg_segment_splitter import FFmpegSegmentSplitter
+
+__all__ = ["FFmpegProcessPool", "FFmpegSizeEncoder", "FFmpegPostProcessor", "FFmpegSegmentSplitter"]
\ No newline at end of file
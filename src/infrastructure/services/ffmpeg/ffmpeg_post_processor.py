@@ -0,0 +1,80 @@
+import logging
+from logging import Logger
+from typing import Dict, List, Optional
+from src.domain.models import CancellationToken, DownloadedFile
+from src.domain.enum import ProcessingMode
+from src.domain.exceptions import MediaProcessingFailed
+from src.infrastructure.services.ffmpeg.ffmpeg_process_pool import FFmpegProcessPool
+from src.core.constants import FFMPEG_BINARY
+
+# encoders used when the streams have to be converted, same quality as yt-dlp's preferredquality '0'
+TRANSCODE_VIDEO_ARGS: Dict[str, List[str]] = {
+    ".webm": ["-c:v", "libvpx-vp9", "-row-mt", "1", "-crf", "32", "-b:v", "0"],
+}
+TRANSCODE_AUDIO_ARGS: Dict[str, List[str]] = {
+    ".mp3": ["-c:a", "libmp3lame", "-q:a", "0"],
+    ".ogg": ["-c:a", "libvorbis", "-q:a", "10"],
+    ".webm": ["-c:a", "libopus", "-b:a", "160k"],
+}
+DEFAULT_TRANSCODE_VIDEO_ARGS = ["-c:v", "libx264", "-preset", "veryfast"]
+DEFAULT_TRANSCODE_AUDIO_ARGS = ["-c:a", "aac"]
+
+class FFmpegPostProcessor():
+    """Merges, remuxes or transcodes the raw streams of a download, in the ffmpeg process pool.
+
+    This is the work yt-dlp would otherwise do inline after fetching, moved out so the fetch
+    slot is free as soon as the streams are on disk.
+    """
+
+    def __init__(self, process_pool: Optional[FFmpegProcessPool] = None, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.process_pool = process_pool or FFmpegProcessPool()
+
+    async def process(self, downloaded_file: DownloadedFile, cancellation: Optional[CancellationToken] = None) -> DownloadedFile:
+        """
+        Run the post-processing a download still needs.
+
+        Args:
+            downloaded_file: The download, with its pending processing
+            cancellation: If cancelled, ffmpeg is killed
+
+        Returns:
+            The processed file, or downloaded_file itself if nothing was pending
+
+        Raises:
+            MediaProcessingFailed: If ffmpeg fails
+        """
+        pending = downloaded_file.pending_processing
+        if pending is None:
+            return downloaded_file
+
+        command = [FFMPEG_BINARY, "-y"]
+        for input_path in pending.inputs:
+            command += ["-i", str(input_path)]
+        for index in range(len(pending.inputs)):
+            # only audio and video, other streams (data, subtitles) may not fit the target container
+            command += ["-map", f"{index}:a?"] if pending.audio_only else ["-map", f"{index}:v?", "-map", f"{index}:a?"]
+        command += self._codec_args(pending.mode, pending.output_path.suffix, pending.audio_only)
+        command += [*self.process_pool.thread_args, str(pending.output_path)]
+
+        await self.process_pool.run(command, cancellation)
+        if not pending.output_path.exists():
+            raise MediaProcessingFailed(f"ffmpeg did not write {pending.output_path.name}")
+
+        for input_path in pending.inputs:
+            input_path.unlink(missing_ok=True)
+
+        file_size = pending.output_path.stat().st_size
+        self.logger.info(f"Post-processed {pending.output_path.name} ({pending.mode.value}, {file_size} bytes)")
+        return DownloadedFile(file_path=pending.output_path, file_size=file_size, processing_mode=pending.mode,
+                              quality=downloaded_file.quality)
+
+    @staticmethod
+    def _codec_args(mode: ProcessingMode, suffix: str, audio_only: bool) -> List[str]:
+        if mode != ProcessingMode.TRANSCODE:
+            return ["-c", "copy"]
+
+        audio_args = TRANSCODE_AUDIO_ARGS.get(suffix, DEFAULT_TRANSCODE_AUDIO_ARGS)
+        if audio_only:
+            return audio_args
+        return [*TRANSCODE_VIDEO_ARGS.get(suffix, DEFAULT_TRANSCODE_VIDEO_ARGS), *audio_args]
\ No newline at end of file
@@ -0,0 +1,125 @@
+import shutil
+import asyncio
+import logging
+from logging import Logger
+from typing import List, Optional
+from src.domain.models import CancellationToken
+from src.domain.exceptions import MediaProcessingFailed
+from src.core.constants import (
+    DEFAULT_FFMPEG_POOL_SIZE,
+    DEFAULT_FFMPEG_THREADS,
+    DEFAULT_FFMPEG_NICENESS,
+    DEFAULT_FFMPEG_IONICE_CLASS,
+    DEFAULT_FFMPEG_IONICE_LEVEL,
+)
+
+class FFmpegProcessPool():
+    """Runs ffmpeg/ffprobe processes with a cap on how many run at once.
+
+    Processes are started under nice and ionice (when available) so CPU-heavy encodes queue up
+    here instead of slowing down the bot and the downloads running next to them.
+    """
+
+    def __init__(self, size: int = DEFAULT_FFMPEG_POOL_SIZE, threads: int = DEFAULT_FFMPEG_THREADS,
+                 niceness: int = DEFAULT_FFMPEG_NICENESS, ionice_class: int = DEFAULT_FFMPEG_IONICE_CLASS,
+                 ionice_level: int = DEFAULT_FFMPEG_IONICE_LEVEL, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.size = size
+        self.threads = threads
+        self._semaphore = asyncio.Semaphore(size)
+        self._prefix = self._build_prefix(niceness, ionice_class, ionice_level)
+        self._waiting = 0
+        self.logger.info(f"FFmpegProcessPool initialized with {size} slots, {threads} threads each")
+
+    @property
+    def thread_args(self) -> List[str]:
+        """Output options that limit how many threads an ffmpeg process uses."""
+        return ["-threads", str(self.threads)]
+
+    async def run(self, command: List[str], cancellation: Optional[CancellationToken] = None) -> str:
+        """
+        Run a command once a slot is free and return its stdout.
+
+        Raises:
+            DownloadCancelled: If cancellation is cancelled, the process is killed then
+            MediaProcessingFailed: If the binary is missing or exits with an error
+        """
+        if self._semaphore.locked():
+            self.logger.debug(f"All {self.size} ffmpeg slots busy, {self._waiting} processes already waiting")
+
+        self._waiting += 1
+        try:
+            await self._acquire(cancellation)
+        finally:
+            self._waiting -= 1
+
+        try:
+            if cancellation is not None:
+                cancellation.raise_if_cancelled()
+            return await self._run(command, cancellation)
+        finally:
+            self._semaphore.release()
+
+    async def _acquire(self, cancellation: Optional[CancellationToken]) -> None:
+        """Waits for a slot, a cancelled job stops waiting instead of queueing for one it won't use."""
+        if cancellation is None:
+            await self._semaphore.acquire()
+            return
+
+        cancellation.raise_if_cancelled()
+        loop = asyncio.get_running_loop()
+        acquire = asyncio.ensure_future(self._semaphore.acquire())
+        unregister_cancel = cancellation.on_cancel(lambda reason: loop.call_soon_threadsafe(acquire.cancel))
+        try:
+            await acquire
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            cancellation.raise_if_cancelled()
+            raise
+        finally:
+            unregister_cancel()
+
+    async def _run(self, command: List[str], cancellation: Optional[CancellationToken]) -> str:
+        self.logger.debug(f"Running: {' '.join(command)}")
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._prefix, *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as error:
+            raise MediaProcessingFailed(f"{command[0]} is not installed") from error
+
+        loop = asyncio.get_running_loop()
+        unregister_cancel = (cancellation.on_cancel(lambda reason: loop.call_soon_threadsafe(self._kill, process))
+                             if cancellation is not None else lambda: None)
+        try:
+            stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            self._kill(process)
+            raise
+        finally:
+            unregister_cancel()
+
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+        if process.returncode != 0:
+            message = stderr.decode(errors="replace").strip().splitlines()[-1:] or ["unknown error"]
+            raise MediaProcessingFailed(f"{command[0]} failed: {message[0]}")
+        return stdout.decode(errors="replace")
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+    @staticmethod
+    def _build_prefix(niceness: int, ionice_class: int, ionice_level: int) -> List[str]:
+        prefix: List[str] = []
+        if niceness and shutil.which("nice"):
+            prefix += ["nice", "-n", str(niceness)]
+        if shutil.which("ionice"):
+            prefix += ["ionice", "-c", str(ionice_class), "-n", str(ionice_level)]
+        return prefix
\ No newline at end of file
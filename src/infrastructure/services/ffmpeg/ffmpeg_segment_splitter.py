@@ -0,0 +1,95 @@
+import json
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import List, Optional
+from src.domain.models import CancellationToken, DownloadedFile
+from src.domain.exceptions import MediaProcessingFailed
+from src.infrastructure.services.ffmpeg.ffmpeg_process_pool import FFmpegProcessPool
+from src.core.constants import (
+    FFMPEG_BINARY,
+    FFPROBE_BINARY,
+    DEFAULT_SPLIT_SIZE_MARGIN,
+    DEFAULT_SPLIT_ATTEMPTS,
+    DEFAULT_MAX_SPLIT_PARTS,
+)
+
+class FFmpegSegmentSplitter():
+    """Cuts media into parts under a size limit with ffmpeg's segment muxer.
+
+    Streams are copied, so cuts land on the first keyframe after each target time and every
+    part plays on its own. The segment length comes from the average bitrate; when a part still
+    comes out too big (bitrate peaks, long GOPs), the split is redone with shorter segments.
+    """
+
+    def __init__(self, size_margin: float = DEFAULT_SPLIT_SIZE_MARGIN, max_parts: int = DEFAULT_MAX_SPLIT_PARTS,
+                 attempts: int = DEFAULT_SPLIT_ATTEMPTS, process_pool: Optional[FFmpegProcessPool] = None,
+                 logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.process_pool = process_pool or FFmpegProcessPool()
+        self.size_margin = size_margin
+        self.max_parts = max_parts
+        self.attempts = attempts
+
+    async def split(self, downloaded_file: DownloadedFile, max_part_size: int, output_folder: Path,
+                    cancellation: Optional[CancellationToken] = None) -> List[Path]:
+        """
+        Split a file into parts of at most max_part_size bytes.
+
+        Args:
+            downloaded_file: The file to split
+            max_part_size: Maximum size in bytes of every part
+            output_folder: Folder where the parts are written
+            cancellation: If cancelled, ffmpeg is killed
+
+        Returns:
+            The parts, in playing order
+
+        Raises:
+            MediaProcessingFailed: If the duration can't be read, it needs more than max_parts parts or ffmpeg fails
+        """
+        source = downloaded_file.file_path
+        duration = await self._probe_duration(source, cancellation)
+        segment_time = duration * max_part_size * self.size_margin / downloaded_file.file_size
+
+        for attempt in range(self.attempts):
+            parts_folder = output_folder / f"{source.stem}.parts{attempt}"
+            parts_folder.mkdir(parents=True, exist_ok=True)
+            parts = await self._segment(source, parts_folder, segment_time, cancellation)
+            if not parts:
+                raise MediaProcessingFailed(f"ffmpeg produced no parts for {source.name}")
+            if len(parts) > self.max_parts:
+                raise MediaProcessingFailed(f"{source.name} needs more than {self.max_parts} parts of {max_part_size} bytes")
+
+            largest = max(part.stat().st_size for part in parts)
+            if largest <= max_part_size:
+                self.logger.info(f"Split {source.name} into {len(parts)} parts of {segment_time:.1f}s")
+                return parts
+
+            self.logger.debug(f"Part of {largest} bytes is over {max_part_size}, splitting {source.name} again")
+            segment_time *= max_part_size * self.size_margin / largest
+
+        raise MediaProcessingFailed(f"Could not split {source.name} into parts under {max_part_size} bytes")
+
+    async def _segment(self, source: Path, parts_folder: Path, segment_time: float,
+                       cancellation: Optional[CancellationToken]) -> List[Path]:
+        # the segment muxer takes a printf pattern, so a '%' in the title has to be escaped
+        pattern = parts_folder / f"{source.stem.replace('%', '%%')} part%02d{source.suffix}"
+        await self.process_pool.run([
+            FFMPEG_BINARY, "-y", "-i", str(source), "-map", "0:v?", "-map", "0:a?", "-c", "copy",
+            "-f", "segment", "-segment_time", f"{segment_time:.3f}", "-segment_start_number", "1",
+            "-reset_timestamps", "1", str(pattern),
+        ], cancellation)
+        return sorted(parts_folder.glob(f"*{source.suffix}"))
+
+    async def _probe_duration(self, source: Path, cancellation: Optional[CancellationToken]) -> float:
+        output = await self.process_pool.run([
+            FFPROBE_BINARY, "-v", "error", "-print_format", "json", "-show_format", str(source),
+        ], cancellation)
+        try:
+            duration = float(json.loads(output).get("format", {}).get("duration") or 0)
+        except (json.JSONDecodeError, ValueError) as error:
+            raise MediaProcessingFailed(f"Could not probe {source.name}: {error}") from error
+        if duration <= 0:
+            raise MediaProcessingFailed(f"Could not read the duration of {source.name}")
+        return duration
\ No newline at end of file
@@ -0,0 +1,125 @@
+import os
+import json
+import logging
+from logging import Logger
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from src.domain.models import CancellationToken, DownloadedFile
+from src.domain.enum import ProcessingMode
+from src.domain.exceptions import MediaProcessingFailed
+from src.infrastructure.services.ffmpeg.ffmpeg_process_pool import FFmpegProcessPool
+from src.core.constants import (
+    FFMPEG_BINARY,
+    FFPROBE_BINARY,
+    DEFAULT_FIT_SIZE_MARGIN,
+    DEFAULT_FIT_AUDIO_BITRATE,
+    DEFAULT_FIT_MIN_VIDEO_BITRATE,
+)
+
+VIDEO_CODECS: Dict[str, List[str]] = {
+    ".webm": ["-c:v", "libvpx-vp9", "-row-mt", "1"],
+}
+AUDIO_CODECS: Dict[str, List[str]] = {
+    ".webm": ["-c:a", "libopus"],
+    ".mp3": ["-c:a", "libmp3lame"],
+    ".ogg": ["-c:a", "libvorbis"],
+}
+DEFAULT_VIDEO_CODEC = ["-c:v", "libx264", "-preset", "veryfast"]
+DEFAULT_AUDIO_CODEC = ["-c:a", "aac"]
+
+class FFmpegSizeEncoder():
+    """Re-encodes media with ffmpeg so the result fits a target size.
+
+    Video uses a two-pass encode with a bitrate budget computed from the duration,
+    audio-only files use a single pass at the budgeted bitrate.
+    """
+
+    def __init__(self, size_margin: float = DEFAULT_FIT_SIZE_MARGIN, audio_bitrate: int = DEFAULT_FIT_AUDIO_BITRATE,
+                 min_video_bitrate: int = DEFAULT_FIT_MIN_VIDEO_BITRATE, process_pool: Optional[FFmpegProcessPool] = None,
+                 logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.process_pool = process_pool or FFmpegProcessPool()
+        self.size_margin = size_margin
+        self.audio_bitrate = audio_bitrate
+        self.min_video_bitrate = min_video_bitrate
+
+    async def encode_to_size(self, downloaded_file: DownloadedFile, target_size: int, output_folder: Path,
+                             cancellation: Optional[CancellationToken] = None) -> DownloadedFile:
+        """
+        Re-encode a file so it fits in target_size bytes.
+
+        Args:
+            downloaded_file: The file to re-encode
+            target_size: Maximum size in bytes of the result
+            output_folder: Folder where the encoded file will be written
+            cancellation: If cancelled, ffmpeg is killed
+
+        Returns:
+            The encoded file
+
+        Raises:
+            MediaProcessingFailed: If the file can't be probed, the budget is too small or ffmpeg fails
+        """
+        source = downloaded_file.file_path
+        probe = await self._probe(source, cancellation)
+        duration = float(probe.get("format", {}).get("duration") or 0)
+        if duration <= 0:
+            raise MediaProcessingFailed(f"Could not read the duration of {source.name}")
+
+        has_video = any(stream.get("codec_type") == "video" for stream in probe.get("streams", []))
+        total_bitrate = int(target_size * 8 * self.size_margin / duration)
+        output_path = output_folder / f"{source.stem}.fit{source.suffix}"
+
+        if has_video:
+            audio_bitrate = min(self.audio_bitrate, total_bitrate // 4)
+            video_bitrate = total_bitrate - audio_bitrate
+            if video_bitrate < self.min_video_bitrate:
+                raise MediaProcessingFailed(
+                    f"{source.name} is too long to fit in {target_size} bytes ({video_bitrate} bps of video left)"
+                )
+            await self._encode_video(source, output_path, video_bitrate, audio_bitrate, output_folder, cancellation)
+        else:
+            await self._encode_audio(source, output_path, total_bitrate, cancellation)
+
+        file_size = output_path.stat().st_size
+        self.logger.info(f"Encoded {source.name} from {downloaded_file.file_size} to {file_size} bytes (target {target_size})")
+        if file_size > target_size:
+            raise MediaProcessingFailed(f"Encoded file is still larger than the limit ({file_size} > {target_size} bytes)")
+
+        return DownloadedFile(file_path=output_path, file_size=file_size, processing_mode=ProcessingMode.TRANSCODE,
+                              quality=downloaded_file.quality)
+
+    async def _encode_video(self, source: Path, output_path: Path, video_bitrate: int, audio_bitrate: int,
+                            work_folder: Path, cancellation: Optional[CancellationToken]) -> None:
+        """Two-pass encode, the first pass only writes the rate control log."""
+        video_codec = VIDEO_CODECS.get(source.suffix, DEFAULT_VIDEO_CODEC)
+        audio_codec = AUDIO_CODECS.get(source.suffix, DEFAULT_AUDIO_CODEC)
+        passlog = str(work_folder / f"{source.stem}.passlog")
+
+        threads = self.process_pool.thread_args
+
+        await self.process_pool.run([
+            FFMPEG_BINARY, "-y", "-i", str(source), *video_codec, *threads, "-b:v", str(video_bitrate),
+            "-pass", "1", "-passlogfile", passlog, "-an", "-f", "null", os.devnull,
+        ], cancellation)
+        await self.process_pool.run([
+            FFMPEG_BINARY, "-y", "-i", str(source), *video_codec, *threads, "-b:v", str(video_bitrate),
+            "-pass", "2", "-passlogfile", passlog, *audio_codec, "-b:a", str(audio_bitrate), str(output_path),
+        ], cancellation)
+
+    async def _encode_audio(self, source: Path, output_path: Path, audio_bitrate: int,
+                            cancellation: Optional[CancellationToken]) -> None:
+        audio_codec = AUDIO_CODECS.get(source.suffix, DEFAULT_AUDIO_CODEC)
+        await self.process_pool.run([
+            FFMPEG_BINARY, "-y", "-i", str(source), "-vn", *audio_codec, *self.process_pool.thread_args,
+            "-b:a", str(audio_bitrate), str(output_path),
+        ], cancellation)
+
+    async def _probe(self, source: Path, cancellation: Optional[CancellationToken]) -> Dict[str, Any]:
+        output = await self.process_pool.run([
+            FFPROBE_BINARY, "-v", "error", "-print_format", "json", "-show_format", "-show_streams", str(source),
+        ], cancellation)
+        try:
+            return json.loads(output)
+        except json.JSONDecodeError as error:
+            raise MediaProcessingFailed(f"Could not probe {source.name}: {error}") from error
\ No newline at end of file
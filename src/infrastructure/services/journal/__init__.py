@@ -0,0 +1,3 @@
+from .json_job_journal import JSONJobJournal
+
+__all__ = ["JSONJobJournal"]
\ No newline at end of file
@@ -0,0 +1,173 @@
+import os
+import json
+import dataclasses
+import asyncio
+import logging
+import aiofiles
+from pathlib import Path
+from logging import Logger
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.models.dataclasses import JournalEntry
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.domain.enum.processing_mode import ProcessingMode
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.models import DownloadedFile, MediaProbe, PendingProcessing, TimeRange
+from src.core.constants import JOURNAL_FILE
+
+class JSONJobJournal():
+    """Job journal kept in a JSON file, rewritten atomically on every change.
+
+    The file is small (one entry per job in flight), so it is simply replaced as a whole,
+    which keeps it valid even if the process dies in the middle of a write.
+    """
+
+    def __init__(self, journal_file: Path = JOURNAL_FILE, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.journal_file = journal_file
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[str, Dict[str, Any]] | None = None
+        self._lock = asyncio.Lock()
+        self.logger.info(f"JSONJobJournal initialized at: {self.journal_file}")
+
+    async def save(self, entry: JournalEntry) -> None:
+        """
+        Raises:
+            OSError: If the journal can't be written, a job that runs anyway couldn't be resumed after a crash
+        """
+        async with self._lock:
+            entries = await self._load_entries()
+            now = datetime.now(timezone.utc).isoformat()
+            entry.created_at = entry.created_at or now
+            entry.updated_at = now
+            entries[entry.job_id] = self._serialize(entry)
+            await self._write(entries)
+
+    async def remove(self, job_id: str) -> None:
+        async with self._lock:
+            entries = await self._load_entries()
+            if entries.pop(job_id, None) is not None:
+                await self._write(entries)
+
+    async def load(self) -> List[JournalEntry]:
+        async with self._lock:
+            entries = await self._load_entries()
+            loaded = []
+            for job_id, data in entries.items():
+                try:
+                    loaded.append(self._deserialize(job_id, data))
+                except (KeyError, ValueError) as error:
+                    self.logger.warning(f"Skipping unreadable journal entry {job_id}: {error}")
+            return loaded
+
+    async def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if self.journal_file.exists():
+            try:
+                async with aiofiles.open(self.journal_file, "r", encoding="utf-8") as f:
+                    self._entries = json.loads(await f.read())
+            except Exception as error:
+                self.logger.warning(f"Failed to load job journal: {error}")
+        return self._entries
+
+    async def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        temp_file = self.journal_file.with_suffix(".tmp")
+        async with aiofiles.open(temp_file, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(entries, indent=2, ensure_ascii=False))
+        await asyncio.to_thread(os.replace, temp_file, self.journal_file)
+
+    @staticmethod
+    def _serialize(entry: JournalEntry) -> Dict[str, Any]:
+        request = entry.request
+        return {
+            "request": {
+                "url": request.url,
+                "file_size_limit": request.file_size_limit,
+                "format": request.format.value if request.format else None,
+                "quality": request.quality.value if request.quality else None,
+                "fit_to_limit": request.fit_to_limit,
+                "time_range": [request.time_range.start, request.time_range.end] if request.time_range else None,
+                "allow_split": request.allow_split,
+                "auto_quality": request.auto_quality,
+            },
+            "stage": entry.stage,
+            "context": entry.context,
+            "temp_path": str(entry.temp_path) if entry.temp_path else None,
+            "created_at": entry.created_at,
+            "updated_at": entry.updated_at,
+            "probe": dataclasses.asdict(entry.probe) if entry.probe else None,
+            "stream": entry.stream,
+            "downloaded_file": JSONJobJournal._serialize_file(entry.downloaded_file) if entry.downloaded_file else None,
+            "destination": entry.destination.value if entry.destination else None,
+            "file_url": entry.file_url,
+            "parts": [str(part) for part in entry.parts],
+        }
+
+    @staticmethod
+    def _serialize_file(downloaded_file: DownloadedFile) -> Dict[str, Any]:
+        pending = downloaded_file.pending_processing
+        return {
+            "file_path": str(downloaded_file.file_path),
+            "file_size": downloaded_file.file_size,
+            "processing_mode": downloaded_file.processing_mode.value if downloaded_file.processing_mode else None,
+            "pending_processing": {
+                "inputs": [str(path) for path in pending.inputs],
+                "output_path": str(pending.output_path),
+                "mode": pending.mode.value,
+                "audio_only": pending.audio_only,
+            } if pending else None,
+            "retries": downloaded_file.retries,
+            "bytes_salvaged": downloaded_file.bytes_salvaged,
+            "quality": downloaded_file.quality.value if downloaded_file.quality else None,
+        }
+
+    @staticmethod
+    def _deserialize_file(data: Dict[str, Any]) -> DownloadedFile:
+        pending = data.get("pending_processing")
+        return DownloadedFile(
+            file_path=Path(data["file_path"]),
+            file_size=data["file_size"],
+            processing_mode=ProcessingMode(data["processing_mode"]) if data.get("processing_mode") else None,
+            pending_processing=PendingProcessing(
+                inputs=tuple(Path(path) for path in pending["inputs"]),
+                output_path=Path(pending["output_path"]),
+                mode=ProcessingMode(pending["mode"]),
+                audio_only=pending.get("audio_only", False),
+            ) if pending else None,
+            retries=data.get("retries", 0),
+            bytes_salvaged=data.get("bytes_salvaged", 0),
+            quality=Quality(data["quality"]) if data.get("quality") else None,
+        )
+
+    @staticmethod
+    def _deserialize(job_id: str, data: Dict[str, Any]) -> JournalEntry:
+        request_data = data["request"]
+        request = DownloadRequest(
+            url=request_data["url"],
+            file_size_limit=request_data["file_size_limit"],
+            format=Formats(request_data["format"]) if request_data.get("format") else None,
+            quality=Quality(request_data["quality"]) if request_data.get("quality") else Quality.DEFAULT,
+            fit_to_limit=request_data.get("fit_to_limit", False),
+            time_range=TimeRange(*request_data["time_range"]) if request_data.get("time_range") else None,
+            allow_split=request_data.get("allow_split", True),
+            auto_quality=request_data.get("auto_quality", False),
+        )
+        return JournalEntry(
+            job_id=job_id,
+            request=request,
+            stage=data["stage"],
+            context=data.get("context") or {},
+            temp_path=Path(data["temp_path"]) if data.get("temp_path") else None,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            probe=MediaProbe(**data["probe"]) if data.get("probe") else None,
+            stream=data.get("stream", False),
+            downloaded_file=JSONJobJournal._deserialize_file(data["downloaded_file"]) if data.get("downloaded_file") else None,
+            destination=DownloadDestination(data["destination"]) if data.get("destination") else None,
+            file_url=data.get("file_url"),
+            parts=[Path(part) for part in data.get("parts") or []],
+        )
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .bandwidth_budget import BandwidthBudget, BandwidthShare
+
+__all__ = ["BandwidthBudget", "BandwidthShare"]
\ No newline at end of file
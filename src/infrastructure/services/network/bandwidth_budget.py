@@ -0,0 +1,128 @@
+import logging
+import threading
+from logging import Logger
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+from src.domain.models import CancellationToken
+from src.core.constants import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_JOB_CONNECTIONS, DEFAULT_MAX_DOWNLOAD_RATE
+
+class BandwidthShare():
+    """The part of the budget one download may use.
+
+    Its connections are granted once, a running download can't change how many it opened.
+    Its rate is updated whenever downloads start or finish.
+    """
+
+    def __init__(self, connections: int = 1) -> None:
+        self._lock = threading.Lock()
+        self._connections = connections
+        self._rate: int | None = None
+        self._callbacks: List[Callable[["BandwidthShare"], None]] = []
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+    @property
+    def rate(self) -> int | None:
+        """Bytes per second for the whole download, None if unlimited."""
+        return self._rate
+
+    @property
+    def stream_rate(self) -> int | None:
+        """Bytes per second for each of the download's connections."""
+        if self._rate is None:
+            return None
+        return max(self._rate // self._connections, 1)
+
+    def on_change(self, callback: Callable[["BandwidthShare"], None]) -> Callable[[], None]:
+        """Register a callback called after every rebalance. Returns a function that unregisters it."""
+        with self._lock:
+            self._callbacks.append(callback)
+
+        def _unregister() -> None:
+            with self._lock:
+                if callback in self._callbacks:
+                    self._callbacks.remove(callback)
+        return _unregister
+
+    def _update(self, rate: int | None) -> None:
+        with self._lock:
+            if rate == self._rate:
+                return
+            self._rate = rate
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            callback(self)
+
+class BandwidthBudget():
+    """Process-wide limit of connections and bytes per second, split among running downloads.
+
+    A starting download is granted its even split of the connections, but no more than half of the
+    free ones, since the running downloads keep what they were granted and the ones starting next
+    still need some. While none are free it waits for a download to finish. The rate is split evenly and rebalanced as downloads start and finish.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 max_job_connections: int = DEFAULT_MAX_JOB_CONNECTIONS,
+                 max_rate: int | None = DEFAULT_MAX_DOWNLOAD_RATE, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.max_connections = max_connections
+        self.max_job_connections = max_job_connections
+        self.max_rate = max_rate
+        self._released = threading.Condition()
+        self._shares: List[BandwidthShare] = []
+
+    @property
+    def active(self) -> int:
+        return len(self._shares)
+
+    @property
+    def free_connections(self) -> int:
+        return max(self.max_connections - sum(share.connections for share in self._shares), 0)
+
+    @contextmanager
+    def acquire(self, cancellation: CancellationToken | None = None) -> Iterator[BandwidthShare]:
+        """
+        Take a share for the duration of a download, waiting for a free connection if there is none.
+
+        Raises:
+            DownloadCancelled: If cancellation is cancelled while waiting
+        """
+        unregister_cancel = cancellation.on_cancel(lambda reason: self._wake()) if cancellation is not None else lambda: None
+        try:
+            with self._released:
+                while self.free_connections < 1:
+                    if cancellation is not None:
+                        cancellation.raise_if_cancelled()
+                    self.logger.debug(f"No free connection for a new download, {len(self._shares)} are running")
+                    self._released.wait(cancellation.remaining() if cancellation is not None else None)
+                fair = max(1, min(self.max_job_connections, self.max_connections // (len(self._shares) + 1)))
+                share = BandwidthShare(min(fair, max(self.free_connections // 2, 1)))
+                self._shares.append(share)
+                self._rebalance()
+        finally:
+            unregister_cancel()
+        try:
+            yield share
+        finally:
+            with self._released:
+                self._shares.remove(share)
+                self._rebalance()
+                self._released.notify_all()
+
+    def _wake(self) -> None:
+        with self._released:
+            self._released.notify_all()
+
+    def _rebalance(self) -> None:
+        """Lock must be held, so concurrent rebalances can't apply stale splits out of order."""
+        if not self._shares:
+            return
+
+        rate = max(self.max_rate // len(self._shares), 1) if self.max_rate else None
+        self.logger.debug(f"Rebalanced bandwidth over {len(self._shares)} downloads: "
+                          f"{[share.connections for share in self._shares]} connections, {rate} B/s each")
+        for share in self._shares:
+            share._update(rate)
\ No newline at end of file
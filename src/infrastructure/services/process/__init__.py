@@ -0,0 +1,3 @@
+from .child_process_terminator import ChildProcessTerminator
+
+__all__ = ["ChildProcessTerminator"]
\ No newline at end of file
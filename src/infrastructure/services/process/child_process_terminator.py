@@ -0,0 +1,56 @@
+import os
+import signal
+import logging
+from pathlib import Path
+from logging import Logger
+from typing import Iterator, Optional, Tuple
+
+PROC_DIR = Path("/proc")
+
+class ChildProcessTerminator():
+    """Terminates child processes of this process (aria2c, ffmpeg) that yt-dlp started for a job.
+
+    yt-dlp doesn't expose the processes it spawns, so they are found in /proc by their parent pid
+    and by something unique to the job in their command line, like its temp folder.
+    Does nothing where /proc isn't available.
+    """
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def terminate(self, match: str) -> int:
+        """
+        Send SIGTERM to every child process whose command line contains match.
+
+        Returns:
+            How many processes were signalled
+        """
+        terminated = 0
+        for pid, cmdline in self._children():
+            if match not in cmdline:
+                continue
+            try:
+                os.kill(pid, signal.SIGTERM)
+                terminated += 1
+                self.logger.debug(f"Terminated child process {pid}: {cmdline[:120]}")
+            except ProcessLookupError:
+                continue
+        return terminated
+
+    def _children(self) -> Iterator[Tuple[int, str]]:
+        if not PROC_DIR.is_dir():
+            return
+        parent_pid = os.getpid()
+        for entry in PROC_DIR.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                # the command name in stat may hold spaces, the parent pid is the 2nd field after it
+                stat = (entry / "stat").read_text()
+                ppid = int(stat.rsplit(")", 1)[1].split()[1])
+                if ppid != parent_pid:
+                    continue
+                cmdline = (entry / "cmdline").read_bytes().replace(b"\0", b" ").decode(errors="replace")
+            except (OSError, IndexError, ValueError):
+                continue
+            yield int(entry.name), cmdline
\ No newline at end of file
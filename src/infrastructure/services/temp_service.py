@@ -15,17 +15,22 @@ class TempService():
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._preserved: set[Path] = set()
 
         self.logger.info(f"TempService initialized at {self.base_dir}")
 
     @asynccontextmanager
-    async def create_session(self) -> AsyncGenerator[Path, None]:
+    async def create_session(self, session_id: Optional[str] = None) -> AsyncGenerator[Path, None]:
+        """Create a temp folder removed at the end of the session.
+
+        Passing the id of an earlier session reopens its folder with whatever was left in it.
+        """
         temp_path = None
 
         try:
-            session_id = uuid.uuid4().hex
+            session_id = session_id or uuid.uuid4().hex
             temp_path = self.base_dir / f"kaoruko_{session_id}"
-            temp_path.mkdir()
+            temp_path.mkdir(exist_ok=True)
 
             self.logger.debug(f"Created temp directory: {temp_path}")
 
@@ -39,7 +44,10 @@ class TempService():
             raise
 
         finally:
-            if temp_path and temp_path.exists():
+            if temp_path in self._preserved:
+                self._preserved.discard(temp_path)
+                self.logger.debug(f"Kept temp directory for later: {temp_path}")
+            elif temp_path and temp_path.exists():
                 try:
                     shutil.rmtree(temp_path)
                     self.logger.debug(f"Cleaned up temp directory: {temp_path}")
@@ -47,3 +55,7 @@ class TempService():
                     self.logger.warning(
                         f"Failed to cleanup temp directory {temp_path}: {error}"
                     )
+
+    def preserve(self, temp_path: Path) -> None:
+        """Keep the folder of a running session when it ends, so a later session can reopen it."""
+        self._preserved.add(temp_path)
\ No newline at end of file
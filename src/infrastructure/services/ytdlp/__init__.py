@@ -1,7 +1,25 @@
 from .ytdlp_format_mapper import YtdlpFormatMapper
+from .ytdlp_size_fitter import YtdlpSizeFitter
+from .ytdlp_deadline_fitter import YtdlpDeadlineFitter
+from .ytdlp_error_classifier import YtdlpErrorClassifier
+from .ytdlp_profile_selector import DownloaderProfile, YtdlpProfileSelector
+from .ytdlp_aria2_downloader import Aria2RpcFD, Aria2RpcYoutubeDL
 from .ytdlp_download_service import YtdlpDownloadService
+from .ytdlp_playlist_expander import YtdlpPlaylistExpander
+from .ytdlp_cache_warmer import YtdlpCacheWarmer
+from .ytdlp_url_matcher import YtdlpUrlMatcher
 
 __all__ = [
+    "Aria2RpcFD",
+    "Aria2RpcYoutubeDL",
+    "DownloaderProfile",
+    "YtdlpCacheWarmer",
+    "YtdlpDeadlineFitter",
     "YtdlpDownloadService",
+    "YtdlpErrorClassifier",
     "YtdlpFormatMapper",
+    "YtdlpPlaylistExpander",
+    "YtdlpProfileSelector",
+    "YtdlpSizeFitter",
+    "YtdlpUrlMatcher",
 ]
\ No newline at end of file
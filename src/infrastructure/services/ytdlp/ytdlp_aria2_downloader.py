@@ -0,0 +1,129 @@
+import os
+import time
+import yt_dlp
+from typing import Any, Dict
+from yt_dlp.downloader.common import FileDownloader
+from src.infrastructure.services.aria2 import Aria2RpcDaemon
+from src.core.constants import DEFAULT_ARIA2_POLL_INTERVAL, DEFAULT_ARIA2_PRIORITY_SIZE
+
+STATUS_KEYS = ["status", "totalLength", "completedLength", "downloadSpeed", "errorCode", "errorMessage"]
+
+class Aria2RpcFD(FileDownloader):
+    """yt-dlp downloader handing a resolved URL to the shared aria2c daemon and following it until it's done.
+
+    Progress hooks are called on every status poll, so cancelling (a hook raising) removes the download
+    from the daemon. The per-download rate follows yt-dlp's ratelimit, which the bandwidth budget updates.
+    """
+
+    FD_NAME = "aria2c-rpc"
+
+    def __init__(self, ydl: yt_dlp.YoutubeDL, params: Dict[str, Any], daemon: Aria2RpcDaemon,
+                 poll_interval: float = DEFAULT_ARIA2_POLL_INTERVAL,
+                 priority_size: int = DEFAULT_ARIA2_PRIORITY_SIZE) -> None:
+        super().__init__(ydl, params)
+        self.daemon = daemon
+        self.poll_interval = poll_interval
+        self.priority_size = priority_size
+
+    @staticmethod
+    def supports(info_dict: Dict[str, Any]) -> bool:
+        """Single-file HTTP downloads only, fragmented ones stay with yt-dlp's own downloaders."""
+        return info_dict.get('protocol') in ('http', 'https') and 'fragments' not in info_dict
+
+    def real_download(self, filename: str, info_dict: Dict[str, Any]) -> bool:
+        self.report_destination(filename)
+        tmpfilename = self.temp_name(filename)
+        url = info_dict['url']
+        expected_size = info_dict.get('filesize') or info_dict.get('filesize_approx')
+        # small downloads jump the daemon's queue, they're done before a big one would notice
+        position = 0 if expected_size and expected_size <= self.priority_size else None
+
+        started = time.time()
+        rate = self._get_rate()
+        gid = self.daemon.add_uri([url], self._get_options(tmpfilename, info_dict, rate), position)
+        try:
+            while True:
+                status = self.daemon.tell_status(gid, STATUS_KEYS)
+                downloaded_bytes = int(status.get('completedLength') or 0)
+                total_bytes = int(status.get('totalLength') or 0) or None
+                if status['status'] == 'complete':
+                    break
+                if status['status'] in ('error', 'removed'):
+                    self.report_error(f"aria2c failed with code {status.get('errorCode')}: {status.get('errorMessage')}")
+                    return False
+
+                speed = int(status.get('downloadSpeed') or 0) or None
+                self._hook_progress({
+                    'status': 'downloading',
+                    'filename': filename,
+                    'tmpfilename': tmpfilename,
+                    'downloaded_bytes': downloaded_bytes,
+                    'total_bytes': total_bytes,
+                    'speed': speed,
+                    'eta': self.calc_eta(speed, total_bytes - downloaded_bytes) if total_bytes else None,
+                    'elapsed': time.time() - started,
+                }, info_dict)
+
+                if self._get_rate() != rate:
+                    rate = self._get_rate()
+                    self.daemon.change_option(gid, {'max-download-limit': str(rate or 0)})
+                time.sleep(self.poll_interval)
+        except BaseException:
+            self.daemon.remove(gid)
+            raise
+
+        file_size = os.path.getsize(tmpfilename)
+        self.try_rename(tmpfilename, filename)
+        self._hook_progress({
+            'status': 'finished',
+            'filename': filename,
+            'downloaded_bytes': file_size,
+            'total_bytes': file_size,
+            'elapsed': time.time() - started,
+        }, info_dict)
+        return True
+
+    def _get_rate(self) -> int | None:
+        """Bytes per second for the whole download, ratelimit is the limit of each of its connections."""
+        ratelimit = self.params.get('ratelimit')
+        if not ratelimit:
+            return None
+        return ratelimit * self._get_connections()
+
+    def _get_connections(self) -> int:
+        return self.params.get('concurrent_fragment_downloads') or 1
+
+    def _get_options(self, tmpfilename: str, info_dict: Dict[str, Any], rate: int | None) -> Dict[str, Any]:
+        headers = [f"{key}: {value}" for key, value in (info_dict.get('http_headers') or {}).items()]
+        cookie_header = self.ydl.cookiejar.get_cookie_header(info_dict['url'])
+        if cookie_header:
+            headers.append(f"Cookie: {cookie_header}")
+        connections = str(self._get_connections())
+        return {
+            'dir': os.path.dirname(os.path.abspath(tmpfilename)),
+            'out': os.path.basename(tmpfilename),
+            'header': headers,
+            'split': connections,
+            'max-connection-per-server': connections,
+            'min-split-size': '1M',
+            'max-download-limit': str(rate or 0),
+        }
+
+class Aria2RpcYoutubeDL(yt_dlp.YoutubeDL):
+    """YoutubeDL that sends single-file HTTP downloads to the shared aria2c daemon instead of spawning aria2c."""
+
+    def __init__(self, params: Dict[str, Any], daemon: Aria2RpcDaemon) -> None:
+        super().__init__(params)
+        self.daemon = daemon
+
+    def dl(self, name: str, info: Dict[str, Any], subtitle: bool = False, test: bool = False) -> bool:
+        if test or subtitle or name == '-' or not info.get('url') or not Aria2RpcFD.supports(info):
+            return super().dl(name, info, subtitle, test)
+
+        fd = Aria2RpcFD(self, self.params, self.daemon)
+        for hook in self._progress_hooks:
+            fd.add_progress_hook(hook)
+        new_info = self._copy_infodict(info)
+        if new_info.get('http_headers') is None:
+            new_info['http_headers'] = self._calc_headers(new_info)
+        return fd.download(name, new_info, subtitle)
\ No newline at end of file
@@ -0,0 +1,108 @@
+import time
+import yt_dlp
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from logging import Logger
+from typing import Any, Dict, Optional, Tuple
+try:
+    # the solver scripts have to match the version and hashes the installed yt-dlp expects,
+    # this module is private and may move in another version, the warm-up is skipped then
+    from yt_dlp.extractor.youtube.jsc._builtin.vendor import HASHES as EJS_HASHES, VERSION as EJS_VERSION
+except ImportError:
+    EJS_HASHES, EJS_VERSION = None, None
+from src.core.constants import DEFAULT_YT_DLP_SETTINGS, EJS_VENDOR_DIR, EJS_RELEASE_URL, DEFAULT_WARMUP_URL
+
+EJS_CACHE_SECTION = "challenge-solver"
+# script type -> (file name, variant) candidates, the minified release files first
+EJS_SCRIPT_FILES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "lib": (("yt.solver.lib.min.js", "minified"), ("yt.solver.lib.js", "unminified")),
+    "core": (("yt.solver.core.min.js", "minified"), ("yt.solver.core.js", "unminified")),
+}
+
+class YtdlpCacheWarmer():
+    """Fills the shared yt-dlp cache directory before the first extraction needs it.
+
+    The EJS challenge solver scripts are taken from the cache when still valid, else from the
+    vendored copy, else from the GitHub release; all of them are checked against the hashes of the
+    installed yt-dlp. Then one extraction of the warm-up URL caches the current player functions.
+    Offline, only the cache and the vendored copy are used.
+    """
+
+    def __init__(self, vendor_dir: Path = EJS_VENDOR_DIR, warmup_url: str | None = DEFAULT_WARMUP_URL,
+                 offline: bool = False, ydl_opts: Optional[Dict[str, Any]] = None, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.vendor_dir = vendor_dir
+        self.warmup_url = warmup_url
+        self.offline = offline
+        self.ydl_opts = ydl_opts if ydl_opts is not None else DEFAULT_YT_DLP_SETTINGS
+
+    async def warm_up(self) -> Dict[str, str]:
+        """Returns where every solver script came from ("cache", "vendored", "remote" or "missing")."""
+        return await asyncio.to_thread(self._warm_up_sync)
+
+    def _warm_up_sync(self) -> Dict[str, str]:
+        if EJS_VERSION is None:
+            self.logger.info("This yt-dlp has no EJS solver scripts to check, skipping warm-up")
+            return {}
+        start_time = time.perf_counter()
+        with yt_dlp.YoutubeDL({**self.ydl_opts, 'logger': self.logger, 'quiet': True}) as ydl:
+            if not ydl.cache.enabled:
+                self.logger.info("yt-dlp cache is disabled, skipping warm-up")
+                return {}
+
+            sources = {script_type: self._ensure_script(ydl, script_type) for script_type in EJS_SCRIPT_FILES}
+            if self.warmup_url and not self.offline:
+                try:
+                    ydl.extract_info(self.warmup_url, download=False)
+                except Exception as error:
+                    self.logger.warning(f"Player cache warm-up with {self.warmup_url} failed: {error}")
+
+        self.logger.info(f"yt-dlp cache warmed up in {time.perf_counter() - start_time:.2f}s, solver scripts: {sources}")
+        return sources
+
+    def _ensure_script(self, ydl: yt_dlp.YoutubeDL, script_type: str) -> str:
+        cached = ydl.cache.load(EJS_CACHE_SECTION, script_type)
+        if cached and cached.get("version") == EJS_VERSION and self._is_valid(script_type, cached.get("code"), cached.get("variant")):
+            return "cache"
+
+        for filename, variant in EJS_SCRIPT_FILES[script_type]:
+            path = self.vendor_dir / filename
+            if not path.is_file():
+                continue
+            code = path.read_text(encoding="utf-8")
+            if self._is_valid(script_type, code, variant):
+                self._store(ydl, script_type, code, variant)
+                return "vendored"
+            self.logger.warning(f"Vendored solver script {path} doesn't match yt-dlp's EJS {EJS_VERSION}, ignoring it")
+
+        if self.offline or "ejs:github" not in ydl.params.get("remote_components", ()):
+            self.logger.warning(f"No usable {script_type} solver script, the first extraction will have to get it")
+            return "missing"
+
+        filename, variant = EJS_SCRIPT_FILES[script_type][0]
+        url = EJS_RELEASE_URL.format(version=EJS_VERSION, filename=filename)
+        try:
+            with ydl.urlopen(url) as response:
+                code = response.read().decode("utf-8")
+        except Exception as error:
+            self.logger.warning(f"Failed to fetch solver script {url}: {error}")
+            return "missing"
+        if not self._is_valid(script_type, code, variant):
+            self.logger.warning(f"Solver script {url} failed hash verification")
+            return "missing"
+        self._store(ydl, script_type, code, variant)
+        return "remote"
+
+    @staticmethod
+    def _is_valid(script_type: str, code: str | None, variant: str | None) -> bool:
+        filename = next((name for name, file_variant in EJS_SCRIPT_FILES[script_type] if file_variant == variant), None)
+        if not code or filename is None or filename not in EJS_HASHES:
+            return False
+        return hashlib.sha3_512(code.encode()).hexdigest() == EJS_HASHES[filename]
+
+    @staticmethod
+    def _store(ydl: yt_dlp.YoutubeDL, script_type: str, code: str, variant: str) -> None:
+        # same layout yt-dlp writes after fetching a release itself
+        ydl.cache.store(EJS_CACHE_SECTION, script_type, {"version": EJS_VERSION, "variant": variant, "code": code})
\ No newline at end of file
@@ -0,0 +1,77 @@
+import logging
+from logging import Logger
+from typing import Any, Dict, Optional
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.infrastructure.services.ytdlp.ytdlp_format_mapper import YtdlpFormatMapper
+from src.infrastructure.services.ytdlp.ytdlp_size_fitter import YtdlpSizeFitter
+from src.core.constants import DEFAULT_PROCESSING_RATES, DEFAULT_DEADLINE_MARGIN
+
+class YtdlpDeadlineFitter():
+    """Picks the highest quality whose download and post-processing are expected to end before a deadline.
+
+    A quality takes the estimated size of the formats planned for it over the expected throughput,
+    plus the post-processing its plan needs, at a rate per processing mode.
+    """
+
+    def __init__(self, processing_rates: Dict[str, int] = DEFAULT_PROCESSING_RATES,
+                 margin: float = DEFAULT_DEADLINE_MARGIN, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.processing_rates = processing_rates
+        self.margin = margin
+
+    def select_quality(self, info: Dict[str, Any], format_value: Formats | None, ceiling: Quality, deadline: float,
+                       throughput: float, fraction: float | None = None) -> Quality:
+        """
+        Args:
+            info: Extracted (not downloaded) yt-dlp info dict
+            format_value: Requested output format
+            ceiling: Highest quality that may be picked
+            deadline: Seconds the download and its post-processing may take
+            throughput: Expected download speed in bytes per second
+            fraction: Share of the media downloaded, for clips
+        Returns:
+            The highest fitting quality, the lowest one if none fits, or the ceiling
+            (at most the default quality) when no size can be estimated
+        """
+        if format_value is None or format_value.is_audio():
+            # audio has no quality to lower
+            return ceiling
+
+        budget = deadline * self.margin
+        candidates = [quality for quality in Quality if self._height(quality) <= self._height(ceiling)]
+        estimated = False
+        for quality in sorted(candidates, key=self._height, reverse=True):
+            seconds = self.estimate_seconds(info, format_value, quality, throughput, fraction)
+            if seconds is None:
+                continue
+            estimated = True
+            if seconds <= budget:
+                self.logger.info(f"Picked {quality.value}, expected to take {seconds:.0f}s of {deadline:.0f}s")
+                return quality
+
+        if not estimated:
+            return min(ceiling, Quality.DEFAULT, key=self._height)
+        lowest = min(candidates, key=self._height)
+        self.logger.info(f"No quality is expected to take less than {deadline:.0f}s, using {lowest.value}")
+        return lowest
+
+    def estimate_seconds(self, info: Dict[str, Any], format_value: Formats, quality: Quality, throughput: float,
+                         fraction: float | None = None) -> float | None:
+        """Expected seconds to download and post-process a quality, None if its size is unknown."""
+        plan = YtdlpFormatMapper.plan_format(info, format_value, quality, logger=self.logger)
+        if plan is None or not plan.selected_formats:
+            return None
+        sizes = [YtdlpSizeFitter.estimate_size(format_info, info.get('duration')) for format_info in plan.selected_formats]
+        if None in sizes:
+            return None
+
+        size = sum(sizes) * (fraction or 1.0)
+        seconds = size / throughput
+        if len(plan.selected_formats) > 1 or plan.postprocessors:
+            seconds += size / self.processing_rates[plan.mode.value]
+        return seconds
+
+    @staticmethod
+    def _height(quality: Quality) -> int:
+        return int(quality.value[:-1])
\ No newline at end of file
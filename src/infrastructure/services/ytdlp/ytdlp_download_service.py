@@ -1,115 +1,678 @@
+import time
 import yt_dlp
 import asyncio
 import logging
+import threading
 from typing import Optional
 from pathlib import Path
 from logging import Logger
-from typing import Any, Dict
-from src.core.constants import DEFAULT_YT_DLP_SETTINGS
-from src.infrastructure.services.ytdlp import YtdlpFormatMapper
+from typing import Any, Dict, Tuple
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, wait
+from src.core.constants import (
+    DEFAULT_YT_DLP_SETTINGS,
+    DEFAULT_INFO_CACHE_TTL,
+    DEFAULT_INFO_CACHE_SIZE,
+    DEFAULT_DOWNLOAD_RETRIES,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_RETRY_MAX_BACKOFF,
+    DEFAULT_ARIA2C_MIN_SPLIT_SIZE,
+    DEFAULT_ASSUMED_THROUGHPUT,
+)
+from src.infrastructure.services.ytdlp import (
+    Aria2RpcYoutubeDL,
+    DownloaderProfile,
+    YtdlpDeadlineFitter,
+    YtdlpErrorClassifier,
+    YtdlpFormatMapper,
+    YtdlpProfileSelector,
+    YtdlpSizeFitter,
+)
+from src.infrastructure.services.ytdlp.ytdlp_format_mapper import FormatPlan
 from src.domain.enum import Formats, Quality
-from src.domain.models import DownloadedFile
+from src.domain.models import CancellationToken, DownloadedFile, GrowingFile, MediaProbe, PendingProcessing, ProgressTracker, TimeRange
+from src.domain.exceptions import DownloadCancelled
+from src.infrastructure.services.process import ChildProcessTerminator
+from src.infrastructure.services.network import BandwidthBudget, BandwidthShare
+from src.infrastructure.services.aria2 import Aria2RpcDaemon
+
+STREAMABLE_PROTOCOLS = {"http", "https"}
+# files are named after the media id while downloading, so a retry finds and resumes the partial data
+DOWNLOAD_OUTTMPL = '%(id)s.%(ext)s'
+RAW_OUTTMPL = '%(id)s.f%(format_id)s.%(ext)s'
+TITLED_OUTTMPL = '%(title)s.%(ext)s'
+RESUME_STATE_SUFFIXES = {".ytdl", ".aria2"}
 
 class YtdlpDownloadService():
     """Service for downloading files using yt-dlp."""
 
-    def __init__(self, ytdlp_format_mapper: YtdlpFormatMapper, logger: Optional[Logger] = None) -> None:
+    def __init__(self, ytdlp_format_mapper: YtdlpFormatMapper, size_fitter: Optional[YtdlpSizeFitter] = None,
+                 info_cache_ttl: float = DEFAULT_INFO_CACHE_TTL, defer_postprocessing: bool = False,
+                 process_terminator: Optional[ChildProcessTerminator] = None,
+                 error_classifier: Optional[YtdlpErrorClassifier] = None, max_retries: int = DEFAULT_DOWNLOAD_RETRIES,
+                 retry_backoff: float = DEFAULT_RETRY_BACKOFF, bandwidth_budget: Optional[BandwidthBudget] = None,
+                 profile_selector: Optional[YtdlpProfileSelector] = None,
+                 deadline_fitter: Optional[YtdlpDeadlineFitter] = None,
+                 aria2_daemon: Optional[Aria2RpcDaemon] = None, logger: Optional[Logger] = None) -> None:
+        """
+        Args:
+            defer_postprocessing: Only fetch the raw streams and return what is left to do as
+                DownloadedFile.pending_processing, instead of running ffmpeg inside the yt-dlp run
+            max_retries: Attempts made again after a transient error, resuming the partial files
+            retry_backoff: Seconds before the first retry, doubled on every next one
+            bandwidth_budget: Connections and bytes per second shared with the other downloads
+            profile_selector: Picks the downloader (aria2c or native) per site from measured throughput
+            deadline_fitter: Picks the quality of downloads given a deadline
+            aria2_daemon: If set, downloads meant for aria2c go to this shared daemon instead of their own process
+        """
         self.logger = logger or logging.getLogger(self.__class__.__name__)
         self.ytdlp_format_mapper = ytdlp_format_mapper
+        self.size_fitter = size_fitter or YtdlpSizeFitter()
+        self.defer_postprocessing = defer_postprocessing
+        self.process_terminator = process_terminator or ChildProcessTerminator()
+        self.error_classifier = error_classifier or YtdlpErrorClassifier()
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.bandwidth_budget = bandwidth_budget or BandwidthBudget()
+        self.profile_selector = profile_selector or YtdlpProfileSelector()
+        self.deadline_fitter = deadline_fitter or YtdlpDeadlineFitter()
+        self.aria2_daemon = aria2_daemon
+        self.info_cache_ttl = info_cache_ttl
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._info_cache_lock = threading.Lock()
         self.logger.info("YtdlpDownloadService initialized")
 
     def _get_ydl_opts(self, format_value: Formats | None, quality: Quality, output_folder: Path) -> Dict[str, Any]:
         """
         Get yt-dlp options for downloading.
-        
+
         Args:
             format_value: Format to download in
             quality: Quality for video
             output_folder: Folder where the file will be downloaded
-            
+
         Returns:
             Dictionary with yt-dlp options
         """
-        format_options = self.ytdlp_format_mapper.map_format(format_value, quality)
+        format_options = dict(self.ytdlp_format_mapper.map_format(format_value, quality))
 
         if 'post' in format_options:
             format_options['postprocessors'] = format_options.pop('post')
-        
+
         if 'is_audio' in format_options:
             format_options.pop('is_audio')
 
         return {
-            'outtmpl': str(output_folder / '%(title)s.%(ext)s'),
+            'outtmpl': str(output_folder / DOWNLOAD_OUTTMPL),
             **DEFAULT_YT_DLP_SETTINGS,
             'logger': self.logger,
             **format_options,
         }
 
-    def _progress_hook(self, d: Dict[str, Any]) -> None:
+    def _get_budget_opts(self, ydl_opts: Dict[str, Any], share: BandwidthShare,
+                         max_connections: int | None = None, streams: int = 1) -> Dict[str, Any]:
+        """Options that keep the download inside its share of the bandwidth budget.
+
+        yt-dlp applies ratelimit to every fragment thread on its own, so it gets the per connection rate,
+        aria2c gets the whole rate as its overall limit (the last occurrence of an option wins).
+        Streams fetched at the same time split the connections between them.
+        """
+        connections = max(min(share.connections, max_connections or share.connections) // streams, 1)
+        budget_opts: Dict[str, Any] = {'concurrent_fragment_downloads': connections, 'ratelimit': share.stream_rate}
+        if 'external_downloader' in ydl_opts:
+            aria2c_args = ['-x', str(connections), '-s', str(connections), '-j', str(connections),
+                           '-k', DEFAULT_ARIA2C_MIN_SPLIT_SIZE]
+            if share.rate is not None:
+                aria2c_args.append(f'--max-overall-download-limit={share.rate}')
+            budget_opts['external_downloader_args'] = {'default': aria2c_args}
+        return {**ydl_opts, **budget_opts}
+
+    def _get_range_opts(self, ydl_opts: Dict[str, Any], time_range: TimeRange) -> Dict[str, Any]:
+        """Options that only fetch the part of the media covered by time_range.
+
+        yt-dlp hands sections to ffmpeg, which seeks in the source (for HLS/DASH it skips to the
+        segment holding the start), so only the data around the range is downloaded.
+        Cuts land exactly on the requested times, ffmpeg re-encodes around them to put keyframes there.
+        """
+        end = time_range.end if time_range.end is not None else float('inf')
+        return {
+            **ydl_opts,
+            'download_ranges': yt_dlp.utils.download_range_func(None, [(time_range.start, end)]),
+            'force_keyframes_at_cuts': True,
+        }
+
+    def _get_metered_opts(self, ydl_opts: Dict[str, Any], meter: Dict[str, float]) -> Dict[str, Any]:
+        """Options with a progress hook that adds up the bytes fetched and the time spent fetching them.
+
+        Only the transfer is measured, not the extraction or post-processing, and resumed bytes are left out.
+        """
+        resumed_bytes: Dict[str, int] = {}
+        # streams fetched side by side finish in their own threads
+        lock = threading.Lock()
+
+        def _measure(d: Dict[str, Any]) -> None:
+            filename = d.get('filename')
+            if d.get('status') == 'downloading':
+                resumed_bytes.setdefault(filename, d.get('downloaded_bytes') or 0)
+            elif d.get('status') == 'finished':
+                downloaded_bytes = d.get('downloaded_bytes') or d.get('total_bytes') or 0
+                with lock:
+                    meter['bytes'] += max(downloaded_bytes - resumed_bytes.get(filename, 0), 0)
+                    meter['elapsed'] += d.get('elapsed') or 0
+
+        return {**ydl_opts, 'progress_hooks': [*ydl_opts.get('progress_hooks', []), _measure]}
+
+    def _get_streaming_opts(self, ydl_opts: Dict[str, Any], growing_file: GrowingFile) -> Dict[str, Any]:
+        """Options that make yt-dlp write the file sequentially, in place, and never touch it afterwards.
+
+        aria2c writes several ranges at once, .part files get renamed and fixups rewrite the file,
+        all of which would break a reader following the file while it grows.
+        """
+        def _report_path(d: Dict[str, Any]) -> None:
+            filename = d.get('tmpfilename') or d.get('filename')
+            if d.get('status') == 'downloading' and filename:
+                growing_file.set_path(Path(filename))
+
+        streaming_opts = {key: value for key, value in ydl_opts.items()
+                          if key not in ('external_downloader', 'external_downloader_args')}
+        return {
+            **streaming_opts,
+            # the file is uploaded while written and never renamed, so it gets its final name right away
+            'outtmpl': str(Path(ydl_opts['outtmpl']).parent / TITLED_OUTTMPL),
+            'nopart': True,
+            'fixup': 'never',
+            'postprocessors': [],
+            'progress_hooks': [*ydl_opts.get('progress_hooks', []), _report_path],
+        }
+
+    def _get_raw_opts(self, ydl_opts: Dict[str, Any], plan: FormatPlan, output_folder: Path) -> Dict[str, Any]:
+        """Options that download every planned format on its own, without merging or post-processing it."""
+        raw_opts = {key: value for key, value in ydl_opts.items() if key != 'merge_output_format'}
+        return {
+            **raw_opts,
+            'format': ",".join(str(f['format_id']) for f in plan.selected_formats),
+            'outtmpl': str(output_folder / RAW_OUTTMPL),
+            'postprocessors': [],
+            'fixup': 'never',
+        }
+
+    def _get_cancellable_opts(self, ydl_opts: Dict[str, Any], cancellation: CancellationToken) -> Dict[str, Any]:
+        """Options with a progress hook that stops the yt-dlp run once the job is cancelled."""
+        def _check_cancelled(d: Dict[str, Any]) -> None:
+            cancellation.raise_if_cancelled()
+
+        return {**ydl_opts, 'progress_hooks': [*ydl_opts.get('progress_hooks', []), _check_cancelled]}
+
+    def _get_progress_opts(self, ydl_opts: Dict[str, Any], progress: ProgressTracker) -> Dict[str, Any]:
+        """Options with a progress hook that reports the counters of the running download to progress.
+
+        yt-dlp calls it on every block read, so it only copies what yt-dlp already computed.
+        The counters of every file of the download (like video and audio streams) are added up.
+        """
+        files: Dict[str, Tuple[int, int | None, float | None]] = {}
+
+        def _report_progress(d: Dict[str, Any]) -> None:
+            if d['status'] != 'downloading':
+                return
+            files[d.get('filename')] = (d.get('downloaded_bytes') or 0, d.get('total_bytes') or d.get('total_bytes_estimate'),
+                                        d.get('speed'))
+            # streams fetched side by side add entries from other threads, a copy is taken in one step
+            counters = tuple(files.values())
+            downloaded_bytes = sum(counter[0] for counter in counters)
+            total_bytes = sum(counter[1] or counter[0] for counter in counters)
+            speed = sum(counter[2] or 0 for counter in counters)
+            eta = (total_bytes - downloaded_bytes) / speed if speed else None
+            progress.update(downloaded_bytes, total_bytes or None, speed or None, eta)
+
+        return {**ydl_opts, 'progress_hooks': [*ydl_opts.get('progress_hooks', []), _report_progress]}
+
+    async def probe(self, url: str, format_value: Formats | None, quality: Quality,
+                    cancellation: CancellationToken | None = None) -> MediaProbe:
         """
-        Hook to log download progress.
-        
+        Extract the media info without downloading and describe what a download would produce.
+
+        The extracted info is kept for a while, so a download right after the probe doesn't extract again.
+
         Args:
-            d: Dictionary containing progress information
+            url: URL to probe
+            format_value: Format that would be downloaded
+            quality: Quality for video
+            cancellation: If set, cancelling it stops waiting for the extraction, which finishes in the background
+
+        Returns:
+            MediaProbe with the estimated size and whether post-processing is needed
+
+        Raises:
+            DownloadCancelled: If cancellation is cancelled before the probe is done
         """
-        ...
+        loop = asyncio.get_running_loop()
+        if cancellation is None:
+            return await loop.run_in_executor(None, self._probe_sync, url, format_value, quality)
 
-    async def download(self, url: str, format_value: Formats | None, quality: Quality, output_folder: Path) -> DownloadedFile:
+        cancellation.raise_if_cancelled()
+        probe = loop.run_in_executor(None, self._probe_sync, url, format_value, quality)
+        unregister_cancel = cancellation.on_cancel(lambda reason: loop.call_soon_threadsafe(probe.cancel))
+        try:
+            return await probe
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            cancellation.raise_if_cancelled()
+            raise
+        finally:
+            unregister_cancel()
+
+    def _probe_sync(self, url: str, format_value: Formats | None, quality: Quality) -> MediaProbe:
+        ydl_opts = self._get_ydl_opts(format_value, quality, Path("."))
+        info = self._extract_info(url, ydl_opts)
+        plan = self.ytdlp_format_mapper.plan_format(info, format_value, quality)
+
+        if plan:
+            requested_formats = list(plan.selected_formats)
+            has_postprocessors = bool(plan.postprocessors)
+        else:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                selected = ydl.process_ie_result(ydl.sanitize_info(info), download=False)
+            requested_formats = selected.get('requested_formats') or [selected]
+            target_ext = format_value.value if format_value else selected.get('ext')
+            has_postprocessors = selected.get('ext') != target_ext or bool(format_value and format_value.is_audio())
+
+        sizes = [self.size_fitter.estimate_size(f, info.get('duration')) for f in requested_formats]
+        estimated_size = int(sum(sizes)) if all(size is not None for size in sizes) else None
+
+        requires_postprocessing = (
+            len(requested_formats) > 1
+            or has_postprocessors
+            or any(f.get('protocol') not in STREAMABLE_PROTOCOLS for f in requested_formats)
+        )
+
+        return MediaProbe(
+            title=info.get('title'),
+            duration=info.get('duration'),
+            estimated_size=estimated_size,
+            extension=requested_formats[0].get('ext') if len(requested_formats) == 1 else None,
+            requires_postprocessing=requires_postprocessing,
+        )
+
+    async def download(self, url: str, format_value: Formats | None, quality: Quality, output_folder: Path,
+                       max_filesize: int | None = None, growing_file: GrowingFile | None = None,
+                       cancellation: CancellationToken | None = None, time_range: TimeRange | None = None,
+                       progress: ProgressTracker | None = None, deadline: float | None = None) -> DownloadedFile:
         """
         Download file from URL using yt-dlp.
-        
+
         Args:
             url: URL to download from
             format_value: Format to download in
             quality: Quality for video
             output_folder: Folder where the file will be saved
-            
+            max_filesize: If set, prefer the best format whose estimated size fits it
+            growing_file: If set, the file is written sequentially and reported to it while downloading
+            cancellation: If set, cancelling it stops the yt-dlp run and the processes it started
+            time_range: If set, only this part of the media is downloaded
+            progress: If set, receives the downloaded bytes, speed and ETA while downloading
+            deadline: If set, quality is only the ceiling, the highest quality expected to be downloaded
+                and post-processed within these seconds is picked
+
         Returns:
             Path to the downloaded file
-            
+
         Raises:
+            DownloadCancelled: If the download was cancelled
             Exception: If download fails
         """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._download_sync, url, format_value, quality, output_folder)
-    
-    def _download_sync(self, url: str, format_value: Formats | None, quality: Quality, output_folder: Path) -> DownloadedFile:
+        return await loop.run_in_executor(None, self._download_sync, url, format_value, quality, output_folder,
+                                          max_filesize, growing_file, cancellation, time_range, progress, deadline)
+
+    def _download_sync(self, url: str, format_value: Formats | None, quality: Quality, output_folder: Path,
+                       max_filesize: int | None = None, growing_file: GrowingFile | None = None,
+                       cancellation: CancellationToken | None = None, time_range: TimeRange | None = None,
+                       progress: ProgressTracker | None = None, deadline: float | None = None) -> DownloadedFile:
         self.logger.info(f"Starting download from: {url}")
-        
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+
         if not output_folder.exists():
             output_folder.mkdir(parents=True, exist_ok=True)
             self.logger.debug(f"Created output folder: {output_folder}")
 
         ydl_opts = self._get_ydl_opts(format_value, quality, output_folder)
-        
+        if progress is not None:
+            ydl_opts = self._get_progress_opts(ydl_opts, progress)
+        unregister_cancel = lambda: None
+        if cancellation is not None:
+            ydl_opts = self._get_cancellable_opts(ydl_opts, cancellation)
+            # aria2c doesn't call progress hooks, so it (and ffmpeg) has to be stopped from outside
+            unregister_cancel = cancellation.on_cancel(
+                lambda reason: self.process_terminator.terminate(str(output_folder))
+            )
+
+        retries = 0
+        bytes_salvaged = 0
+        # largest size of every partial file counted so far, a retry only adds what grew since
+        counted_sizes: Dict[str, int] = {}
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-               
-                info = ydl.extract_info(url, download=True)
-                
-                if info is None:
-                    raise ValueError("Failed to extract video information")
-                
-                if 'requested_downloads' in info and len(info['requested_downloads']) > 0:
-                    filename = info['requested_downloads'][0].get('filepath')
-                    if filename:
-                        file_path = Path(filename)
-                        if file_path.exists():
-                            file_size = file_path.stat().st_size
-                            self.logger.info(f"Successfully downloaded file to: {file_path}")
-                            return DownloadedFile(file_path=file_path, file_size=file_size)
-                
-                if not file_path.exists():
-                    raise FileNotFoundError(f"Downloaded file not found at: {file_path}")
-                
-                file_size = file_path.stat().st_size
-                self.logger.info(f"Successfully downloaded file to: {file_path}")
-                return DownloadedFile(file_path=file_path, file_size=file_size)
-                
-        except yt_dlp.DownloadError as error:
-            self.logger.error(f"yt-dlp download error: {error}", exc_info=True)
-            raise Exception(f"Failed to download from {url}: {error}") from error
-            
+            with self.bandwidth_budget.acquire(cancellation) as share:
+                while True:
+                    # whatever is already in the folder (from a failed attempt or an interrupted job) is resumed
+                    for name, size in self._get_partial_sizes(output_folder).items():
+                        bytes_salvaged += max(size - counted_sizes.get(name, 0), 0)
+                        counted_sizes[name] = max(size, counted_sizes.get(name, 0))
+                    try:
+                        downloaded_file = self._attempt_download(url, ydl_opts, format_value, quality, output_folder,
+                                                                 max_filesize, growing_file, cancellation, share,
+                                                                 time_range, deadline_at, progress)
+                        break
+                    except DownloadCancelled:
+                        raise
+                    except Exception as error:
+                        if cancellation is not None and cancellation.is_cancelled:
+                            # the run failed because its processes were terminated
+                            raise DownloadCancelled(f"Download cancelled: {cancellation.reason}") from error
+                        if not self._should_retry(error, retries, growing_file):
+                            raise
+
+                        delay = min(self.retry_backoff * 2 ** retries, DEFAULT_RETRY_MAX_BACKOFF)
+                        retries += 1
+                        self.logger.warning(f"Transient error downloading {url} ({error}), "
+                                            f"retry {retries}/{self.max_retries} in {delay:.0f}s")
+                        if self.error_classifier.is_expired_url(error):
+                            self._forget_info(url)
+                        if cancellation is not None:
+                            if cancellation.wait(delay):
+                                raise DownloadCancelled(f"Download cancelled: {cancellation.reason}") from error
+                        else:
+                            time.sleep(delay)
+
+            if retries or bytes_salvaged:
+                self.logger.info(f"Downloaded {url} after {retries} retries, resumed {bytes_salvaged} bytes")
+            downloaded_file = replace(downloaded_file, retries=retries, bytes_salvaged=bytes_salvaged)
+            if growing_file is not None:
+                growing_file.finish(downloaded_file.file_path, downloaded_file.file_size)
+            return downloaded_file
+
+        except DownloadCancelled as error:
+            self.logger.info(f"Download from {url} stopped: {error}")
+            if growing_file is not None:
+                growing_file.fail(error)
+            raise
+
         except Exception as error:
+            if isinstance(error, yt_dlp.DownloadError):
+                self.logger.error(f"yt-dlp download error: {error}", exc_info=True)
+                wrapped_error = Exception(f"Failed to download from {url}: {error}")
+                if growing_file is not None:
+                    growing_file.fail(wrapped_error)
+                raise wrapped_error from error
+
             self.logger.error(f"Unexpected error during download: {error}", exc_info=True)
-            raise
\ No newline at end of file
+            if growing_file is not None:
+                growing_file.fail(error)
+            raise
+
+        finally:
+            unregister_cancel()
+
+    def _attempt_download(self, url: str, ydl_opts: Dict[str, Any], format_value: Formats | None, quality: Quality,
+                          output_folder: Path, max_filesize: int | None, growing_file: GrowingFile | None,
+                          cancellation: CancellationToken | None, share: BandwidthShare,
+                          time_range: TimeRange | None = None, deadline_at: float | None = None,
+                          progress: ProgressTracker | None = None) -> DownloadedFile:
+        """A single yt-dlp run, continuing the partial files left in output_folder."""
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+        info = self._extract_info(url, ydl_opts)
+        if cancellation is not None:
+            cancellation.raise_if_cancelled()
+
+        if deadline_at is not None:
+            fitted_quality = self._fit_deadline(info, format_value, quality, deadline_at - time.monotonic(), share, time_range)
+            if fitted_quality != quality:
+                self.logger.info(f"Lowered {url} from {quality.value} to {fitted_quality.value} to finish in time")
+                quality = fitted_quality
+                ydl_opts = {**ydl_opts, 'format': self.ytdlp_format_mapper.map_format(format_value, quality)['format']}
+        video_quality = None if format_value is not None and format_value.is_audio() else quality
+        if progress is not None and video_quality is not None:
+            progress.set_quality(video_quality)
+
+        plan_opts, plan = self._plan(info, format_value, quality, max_filesize, time_range)
+        ydl_opts = {**ydl_opts, **plan_opts}
+        profile: DownloaderProfile | None = None
+        meter = {'bytes': 0, 'elapsed': 0.0}
+        if time_range is not None:
+            self.logger.info(f"Downloading only {time_range} of {url}")
+            ydl_opts = self._get_range_opts(ydl_opts, time_range)
+        elif growing_file is None:
+            # streamed and clipped downloads always use one downloader, so there is nothing to pick
+            profile = self.profile_selector.select(info.get('extractor_key'))
+            ydl_opts = self._get_metered_opts({**ydl_opts, **profile.to_ydl_opts()}, meter)
+        deferred = growing_file is None and self._should_defer(plan)
+        # the raw streams of a deferred download are fetched side by side, splitting the job's connections
+        streams = len(plan.selected_formats) if deferred else 1
+        ydl_opts = self._get_budget_opts(ydl_opts, share, profile.max_connections if profile else None, streams)
+        if plan:
+            self.logger.info(f"Download of {url} planned as {plan.mode.value} (formats '{plan.format}')")
+        if growing_file is not None:
+            ydl_opts = self._get_streaming_opts(ydl_opts, growing_file)
+        elif deferred:
+            ydl_opts = self._get_raw_opts(ydl_opts, plan, output_folder)
+
+        # the already extracted info is reused, so only the media is fetched here
+        with self._create_ydl(ydl_opts) as ydl:
+            if streams > 1:
+                fetch_started = time.monotonic()
+                info = self._fetch_streams(ydl_opts, info, plan, share)
+                # the streams' times overlap, the throughput is over the wall-clock time
+                meter['elapsed'] = min(meter['elapsed'], time.monotonic() - fetch_started)
+            else:
+                info = self._fetch(ydl, info, share)
+            if info is None:
+                raise ValueError("Failed to extract video information")
+            if profile is not None:
+                self.profile_selector.record(info.get('extractor_key'), profile, int(meter['bytes']), meter['elapsed'])
+            if deferred:
+                output_path = self._get_titled_path(ydl, info, output_folder, format_value.value)
+                return replace(self._get_raw_download(info, plan, output_path, format_value), quality=video_quality)
+
+            downloaded_file = replace(self._get_downloaded_file(info, plan), quality=video_quality)
+            if growing_file is not None:
+                return downloaded_file
+
+            titled_path = self._get_titled_path(ydl, info, output_folder, downloaded_file.file_path.suffix[1:])
+            if titled_path != downloaded_file.file_path:
+                downloaded_file.file_path.replace(titled_path)
+                downloaded_file = replace(downloaded_file, file_path=titled_path)
+            return downloaded_file
+
+    def _fetch(self, ydl: yt_dlp.YoutubeDL, info: Dict[str, Any], share: BandwidthShare) -> Dict[str, Any]:
+        """Run the download of already extracted info, following the changes of the bandwidth share."""
+        def _apply_rate(share: BandwidthShare) -> None:
+            # yt-dlp's downloaders read it on every block and the aria2c daemon on every poll,
+            # a spawned aria2c keeps the rate it started with
+            ydl.params['ratelimit'] = share.stream_rate
+
+        unregister_rate = share.on_change(_apply_rate)
+        try:
+            return ydl.process_ie_result(ydl.sanitize_info(info), download=True)
+        finally:
+            unregister_rate()
+
+    def _fetch_streams(self, ydl_opts: Dict[str, Any], info: Dict[str, Any], plan: FormatPlan,
+                       share: BandwidthShare) -> Dict[str, Any]:
+        """Download every raw stream of the plan at the same time, each in its own yt-dlp run.
+
+        Once one of them fails, the others are stopped at their next progress hook.
+        Returns the info of the first stream with the downloads of all of them, in the plan's order.
+        """
+        failed = threading.Event()
+
+        def _stop_on_failure(d: Dict[str, Any]) -> None:
+            if failed.is_set():
+                raise DownloadCancelled("Another stream of the download failed")
+
+        def _fetch_stream(format_info: Dict[str, Any]) -> Dict[str, Any]:
+            stream_opts = {
+                **ydl_opts,
+                'format': str(format_info['format_id']),
+                'progress_hooks': [*ydl_opts.get('progress_hooks', []), _stop_on_failure],
+            }
+            try:
+                with self._create_ydl(stream_opts) as ydl:
+                    stream_info = self._fetch(ydl, info, share)
+                if stream_info is None:
+                    raise ValueError("Failed to extract video information")
+                return stream_info
+            except BaseException:
+                failed.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=len(plan.selected_formats), thread_name_prefix="ytdlp-stream") as executor:
+            futures = [executor.submit(_fetch_stream, format_info) for format_info in plan.selected_formats]
+            wait(futures)
+
+        # the stream that failed first is the cause, the others only stopped because of it
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        cause = next((error for error in errors if not isinstance(error, DownloadCancelled)), errors[0] if errors else None)
+        if cause is not None:
+            raise cause
+
+        stream_infos = [future.result() for future in futures]
+        requested_downloads = [download for stream_info in stream_infos for download in stream_info.get('requested_downloads') or []]
+        return {**stream_infos[0], 'requested_downloads': requested_downloads}
+
+    def _create_ydl(self, ydl_opts: Dict[str, Any]) -> yt_dlp.YoutubeDL:
+        """A YoutubeDL for the download, handing aria2c's downloads to the shared daemon when there is one."""
+        if self.aria2_daemon is None or 'external_downloader' not in ydl_opts:
+            return yt_dlp.YoutubeDL(ydl_opts)
+        daemon_opts = {key: value for key, value in ydl_opts.items()
+                       if key not in ('external_downloader', 'external_downloader_args')}
+        return Aria2RpcYoutubeDL(daemon_opts, self.aria2_daemon)
+
+    def _should_retry(self, error: Exception, retries: int, growing_file: GrowingFile | None) -> bool:
+        if retries >= self.max_retries:
+            return False
+        if growing_file is not None:
+            # the reader already consumed part of the file, it can't follow a second run
+            return False
+        return self.error_classifier.is_transient(error)
+
+    @staticmethod
+    def _get_titled_path(ydl: yt_dlp.YoutubeDL, info: Dict[str, Any], output_folder: Path, ext: str) -> Path:
+        """The final, human readable name of a file downloaded under its id."""
+        return Path(ydl.prepare_filename({**info, 'ext': ext}, outtmpl=str(output_folder / TITLED_OUTTMPL)))
+
+    @staticmethod
+    def _get_partial_sizes(output_folder: Path) -> Dict[str, int]:
+        """Size of every partial download (.part files and fragments) in the folder, by name."""
+        if not output_folder.exists():
+            return {}
+        return {
+            path.name: path.stat().st_size for path in output_folder.iterdir()
+            if path.is_file() and ".part" in path.name and path.suffix not in RESUME_STATE_SUFFIXES
+        }
+
+    def _plan(self, info: Dict[str, Any], format_value: Formats | None, quality: Quality,
+              max_filesize: int | None, time_range: TimeRange | None = None) -> Tuple[Dict[str, Any], FormatPlan | None]:
+        """Choose the formats to download and the post-processing they still need.
+
+        Returns the yt-dlp options overriding the mapped ones, and the plan when one could be made.
+        """
+        selector = None
+        fraction = time_range.fraction(info.get('duration')) if time_range else None
+        if max_filesize is not None and fraction:
+            # format sizes are for the whole media, a clip of it only takes its share
+            max_filesize = int(max_filesize / fraction)
+        if max_filesize is not None:
+            selector = self.size_fitter.select_format(info, format_value, quality, max_filesize)
+            if selector:
+                self.logger.info(f"Using format '{selector}' to fit {max_filesize} bytes")
+
+        plan = self.ytdlp_format_mapper.plan_format(info, format_value, quality, selector=selector)
+        if plan:
+            return plan.to_ydl_opts(), plan
+        if selector:
+            return {'format': selector}, None
+        return {}, None
+
+    def _fit_deadline(self, info: Dict[str, Any], format_value: Formats | None, quality: Quality, deadline: float,
+                      share: BandwidthShare, time_range: TimeRange | None) -> Quality:
+        """The highest quality up to quality expected to be done in deadline seconds at the site's measured throughput."""
+        throughput = self.profile_selector.expected_throughput(info.get('extractor_key')) or DEFAULT_ASSUMED_THROUGHPUT
+        if share.rate is not None:
+            # the budget holds this download below what the site gave before
+            throughput = min(throughput, share.rate)
+        fraction = time_range.fraction(info.get('duration')) if time_range else None
+        return self.deadline_fitter.select_quality(info, format_value, quality, max(deadline, 0.0), throughput, fraction)
+
+    def _should_defer(self, plan: FormatPlan | None) -> bool:
+        """Whether the plan leaves ffmpeg work that can run outside of the yt-dlp run."""
+        if not self.defer_postprocessing or plan is None:
+            return False
+        return len(plan.selected_formats) > 1 or bool(plan.postprocessors)
+
+    def _get_raw_download(self, info: Dict[str, Any], plan: FormatPlan, output_path: Path,
+                          format_value: Formats) -> DownloadedFile:
+        """Describe the raw streams of a deferred download and the processing they still need."""
+        inputs = tuple(Path(d['filepath']) for d in info.get('requested_downloads') or [] if d.get('filepath'))
+        if len(inputs) != len(plan.selected_formats) or not all(path.exists() for path in inputs):
+            raise FileNotFoundError(f"yt-dlp did not download every planned format ({plan.format})")
+
+        file_size = sum(path.stat().st_size for path in inputs)
+        self.logger.info(f"Downloaded {len(inputs)} raw streams, {plan.mode.value} to {output_path.name} is pending")
+        return DownloadedFile(
+            file_path=inputs[0],
+            file_size=file_size,
+            processing_mode=plan.mode,
+            pending_processing=PendingProcessing(
+                inputs=inputs, output_path=output_path, mode=plan.mode, audio_only=format_value.is_audio(),
+            ),
+        )
+
+    def _extract_info(self, url: str, ydl_opts: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the info of a URL without downloading, reusing a recent extraction if there is one."""
+        now = time.monotonic()
+        with self._info_cache_lock:
+            cached = self._info_cache.get(url)
+            if cached and now - cached[0] < self.info_cache_ttl:
+                self.logger.debug(f"Reusing extracted info for: {url}")
+                return cached[1]
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+            if info is None:
+                raise ValueError("Failed to extract video information")
+            info = ydl.sanitize_info(info)
+
+        with self._info_cache_lock:
+            self._info_cache[url] = (now, info)
+            self._evict_expired_info(now)
+        return info
+
+    def _forget_info(self, url: str) -> None:
+        with self._info_cache_lock:
+            self._info_cache.pop(url, None)
+
+    def _evict_expired_info(self, now: float) -> None:
+        """Drops expired entries, and the oldest ones if the cache is still too big. Lock must be held."""
+        for url, (extracted_at, _) in list(self._info_cache.items()):
+            if now - extracted_at >= self.info_cache_ttl:
+                del self._info_cache[url]
+
+        while len(self._info_cache) > DEFAULT_INFO_CACHE_SIZE:
+            oldest_url = min(self._info_cache, key=lambda key: self._info_cache[key][0])
+            del self._info_cache[oldest_url]
+
+    def _get_downloaded_file(self, info: Dict[str, Any], plan: FormatPlan | None = None) -> DownloadedFile:
+        """Resolve the final file of a finished yt-dlp run."""
+        requested_downloads = info.get('requested_downloads') or []
+        filename = requested_downloads[0].get('filepath') if requested_downloads else info.get('filepath')
+        if not filename:
+            raise FileNotFoundError("yt-dlp did not report any downloaded file")
+
+        file_path = Path(filename)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Downloaded file not found at: {file_path}")
+
+        file_size = file_path.stat().st_size
+        self.logger.info(f"Successfully downloaded file to: {file_path}")
+        return DownloadedFile(file_path=file_path, file_size=file_size, processing_mode=plan.mode if plan else None)
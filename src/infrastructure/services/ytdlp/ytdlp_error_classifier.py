@@ -0,0 +1,67 @@
+import re
+from typing import Iterator
+from yt_dlp.utils import ContentTooShortError, ExtractorError
+from yt_dlp.networking.exceptions import HTTPError, IncompleteRead, TransportError
+
+TRANSIENT_HTTP_STATUSES = {403, 408, 425, 429, 500, 502, 503, 504}
+# aria2c exit codes: 1 unknown, 2 timeout, 6 network problem, 7 unfinished downloads, 19 dns, 22 bad http response
+TRANSIENT_ARIA2C_EXIT_CODES = {1, 2, 6, 7, 19, 22}
+# a spawned aria2c exits with the code, the shared daemon reports it on the failed download
+ARIA2C_EXIT_PATTERN = re.compile(r"aria2c (?:exited|failed) with code (\d+)")
+PERMANENT_MESSAGES = (
+    "private video", "video unavailable", "is not available", "has been removed", "members-only",
+    "sign in to confirm your age", "unsupported url", "requested format is not available", "copyright",
+)
+TRANSIENT_MESSAGES = (
+    "timed out", "connection reset", "connection refused", "connection aborted", "temporary failure",
+    "remote end closed", "incomplete read", "unable to download video data", "giving up after",
+)
+
+class YtdlpErrorClassifier():
+    """Tells apart download errors that may go away on a retry from the ones that won't.
+
+    yt-dlp wraps the original error (DownloadError.exc_info, ExtractorError.cause), so the whole
+    chain is looked at. Anything not recognized is treated as permanent.
+    """
+
+    def is_transient(self, error: BaseException) -> bool:
+        for cause in self._chain(error):
+            if isinstance(cause, ExtractorError) and cause.expected:
+                # the extractor knows the media can't be downloaded (private, removed, geo-blocked...)
+                return False
+            if isinstance(cause, HTTPError):
+                return cause.status in TRANSIENT_HTTP_STATUSES
+            if isinstance(cause, (TransportError, IncompleteRead, ContentTooShortError, TimeoutError, ConnectionError)):
+                return True
+
+        message = str(error).lower()
+        match = ARIA2C_EXIT_PATTERN.search(message)
+        if match:
+            return int(match.group(1)) in TRANSIENT_ARIA2C_EXIT_CODES
+        if any(fragment in message for fragment in PERMANENT_MESSAGES):
+            return False
+        return any(fragment in message for fragment in TRANSIENT_MESSAGES)
+
+    @staticmethod
+    def is_expired_url(error: BaseException) -> bool:
+        """Whether the error looks like an expired media URL, so the info has to be extracted again."""
+        return any(isinstance(cause, HTTPError) and cause.status == 403 for cause in YtdlpErrorClassifier._chain(error))
+
+    @staticmethod
+    def _chain(error: BaseException) -> Iterator[BaseException]:
+        seen = set()
+        pending = [error]
+        while pending:
+            current = pending.pop(0)
+            if current is None or id(current) in seen:
+                continue
+            seen.add(id(current))
+            yield current
+
+            exc_info = getattr(current, "exc_info", None)
+            if isinstance(exc_info, tuple) and len(exc_info) > 1:
+                pending.append(exc_info[1])
+            cause = getattr(current, "cause", None)
+            if isinstance(cause, BaseException):
+                pending.append(cause)
+            pending.extend((current.__cause__, current.__context__))
\ No newline at end of file
@@ -1,8 +1,26 @@
 import logging
 from logging import Logger
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
+from src.domain.enum.processing_mode import ProcessingMode
+
+@dataclass(frozen=True)
+class FormatPlan:
+    """What to download and which post-processing is still needed to get the requested format."""
+    format: str
+    mode: ProcessingMode
+    postprocessors: List[Dict[str, Any]] = field(default_factory=list)
+    merge_output_format: str | None = None
+    selected_formats: Tuple[Dict[str, Any], ...] = ()
+
+    def to_ydl_opts(self) -> Dict[str, Any]:
+        """yt-dlp options that override the ones from map_format."""
+        options: Dict[str, Any] = {"format": self.format, "postprocessors": list(self.postprocessors)}
+        if self.merge_output_format:
+            options["merge_output_format"] = self.merge_output_format
+        return options
 
 class YtdlpFormatMapper():
     """Mapper the format string to yt-dlp format codes.
@@ -40,6 +58,20 @@ class YtdlpFormatMapper():
             }
         }
 
+    # codecs each container takes as they are, checked with str.startswith
+    VIDEO_CODECS: dict[str, tuple[str, ...]] = {
+        "mp4": ("avc1", "h264"),
+        "webm": ("vp9", "vp09", "vp8", "av01"),
+    }
+    AUDIO_CODECS: dict[str, tuple[str, ...]] = {
+        "mp4": ("mp4a", "aac"),
+        "webm": ("opus", "vorbis"),
+        "mp3": ("mp3",),
+        "ogg": ("opus", "vorbis"),
+    }
+    # containers that can't hold other codecs at all, so an incompatible stream means a transcode
+    STRICT_CONTAINERS = {"webm"}
+
     @classmethod
     def map_format(cls, format_value: Formats | None, quality: Quality | None = None, logger: Optional[Logger] = None) -> dict:
         """Map the format string to yt-dlp format codes.
@@ -109,4 +141,140 @@ class YtdlpFormatMapper():
             
             filtered_options.append('+'.join(filtered_streams))
         
-        return '/'.join(filtered_options)
\ No newline at end of file
+        return '/'.join(filtered_options)
+
+    @classmethod
+    def plan_format(cls, info: Dict[str, Any], format_value: Formats | None, quality: Quality | None = None,
+                    selector: str | None = None, logger: Optional[Logger] = None) -> FormatPlan | None:
+        """Plan the download from the formats that are actually available, avoiding re-encodes.
+
+        Stream-copy compatible combinations are preferred (avc1+m4a for mp4, vp9/opus for webm,
+        opus for ogg) and post-processors are skipped when the container already matches.
+
+        Args:
+            info: Extracted (not downloaded) yt-dlp info dict
+            format_value: Format enum provided by the user
+            quality: Quality enum for video resolution
+            selector: Format ids already chosen (like '135+140'), only the post-processing is planned
+            logger: Logger instance for logging messages
+        Returns:
+            FormatPlan, or None when the formats don't carry enough codec info (use map_format then)
+        """
+        if logger is None:
+            logger = logging.getLogger(cls.__name__)
+
+        formats: List[Dict[str, Any]] = info.get("formats") or []
+        if format_value is None or not formats:
+            return None
+
+        if selector:
+            formats_by_id = {str(f.get("format_id")): f for f in formats}
+            selected = [formats_by_id.get(format_id) for format_id in selector.split("+")]
+            if None in selected:
+                return None
+        elif format_value.is_audio():
+            selected = cls._select_audio(formats, format_value.value)
+        else:
+            height = cls._get_height_from_quality(quality) if quality else None
+            selected = cls._select_video(formats, format_value.value, height)
+
+        if not selected:
+            return None
+
+        plan = cls._plan_for(selected, format_value)
+        logger.debug(f"Planned format '{format_value.value}' as {plan.mode.value} with formats '{plan.format}'")
+        return plan
+
+    @classmethod
+    def _select_video(cls, formats: List[Dict[str, Any]], target: str, height: int | None) -> List[Dict[str, Any]]:
+        """Best video at the highest allowed height, preferring codecs the target container takes as they are."""
+        # yt-dlp lists formats from worst to best, its order breaks the ties
+        positions = {id(f): index for index, f in enumerate(formats)}
+        videos = [f for f in formats if cls._has_video(f) and (height is None or (f.get("height") or 0) <= height)]
+        if target in cls.STRICT_CONTAINERS and any(cls._fits(f, target, video=True) for f in videos):
+            videos = [f for f in videos if cls._fits(f, target, video=True)]
+        if not videos:
+            return []
+
+        video = max(videos, key=lambda f: (f.get("height") or 0, cls._preference(f), cls._fits(f, target, video=True),
+                                           f.get("ext") == target, positions[id(f)], f.get("tbr") or 0))
+        if cls._has_audio(video):
+            return [video]
+
+        audio = cls._best_audio(formats, target, positions)
+        return [video, audio] if audio else []
+
+    @classmethod
+    def _select_audio(cls, formats: List[Dict[str, Any]], target: str) -> List[Dict[str, Any]]:
+        """Best audio-only format, preferring one whose codec can be copied into the target."""
+        audio = cls._best_audio(formats, target, {id(f): index for index, f in enumerate(formats)})
+        return [audio] if audio else []
+
+    @classmethod
+    def _best_audio(cls, formats: List[Dict[str, Any]], target: str, positions: Dict[int, int]) -> Dict[str, Any] | None:
+        """The track yt-dlp prefers (original language over dubs and descriptions), then a codec the target takes."""
+        audios = [f for f in formats if cls._has_audio(f) and not cls._has_video(f)]
+        if not audios:
+            return None
+        return max(audios, key=lambda f: (cls._preference(f), cls._fits(f, target, video=False),
+                                          positions[id(f)], f.get("abr") or f.get("tbr") or 0))
+
+    @staticmethod
+    def _preference(format: Dict[str, Any]) -> Tuple[int, int]:
+        """The extractor's language_preference and preference, -1 (no opinion) when missing, like yt-dlp."""
+        language = format.get("language_preference")
+        preference = format.get("preference")
+        return (language if language is not None else -1, preference if preference is not None else -1)
+
+    @classmethod
+    def _plan_for(cls, selected: List[Dict[str, Any]], format_value: Formats) -> FormatPlan:
+        target = format_value.value
+        selector = "+".join(str(f["format_id"]) for f in selected)
+
+        if format_value.is_audio():
+            audio = selected[0]
+            if cls._fits(audio, target, video=False):
+                if audio.get("ext") == target:
+                    return FormatPlan(selector, ProcessingMode.COPY, selected_formats=tuple(selected))
+                # the audio stream is fine, it only needs another container
+                key = "FFmpegExtractAudio" if target == "mp3" else "FFmpegVideoRemuxer"
+                postprocessor = ({'key': key, 'preferredcodec': target} if target == "mp3"
+                                 else {'key': key, 'preferedformat': target})
+                return FormatPlan(selector, ProcessingMode.REMUX, [postprocessor], selected_formats=tuple(selected))
+            return FormatPlan(selector, ProcessingMode.TRANSCODE, cls.FORMAT_MAP[target]["post"],
+                              selected_formats=tuple(selected))
+
+        streams_fit = all(cls._fits(f, target, video=cls._has_video(f)) for f in selected)
+        if target in cls.STRICT_CONTAINERS and not streams_fit:
+            # webm can't hold these codecs, so the video has to be converted
+            return FormatPlan(selector, ProcessingMode.TRANSCODE,
+                              [{'key': 'FFmpegVideoConvertor', 'preferedformat': target}],
+                              merge_output_format="mkv", selected_formats=tuple(selected))
+
+        if len(selected) > 1:
+            # merging straight into the target container, so no remux pass is needed afterwards
+            mode = ProcessingMode.COPY if streams_fit else ProcessingMode.REMUX
+            return FormatPlan(selector, mode, merge_output_format=target, selected_formats=tuple(selected))
+
+        if selected[0].get("ext") == target:
+            return FormatPlan(selector, ProcessingMode.COPY, selected_formats=tuple(selected))
+        return FormatPlan(selector, ProcessingMode.REMUX, [{'key': 'FFmpegVideoRemuxer', 'preferedformat': target}],
+                          selected_formats=tuple(selected))
+
+    @classmethod
+    def _fits(cls, format_info: Dict[str, Any], target: str, video: bool) -> bool:
+        """Whether the format's codec can go into the target container without re-encoding it."""
+        codecs = (cls.VIDEO_CODECS if video else cls.AUDIO_CODECS).get(target)
+        codec = (format_info.get("vcodec") if video else format_info.get("acodec")) or ""
+        if codecs is None:
+            # containers like mkv take anything
+            return True
+        return codec.startswith(codecs)
+
+    @staticmethod
+    def _has_video(format_info: Dict[str, Any]) -> bool:
+        return format_info.get("vcodec") not in (None, "none")
+
+    @staticmethod
+    def _has_audio(format_info: Dict[str, Any]) -> bool:
+        return format_info.get("acodec") not in (None, "none")
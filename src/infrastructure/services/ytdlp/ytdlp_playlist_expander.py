@@ -0,0 +1,61 @@
+import yt_dlp
+import asyncio
+import logging
+from logging import Logger
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+from src.core.constants import DEFAULT_YT_DLP_SETTINGS
+
+class YtdlpPlaylistExpander():
+    """Lists the entries of a playlist with yt-dlp without extracting each of them.
+
+    Entries are flat (only their URL) and pulled lazily, so the pages of a long playlist are
+    only fetched as the batch consumes them.
+    """
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    async def expand(self, url: str, max_items: int) -> AsyncIterator[str]:
+        loop = asyncio.get_running_loop()
+        ydl, entries = await loop.run_in_executor(None, self._extract_entries, url)
+        try:
+            iterator = iter(entries)
+            count = 0
+            while count < max_items:
+                entry = await loop.run_in_executor(None, next, iterator, None)
+                if entry is None:
+                    break
+                entry_url = entry.get('url') or entry.get('webpage_url')
+                if not entry_url:
+                    self.logger.debug(f"Skipping playlist entry without URL: {entry.get('id')}")
+                    continue
+                count += 1
+                yield entry_url
+        finally:
+            ydl.close()
+
+    def _extract_entries(self, url: str) -> Tuple[yt_dlp.YoutubeDL, Iterable[Dict[str, Any]]]:
+        """The YoutubeDL is returned open, lazy entries still use it to fetch the next pages."""
+        ydl = yt_dlp.YoutubeDL({
+            **DEFAULT_YT_DLP_SETTINGS,
+            'logger': self.logger,
+            'noplaylist': False,
+            'extract_flat': 'in_playlist',
+            'lazy_playlist': True,
+        })
+        try:
+            info = ydl.extract_info(url, download=False, process=False)
+        except Exception:
+            ydl.close()
+            raise
+
+        if not info or info.get('_type') not in ('playlist', 'multi_video'):
+            return ydl, [{'url': url}]
+        self.logger.info(f"Expanding playlist {info.get('title') or url}")
+        return ydl, self._entries(info)
+
+    @staticmethod
+    def _entries(info: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        for entry in info.get('entries') or []:
+            if entry:
+                yield entry
\ No newline at end of file
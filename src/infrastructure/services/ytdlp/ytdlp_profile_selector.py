@@ -0,0 +1,121 @@
+import os
+import json
+import random
+import logging
+import threading
+from pathlib import Path
+from logging import Logger
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from src.core.constants import (
+    DOWNLOADER_PROFILES_FILE,
+    DEFAULT_DOWNLOADER_PROFILE,
+    DEFAULT_DOWNLOADER_PROFILES,
+    DEFAULT_PROFILE_EXPLORATION,
+    DEFAULT_THROUGHPUT_SMOOTHING,
+)
+
+@dataclass(frozen=True)
+class DownloaderProfile:
+    name: str
+    external_downloader: bool
+    max_connections: int | None = None
+    http_chunk_size: int | None = None
+
+    def to_ydl_opts(self) -> Dict[str, Any]:
+        opts: Dict[str, Any] = {}
+        if self.external_downloader:
+            opts['external_downloader'] = 'aria2c'
+        if self.http_chunk_size:
+            opts['http_chunk_size'] = self.http_chunk_size
+        return opts
+
+class YtdlpProfileSelector():
+    """Picks the downloader profile for a site from the throughput measured on earlier downloads.
+
+    Epsilon-greedy: usually the profile with the best average throughput for the extractor,
+    sometimes another one (untried first), so a profile that got better is noticed.
+    The history is kept in a JSON file, rewritten atomically after every measure.
+    """
+
+    def __init__(self, history_file: Path = DOWNLOADER_PROFILES_FILE,
+                 profiles: Dict[str, Dict[str, Any]] = DEFAULT_DOWNLOADER_PROFILES,
+                 default_profile: str = DEFAULT_DOWNLOADER_PROFILE, exploration: float = DEFAULT_PROFILE_EXPLORATION,
+                 smoothing: float = DEFAULT_THROUGHPUT_SMOOTHING, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.history_file = history_file
+        self.profiles = {name: DownloaderProfile(name=name, **options) for name, options in profiles.items()}
+        self.default_profile = default_profile
+        self.exploration = exploration
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._history: Dict[str, Dict[str, Dict[str, float]]] | None = None
+
+    def select(self, extractor: str | None) -> DownloaderProfile:
+        extractor = extractor or "generic"
+        with self._lock:
+            measures = {name: stats for name, stats in self._load().get(extractor, {}).items() if name in self.profiles}
+
+        if not measures:
+            return self.profiles[self.default_profile]
+
+        best = max(measures, key=lambda name: measures[name]["throughput"])
+        if random.random() >= self.exploration:
+            return self.profiles[best]
+
+        untried = [name for name in self.profiles if name not in measures]
+        alternatives = untried or [name for name in self.profiles if name != best]
+        if not alternatives:
+            return self.profiles[best]
+        choice = random.choice(alternatives)
+        self.logger.debug(f"Exploring downloader profile {choice} for {extractor} (best known is {best})")
+        return self.profiles[choice]
+
+    def expected_throughput(self, extractor: str | None) -> float | None:
+        """Average throughput of the best profile measured for the extractor, None if none was."""
+        with self._lock:
+            measures = self._load().get(extractor or "generic", {})
+            throughputs = [stats["throughput"] for name, stats in measures.items() if name in self.profiles]
+        return max(throughputs, default=None)
+
+    def record(self, extractor: str | None, profile: DownloaderProfile, downloaded_bytes: int, elapsed: float) -> None:
+        """Add a measured download to the moving average of its extractor and profile."""
+        if downloaded_bytes <= 0 or elapsed <= 0:
+            return
+
+        extractor = extractor or "generic"
+        throughput = downloaded_bytes / elapsed
+        with self._lock:
+            history = self._load()
+            stats = history.setdefault(extractor, {}).get(profile.name)
+            if stats is None:
+                stats = {"throughput": throughput, "samples": 0}
+            else:
+                stats["throughput"] += self.smoothing * (throughput - stats["throughput"])
+            stats["samples"] += 1
+            history[extractor][profile.name] = stats
+            self._write(history)
+
+        self.logger.debug(f"{extractor} with {profile.name}: {throughput:.0f} B/s (average {stats['throughput']:.0f} B/s)")
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Lock must be held."""
+        if self._history is not None:
+            return self._history
+        self._history = {}
+        if self.history_file.exists():
+            try:
+                self._history = json.loads(self.history_file.read_text(encoding="utf-8"))
+            except Exception as error:
+                self.logger.warning(f"Failed to load downloader profile history: {error}")
+        return self._history
+
+    def _write(self, history: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+        """Lock must be held."""
+        temp_file = self.history_file.with_suffix(".tmp")
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(json.dumps(history, indent=2), encoding="utf-8")
+            os.replace(temp_file, self.history_file)
+        except Exception as error:
+            self.logger.error(f"Failed to save downloader profile history: {error}")
\ No newline at end of file
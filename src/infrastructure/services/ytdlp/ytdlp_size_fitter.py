@@ -0,0 +1,101 @@
+import logging
+from logging import Logger
+from typing import Any, Dict, List, Optional
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.core.constants import DEFAULT_FIT_SIZE_MARGIN
+
+class YtdlpSizeFitter():
+    """Picks the best yt-dlp format (or video+audio pair) whose estimated size fits a limit.
+
+    Sizes come from the extractor's filesize/filesize_approx, falling back to tbr * duration.
+    Formats without any size estimate are never picked, since we can't tell if they fit.
+    """
+
+    def __init__(self, size_margin: float = DEFAULT_FIT_SIZE_MARGIN, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.size_margin = size_margin
+
+    def select_format(self, info: Dict[str, Any], format_value: Formats | None, quality: Quality | None,
+                      max_filesize: int) -> str | None:
+        """Select a format selector for yt-dlp that fits max_filesize.
+
+        Args:
+            info: Extracted (not downloaded) yt-dlp info dict
+            format_value: Requested output format
+            quality: Requested quality, used as the upper bound for the height
+            max_filesize: Size limit in bytes
+        Returns:
+            A yt-dlp format selector (like '137+140'), or None if nothing fits
+        """
+        if format_value is not None and format_value.is_audio():
+            # audio is always transcoded, the source bitrate doesn't decide the output size
+            return None
+
+        budget = max_filesize * self.size_margin
+        duration = info.get("duration")
+        formats: List[Dict[str, Any]] = info.get("formats") or []
+        max_height = int(quality.value[:-1]) if quality else None
+        target_ext = format_value.value if format_value else None
+
+        video_formats = [f for f in formats if self._is_video(f) and self._fits_height(f, max_height)]
+        audio_formats = sorted(
+            (f for f in formats if self._is_audio_only(f) and self.estimate_size(f, duration) is not None),
+            key=lambda f: self.estimate_size(f, duration),
+            reverse=True,
+        )
+
+        candidates = sorted(
+            video_formats,
+            key=lambda f: (f.get("height") or 0, f.get("ext") == target_ext, f.get("tbr") or 0),
+            reverse=True,
+        )
+
+        for video in candidates:
+            video_size = self.estimate_size(video, duration)
+            if video_size is None or video_size > budget:
+                continue
+
+            if self._has_audio(video):
+                self.logger.debug(f"Fit-to-limit picked muxed format {video['format_id']} (~{video_size:.0f} bytes)")
+                return str(video["format_id"])
+
+            for audio in audio_formats:
+                total_size = video_size + self.estimate_size(audio, duration)
+                if total_size <= budget:
+                    selector = f"{video['format_id']}+{audio['format_id']}"
+                    self.logger.debug(f"Fit-to-limit picked {selector} (~{total_size:.0f} bytes)")
+                    return selector
+
+        self.logger.debug(f"No format fits {max_filesize} bytes")
+        return None
+
+    @staticmethod
+    def estimate_size(format_info: Dict[str, Any], duration: float | None) -> float | None:
+        """Estimate the size in bytes of a single format."""
+        size = format_info.get("filesize") or format_info.get("filesize_approx")
+        if size:
+            return float(size)
+
+        tbr = format_info.get("tbr")
+        if tbr and duration:
+            return tbr * 1000 / 8 * duration
+        return None
+
+    @staticmethod
+    def _is_video(format_info: Dict[str, Any]) -> bool:
+        return format_info.get("vcodec") not in (None, "none")
+
+    @staticmethod
+    def _has_audio(format_info: Dict[str, Any]) -> bool:
+        return format_info.get("acodec") not in (None, "none")
+
+    @classmethod
+    def _is_audio_only(cls, format_info: Dict[str, Any]) -> bool:
+        return cls._has_audio(format_info) and not cls._is_video(format_info)
+
+    @staticmethod
+    def _fits_height(format_info: Dict[str, Any], max_height: int | None) -> bool:
+        if max_height is None:
+            return True
+        return (format_info.get("height") or 0) <= max_height
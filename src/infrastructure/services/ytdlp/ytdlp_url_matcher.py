@@ -0,0 +1,28 @@
+import logging
+from logging import Logger
+from typing import List, Optional, Type
+from yt_dlp.extractor import gen_extractor_classes
+from yt_dlp.extractor.common import InfoExtractor
+
+class YtdlpUrlMatcher():
+    """Matches URLs against the URL patterns of yt-dlp's extractors, offline.
+
+    The generic extractor is left out, since it takes any URL and only finds out on the page itself.
+    """
+
+    def __init__(self, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self._extractors: List[Type[InfoExtractor]] | None = None
+
+    def is_supported(self, url: str) -> bool:
+        extractor = next((ie for ie in self._get_extractors() if ie.suitable(url)), None)
+        if extractor is None:
+            return False
+        self.logger.debug(f"{url} is handled by {extractor.ie_key()}")
+        return extractor.working()
+
+    def _get_extractors(self) -> List[Type[InfoExtractor]]:
+        """Loaded on the first match, importing all of them takes a moment."""
+        if self._extractors is None:
+            self._extractors = [ie for ie in gen_extractor_classes() if ie.ie_key() != "Generic"]
+        return self._extractors
\ No newline at end of file
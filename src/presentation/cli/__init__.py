@@ -0,0 +1,3 @@
+from .ingest_command import IngestCommand
+
+__all__ = ["IngestCommand"]
\ No newline at end of file
@@ -0,0 +1,143 @@
+import json
+import time
+import asyncio
+from logging import Logger
+from typing import Any, AsyncIterable, Dict, List, TextIO
+from src.application.protocols import DownloadUseCaseProtocol, TaskManagerProtocol
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.domain.models.settings.download_settings import DownloadSettings
+from src.domain.enum import Formats, Quality
+from src.domain.exceptions import DownloadCancelled
+from src.core.constants import DEFAULT_DOWNLOAD_FORMAT, DEFAULT_INGEST_PARALLELISM
+
+class IngestCommand():
+    """Runs downloads read from lines of text through the same usecase as Discord, without Discord.
+
+    Every line is 'URL [format] [quality]', blank lines and lines starting with '#' are skipped.
+    Each outcome is written as one JSON line as soon as it's known, and a summary line closes the
+    report, so a run doubles as a throughput benchmark of the real pipeline.
+    """
+
+    def __init__(self, download_usecase: DownloadUseCaseProtocol, download_settings: DownloadSettings,
+                 task_manager: TaskManagerProtocol, logger: Logger, parallelism: int = DEFAULT_INGEST_PARALLELISM,
+                 default_format: Formats | None = None, default_quality: Quality = Quality.DEFAULT) -> None:
+        self.download_usecase = download_usecase
+        self.download_settings = download_settings
+        self.task_manager = task_manager
+        self.logger = logger
+        self.parallelism = max(parallelism, 1)
+        self.default_format = default_format or Formats(DEFAULT_DOWNLOAD_FORMAT)
+        self.default_quality = default_quality
+
+    async def run(self, lines: AsyncIterable[str], report: TextIO) -> Dict[str, Any]:
+        """Returns the summary written at the end of the report."""
+        start_time = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.parallelism)
+        records: List[Dict[str, Any]] = []
+        tasks: List[asyncio.Task[None]] = []
+
+        def write(record: Dict[str, Any]) -> None:
+            report.write(json.dumps(record) + "\n")
+            report.flush()
+
+        async def run_line(line_number: int, line: str) -> None:
+            try:
+                record = await self._run_line(line_number, line)
+            finally:
+                semaphore.release()
+            records.append(record)
+            write(record)
+
+        try:
+            line_number = 0
+            async for line in lines:
+                line_number += 1
+                if not line.strip() or line.lstrip().startswith("#"):
+                    continue
+                # lines are only read as slots free up, so stdin can be fed while the run goes
+                await semaphore.acquire()
+                tasks.append(asyncio.create_task(run_line(line_number, line)))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        summary = self._summarize(records, time.perf_counter() - start_time)
+        write(summary)
+        self.logger.info(
+            f"Ingest finished: {summary['succeeded']}/{summary['items']} succeeded in {summary['wall_time']}s "
+            f"({summary['throughput']} B/s)"
+        )
+        return summary
+
+    async def _run_line(self, line_number: int, line: str) -> Dict[str, Any]:
+        record: Dict[str, Any] = {"type": "item", "line": line_number, "input": line.strip()}
+        start_time = time.perf_counter()
+        try:
+            request = self._parse_line(line)
+            record.update(url=request.url, format=request.format.value if request.format else None,
+                          quality=request.quality.value)
+            # tracked, so a shutdown stops the jobs still running
+            with self.task_manager.track() as cancellation:
+                output = await self.download_usecase.execute(request, cancellation,
+                                                             context={"source": "ingest", "line": line_number})
+        except DownloadCancelled as error:
+            record.update(status="cancelled", error=str(error))
+        except Exception as error:
+            self.logger.warning(f"Ingest line {line_number} failed: {error}")
+            record.update(status="failed", error=str(error), error_type=type(error).__name__)
+        else:
+            record.update(status="ok", **self._describe_output(output))
+        record["elapsed"] = round(time.perf_counter() - start_time, 3)
+        return record
+
+    def _parse_line(self, line: str) -> DownloadRequest:
+        url, *options = line.split()
+        format, quality = self.default_format, self.default_quality
+        for option in options:
+            if option in Formats._value2member_map_:
+                format = Formats(option)
+            elif option in Quality._value2member_map_:
+                quality = Quality(option)
+            else:
+                raise ValueError(f"Unknown option {option!r}, expected a format or a quality")
+        return DownloadRequest(url=url, file_size_limit=self.download_settings.file_size_limit, format=format,
+                               quality=quality)
+
+    @staticmethod
+    def _describe_output(output: DownloadOutput) -> Dict[str, Any]:
+        if output.file_url:
+            destination = "remote"
+        elif output.file_paths:
+            destination = "split"
+        else:
+            destination = "local"
+        return {
+            "destination": destination,
+            "file_size": output.file_size,
+            "file_url": output.file_url,
+            "file_path": str(output.file_path) if output.file_path else None,
+            "parts": len(output.file_paths) or None,
+            "download_elapsed": round(output.elapsed, 3) if output.elapsed is not None else None,
+        }
+
+    def _summarize(self, records: List[Dict[str, Any]], wall_time: float) -> Dict[str, Any]:
+        succeeded = [record for record in records if record["status"] == "ok"]
+        total_bytes = sum(record.get("file_size") or 0 for record in succeeded)
+        elapsed = sorted(record["elapsed"] for record in succeeded)
+        return {
+            "type": "summary",
+            "items": len(records),
+            "succeeded": len(succeeded),
+            "failed": sum(1 for record in records if record["status"] == "failed"),
+            "cancelled": sum(1 for record in records if record["status"] == "cancelled"),
+            "parallelism": self.parallelism,
+            "bytes": total_bytes,
+            "wall_time": round(wall_time, 3),
+            "throughput": round(total_bytes / wall_time) if wall_time > 0 else None,
+            "median_elapsed": elapsed[len(elapsed) // 2] if elapsed else None,
+            "max_elapsed": elapsed[-1] if elapsed else None,
+        }
\ No newline at end of file
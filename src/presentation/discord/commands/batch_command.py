@@ -0,0 +1,94 @@
+import re
+import discord
+from typing import List
+from discord.ext import commands
+from discord import app_commands
+from discord.app_commands import Choice
+from src.application.usecases.batch_download_usecase import BatchDownloadUsecase
+from src.application.services import TaskManager
+from src.application.dto.request.batch_request import BatchRequest
+from src.application.dto.output.batch_output import BatchOutput
+from src.domain.models.settings.download_settings import DownloadSettings
+from src.domain.enum import BatchDelivery, Formats, Quality
+from src.domain.exceptions import DownloadCancelled
+from src.presentation.discord.factories import ErrorEmbedFactory
+from src.core.constants import DEFAULT_DOWNLOAD_FORMAT, DEFAULT_INTERACTION_DEADLINE
+
+DISCORD_MESSAGE_LIMIT = 2000
+URL_SEPARATORS = re.compile(r"[\s,]+")
+
+class BatchCog(commands.Cog):
+    """Cog for batch download command."""
+
+    def __init__(self, bot: commands.Bot, batch_usecase: BatchDownloadUsecase, download_settings: DownloadSettings,
+                 task_manager: TaskManager) -> None:
+        self.bot = bot
+        self.batch_usecase = batch_usecase
+        self.download_settings = download_settings
+        self.task_manager = task_manager
+
+    @app_commands.choices(format=[
+        app_commands.Choice(name=format.value, value=format.value) for format in Formats
+    ])
+    @app_commands.choices(quality=[
+        app_commands.Choice(name=quality.value, value=quality.value) for quality in Quality
+    ])
+    @app_commands.choices(delivery=[
+        app_commands.Choice(name=delivery.value, value=delivery.value) for delivery in BatchDelivery
+    ])
+    @app_commands.describe(urls="A playlist URL or several URLs separated by spaces")
+    @app_commands.command(name="batch", description="Download a playlist or several URLs at once")
+    async def batch(self, interaction: discord.Interaction, urls: str, format: Choice[str] | None = None,
+                    quality: Choice[str] | None = None, delivery: Choice[str] | None = None) -> None:
+        """Batch command to download every entry of playlists or a list of URLs."""
+        await interaction.response.defer()
+
+        url_list = tuple(url for url in URL_SEPARATORS.split(urls) if url)
+        if not url_list:
+            await interaction.followup.send("No URL given.")
+            return
+
+        batch_request = BatchRequest(
+            urls=url_list,
+            file_size_limit=self.download_settings.file_size_limit,
+            format=Formats(format.value if format else DEFAULT_DOWNLOAD_FORMAT),
+            quality=Quality(quality.value) if quality else Quality.DEFAULT,
+            delivery=BatchDelivery(delivery.value) if delivery else BatchDelivery.LINKS,
+        )
+
+        try:
+            context = {"channel_id": interaction.channel_id, "user_id": interaction.user.id, "guild_id": interaction.guild_id}
+            with self.task_manager.track(owner=interaction.user.id, timeout=DEFAULT_INTERACTION_DEADLINE) as cancellation:
+                batch_output = await self.batch_usecase.execute(batch_request, cancellation, context)
+            await interaction.followup.send(self._format_output(batch_output))
+
+        except DownloadCancelled as error:
+            await interaction.followup.send(str(error))
+
+        except Exception as error:
+            self.bot.logger.error(f"Unexpected error in batch command: {error}", exc_info=error)
+            embed = ErrorEmbedFactory.create_error_embed(error)
+            await interaction.followup.send(embed=embed)
+
+    def _format_output(self, batch_output: BatchOutput) -> str:
+        """Summary of the batch, cut to fit a single Discord message."""
+        failed = sum(1 for item in batch_output.items if item.error)
+        header = f"Batch Completed! {len(batch_output.items) - failed}/{len(batch_output.items)} items"
+        if batch_output.elapsed:
+            header += f", Elapsed: {round(batch_output.elapsed, 2)}s"
+
+        lines: List[str] = [header]
+        if batch_output.archive_url:
+            lines.append(f"Archive: {batch_output.archive_url}")
+        for index, item in enumerate(batch_output.items, start=1):
+            if item.error:
+                lines.append(f"{index}. <{item.url}> failed: {item.error}")
+            elif not batch_output.archive_url and item.output and item.output.file_url:
+                lines.append(f"{index}. {item.output.file_url}")
+
+        content = ""
+        for line in lines:
+            if len(content) + len(line) + 1 > DISCORD_MESSAGE_LIMIT - 4:
+                return content + "\n..."
+            content += ("\n" if content else "") + line
+        return content
\ No newline at end of file
@@ -1,22 +1,65 @@
+import asyncio
+import math
 import discord
+from contextlib import aclosing
+from typing import Any, Dict, List, Set
 from discord.ext import commands
 from discord import app_commands
 from discord.app_commands import Choice
 from src.application.protocols import DownloadUseCaseProtocol
+from src.application.services import CacheManager, TaskManager
+from src.application.usecases.progressive_download_usecase import ProgressiveDownloadUsecase
 from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.application.models.dataclasses import JournalEntry
 from src.domain.models.settings.download_settings import DownloadSettings
 from src.domain.enum.formats import Formats
 from src.domain.enum.quality import Quality
+from src.domain.exceptions import DownloadCancelled, InvalidTimeRange
+from src.domain.models import CancellationToken, ProgressTracker, TimeRange
 from src.presentation.discord.factories import ErrorEmbedFactory
-from src.core.constants import DEFAULT_DOWNLOAD_FORMAT
+from src.presentation.discord.reporters import InteractionProgressReporter
+from src.core.constants import DEFAULT_AUTO_QUALITY_CEILING, DEFAULT_DOWNLOAD_FORMAT, DEFAULT_INTERACTION_DEADLINE, DEFAULT_INSTANT_REPLY_MAX_UPLOAD, DEFAULT_SEARCH_RESULTS
+
+DISCORD_CHOICE_MAX_LENGTH = 100
 
 class DownloadCog(commands.Cog):
     """Cog for download command."""
 
-    def __init__(self, bot: commands.Bot, download_usecase: DownloadUseCaseProtocol, download_settings: DownloadSettings) -> None:
+    def __init__(self, bot: commands.Bot, download_usecase: DownloadUseCaseProtocol, download_settings: DownloadSettings,
+                 task_manager: TaskManager, cache_manager: CacheManager,
+                 progressive_usecase: ProgressiveDownloadUsecase) -> None:
         self.bot = bot
         self.download_usecase = download_usecase
+        self.progressive_usecase = progressive_usecase
         self.download_settings = download_settings
+        self.task_manager = task_manager
+        self.cache_manager = cache_manager
+        self._resumed = False
+        self._resume_tasks: Set[asyncio.Task[None]] = set()
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """Resume the downloads interrupted by the last shutdown, only on the first connection."""
+        if self._resumed:
+            return
+        self._resumed = True
+        await self.cache_manager.load()
+
+        for entry in await self.download_usecase.pending_jobs():
+            if entry.context.get("source") is not None:
+                # batch items and previews are delivered by what started them, which is gone;
+                # ingest entries were journaled before ingest had its own journal
+                self.bot.logger.info(f"Discarding interrupted {entry.context['source']} job {entry.job_id} of {entry.request.url}")
+                try:
+                    await self.download_usecase.discard_job(entry.job_id)
+                except OSError as error:
+                    self.bot.logger.error(f"Failed to discard job {entry.job_id}: {error}")
+                continue
+            self.bot.logger.info(f"Resuming interrupted download {entry.job_id} of {entry.request.url} (at {entry.stage})")
+            task = asyncio.create_task(self._resume_job(entry))
+            self._resume_tasks.add(task)
+            task.add_done_callback(self._resume_tasks.discard)
 
     @app_commands.choices(format=[
         app_commands.Choice(name=format.value, value=format.value) for format in Formats
@@ -24,11 +67,14 @@ class DownloadCog(commands.Cog):
     @app_commands.choices(quality=[
         app_commands.Choice(name=quality.value, value=quality.value) for quality in Quality
     ])
+    @app_commands.describe(start="Clip start, like 1:02:03 or 90 (seconds)", end="Clip end, like 1:03:00",
+                           preview="Post a 360p preview first, then replace it with the requested quality")
     @app_commands.command(name="download", description="Download a file from a URL")
-    async def download(self, interaction: discord.Interaction, url: str, format: Choice[str] | None = DEFAULT_DOWNLOAD_FORMAT, quality: Choice[str] | None = None) -> None:
-        """Download command to download a file from a URL."""
-        await interaction.response.defer()
-        
+    async def download(self, interaction: discord.Interaction, url: str, format: Choice[str] | None = DEFAULT_DOWNLOAD_FORMAT, quality: Choice[str] | None = None, fit_to_limit: bool = False, start: str | None = None, end: str | None = None, preview: bool = False) -> None:
+        """Download command to download a file from a URL.
+
+        Cache hits found in memory are answered right away; only misses defer and go through the pipeline.
+        """
         file_size_limit = self._calculate_file_size_limit(interaction)
         
         if not file_size_limit:
@@ -40,45 +86,206 @@ class DownloadCog(commands.Cog):
             format_enum = self._parse_format(format)
         
         if format and format_enum is None:
-            await interaction.followup.send(f"Invalid format: {format}. Supported formats are: {', '.join([f.value for f in Formats])}")
+            await interaction.response.send_message(f"Invalid format: {format}. Supported formats are: {', '.join([f.value for f in Formats])}")
             return
         
         if quality is None:
-            quality_value = Quality.DEFAULT
+            # the highest quality that can be delivered before the interaction expires
+            quality_value = Quality(DEFAULT_AUTO_QUALITY_CEILING)
         else:
             quality_value = Quality(quality.value)
 
+        try:
+            time_range = self._parse_time_range(start, end)
+        except InvalidTimeRange as error:
+            await interaction.response.send_message(str(error))
+            return
         
         download_request = DownloadRequest(
             url=url,
             format=format_enum,
             file_size_limit=file_size_limit,
             quality=quality_value,
+            fit_to_limit=fit_to_limit,
+            time_range=time_range,
+            auto_quality=quality is None,
         )
-        
+
+        cached_output = self.download_usecase.peek_cached(download_request)
+        if cached_output and self._can_send_instantly(cached_output):
+            await interaction.response.send_message(**self._completed_message(cached_output))
+            return
+
+        await interaction.response.defer()
+        progress = ProgressTracker()
+        reporter = InteractionProgressReporter(interaction, progress, logger=self.bot.logger)
         try:
-            download_output = await self.download_usecase.execute(download_request)
-            file_size_mb = self._bytes_to_megabytes(download_output.file_size) if download_output.file_size else "Unknown"
-            elapsed = self._normalize_elapsed_time(download_output.elapsed)
-            
-            if download_output.file_url:
-                content = f"Download Completed! {f"Download Elapsed: {elapsed}s" if elapsed else None}, Filesize: {file_size_mb} MB\nLink: {download_output.file_url}"
-                await interaction.followup.send(content)
-            elif download_output.file_path:
-                content = f"Download Completed! {f'Elapsed: {elapsed}s' if elapsed else ''}, Filesize: {file_size_mb} MB"
-                await interaction.followup.send(file=discord.File(download_output.file_path), content=content)
-            else:
-                content = "Download completed, but no file URL or path was provided."
-                await interaction.followup.send(content)
+            context = {"channel_id": interaction.channel_id, "user_id": interaction.user.id, "guild_id": interaction.guild_id}
+            with self.task_manager.track(owner=interaction.user.id, timeout=DEFAULT_INTERACTION_DEADLINE) as cancellation:
+                if preview:
+                    await self._deliver_with_preview(interaction, download_request, cancellation, context, reporter)
+                    return
+                async with reporter:
+                    download_output = await self.download_usecase.execute(download_request, cancellation, context,
+                                                                          progress=progress)
+            await interaction.followup.send(**self._completed_message(download_output))
         
+        except DownloadCancelled as error:
+            await interaction.followup.send(str(error))
+
         except Exception as error:
             self.bot.logger.error(f"Unexpected error in download command: {error}", exc_info=error)
             embed = ErrorEmbedFactory.create_error_embed(error)
             await interaction.followup.send(embed=embed)
 
+        finally:
+            # the answer went out as a new message when the progress message was edited
+            await reporter.clear()
+
+    async def _deliver_with_preview(self, interaction: discord.Interaction, download_request: DownloadRequest,
+                                    cancellation: CancellationToken, context: Dict[str, Any],
+                                    reporter: InteractionProgressReporter) -> None:
+        """Post the preview as soon as it's ready, then edit it into the requested quality."""
+        preview_message: discord.WebhookMessage | None = None
+        outputs = self.progressive_usecase.execute(download_request, cancellation, context, reporter.tracker)
+        async with aclosing(outputs), reporter:
+            async for output in outputs:
+                # progress edits would overwrite the preview once it replaced the deferred response
+                await reporter.stop()
+                if output.preview_quality:
+                    content = f"Preview in {output.preview_quality.value}, {self._upcoming_quality(download_request, reporter.tracker)} is on its way..."
+                    if output.file_url:
+                        content += f"\nLink: {output.file_url}"
+                    message = {**self._completed_message(output), "content": content}
+                    preview_message = await interaction.followup.send(**message, wait=True)
+                    continue
+                if preview_message is None:
+                    await interaction.followup.send(**self._completed_message(output))
+                    continue
+                try:
+                    await preview_message.edit(**self._edited_message(output))
+                except discord.HTTPException as error:
+                    self.bot.logger.warning(f"Failed to replace preview, sending a new message: {error}")
+                    await interaction.followup.send(**self._completed_message(output))
+
+    @staticmethod
+    def _upcoming_quality(download_request: DownloadRequest, progress: ProgressTracker) -> str:
+        """The quality the full download is fetching, the request's may be lowered to finish in time."""
+        if progress.quality is not None:
+            return progress.quality.value
+        return "a higher quality" if download_request.auto_quality else download_request.quality.value
+
+    @download.autocomplete("url")
+    async def url_autocomplete(self, interaction: discord.Interaction, current: str) -> List[Choice[str]]:
+        """Suggest cached URLs matching what was typed, served from memory."""
+        choices: List[Choice[str]] = []
+        for url, title in self.cache_manager.search(current, DEFAULT_SEARCH_RESULTS * 2):
+            # choice values can't be longer than 100 characters
+            if len(url) > DISCORD_CHOICE_MAX_LENGTH:
+                continue
+            name = f"{title} - {url}" if title else url
+            choices.append(Choice(name=self._truncate(name, DISCORD_CHOICE_MAX_LENGTH), value=url))
+            if len(choices) == DEFAULT_SEARCH_RESULTS:
+                break
+        return choices
+
+    def _completed_message(self, download_output: DownloadOutput) -> Dict[str, Any]:
+        """Content and attachments announcing a finished download, as send() keyword arguments."""
+        file_size_mb = self._bytes_to_megabytes(download_output.file_size) if download_output.file_size else "Unknown"
+        elapsed = self._normalize_elapsed_time(download_output.elapsed)
+        savings = self._format_savings(download_output.bytes_saved, download_output.time_saved)
+
+        if download_output.file_url:
+            content = f"Download Completed! {f"Download Elapsed: {elapsed}s" if elapsed else None}, Filesize: {file_size_mb} MB{savings}\nLink: {download_output.file_url}"
+            return {"content": content}
+        if download_output.file_path:
+            content = f"Download Completed! {f'Elapsed: {elapsed}s' if elapsed else ''}, Filesize: {file_size_mb} MB{savings}"
+            return {"content": content, "file": discord.File(download_output.file_path)}
+        if download_output.file_paths:
+            content = f"Download Completed! {f'Elapsed: {elapsed}s' if elapsed else ''}, Filesize: {file_size_mb} MB in {len(download_output.file_paths)} parts{savings}"
+            return {"content": content, "files": [discord.File(path) for path in download_output.file_paths]}
+        return {"content": "Download completed, but no file URL or path was provided."}
+
+    def _edited_message(self, download_output: DownloadOutput) -> Dict[str, Any]:
+        """The completed message as edit() keyword arguments, its attachments replace the ones of the message."""
+        message = self._completed_message(download_output)
+        files = [message.pop("file")] if "file" in message else message.pop("files", [])
+        return {**message, "attachments": files}
+
+    def _can_send_instantly(self, download_output: DownloadOutput) -> bool:
+        """Links always fit the first response, attachments only while small enough to upload in time."""
+        if download_output.file_url:
+            return True
+        paths = download_output.file_paths or ((download_output.file_path,) if download_output.file_path else ())
+        return sum(path.stat().st_size for path in paths) <= DEFAULT_INSTANT_REPLY_MAX_UPLOAD
+
+    @app_commands.command(name="cancel", description="Cancel your running downloads")
+    async def cancel(self, interaction: discord.Interaction) -> None:
+        """Cancel command to stop the downloads started by the user."""
+        cancelled = self.task_manager.cancel_owner(interaction.user.id, "cancelled by the user")
+        if cancelled:
+            await interaction.response.send_message(f"Cancelled {cancelled} download(s).", ephemeral=True)
+        else:
+            await interaction.response.send_message("You have no running downloads.", ephemeral=True)
+
+    async def _resume_job(self, entry: JournalEntry) -> None:
+        """Run an interrupted job again and post its result, or a notice, where it was requested."""
+        channel = await self._get_channel(entry.context)
+        user_id = entry.context.get("user_id")
+        mention = f"<@{user_id}> " if user_id else ""
+        url = entry.request.url
+
+        with self.task_manager.track(owner=user_id) as cancellation:
+            try:
+                download_output = await self.download_usecase.execute(entry.request, cancellation, entry.context, entry.job_id)
+            except DownloadCancelled as error:
+                if not cancellation.resumable and channel:
+                    await channel.send(f"{mention}{error}")
+                return
+            except Exception as error:
+                self.bot.logger.error(f"Failed to resume download {entry.job_id}: {error}", exc_info=error)
+                if channel:
+                    await channel.send(f"{mention}Your download of <{url}> was interrupted by a restart and could not be finished: {error}")
+                return
+
+        if channel is None:
+            self.bot.logger.warning(f"Resumed download {entry.job_id} finished, but its channel is gone")
+            return
+
+        file_size_mb = self._bytes_to_megabytes(download_output.file_size) if download_output.file_size else "Unknown"
+        content = f"{mention}Your download of <{url}> was resumed after a restart and finished! Filesize: {file_size_mb} MB"
+        if download_output.file_url:
+            await channel.send(f"{content}\nLink: {download_output.file_url}")
+        elif download_output.file_path:
+            await channel.send(content, file=discord.File(download_output.file_path))
+        elif download_output.file_paths:
+            await channel.send(f"{content} ({len(download_output.file_paths)} parts)",
+                               files=[discord.File(path) for path in download_output.file_paths])
+
+    async def _get_channel(self, context: Dict[str, Any]) -> discord.abc.Messageable | None:
+        channel_id = context.get("channel_id")
+        if not channel_id:
+            return None
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except discord.DiscordException:
+                return None
+        return channel
+
     def _calculate_file_size_limit(self, interaction: discord.Interaction) -> int:
-        """Calculate the file size limit based on guild settings."""
-        return self.download_settings.file_size_limit
+        """Calculate the file size limit based on guild settings.
+
+        Discord sends the attachment limit of the interaction's context (guild boosts, DMs) with
+        the interaction itself, the guild's boost tier is the fallback.
+        The configured limit can only lower Discord's, a bigger attachment would be rejected.
+        """
+        configured = self.download_settings.file_size_limit
+        limit = getattr(interaction, "filesize_limit", None)
+        if not limit and interaction.guild is not None:
+            limit = interaction.guild.filesize_limit
+        return min(limit, configured) if limit else configured
 
     def _normalize_elapsed_time(self, elapsed: float | None) -> float | None:
         """Normalize elapsed time to two decimal places."""
@@ -86,6 +293,42 @@ class DownloadCog(commands.Cog):
             return None
         return round(elapsed, 2)
     
+    def _format_savings(self, bytes_saved: int | None, time_saved: float | None) -> str:
+        """Describe what downloading only a clip saved, empty if nothing was clipped."""
+        if not bytes_saved:
+            return ""
+        time_part = f", ~{self._normalize_elapsed_time(time_saved)}s" if time_saved else ""
+        return f" (clip saved ~{self._bytes_to_megabytes(bytes_saved)} MB{time_part})"
+
+    def _parse_time_range(self, start: str | None, end: str | None) -> TimeRange | None:
+        """Parse the clip bounds of the command, None if no clip was asked."""
+        if start is None and end is None:
+            return None
+        return TimeRange(
+            start=self._parse_timestamp(start) if start is not None else 0.0,
+            end=self._parse_timestamp(end) if end is not None else None,
+        )
+
+    def _parse_timestamp(self, value: str) -> float:
+        """Parse [[hours:]minutes:]seconds into seconds, to the millisecond."""
+        try:
+            parts = [float(part) for part in value.strip().split(":")]
+        except ValueError:
+            raise InvalidTimeRange(f"Invalid timestamp: {value}. Use a format like 1:02:03 or 90")
+        # float() also takes "inf" and "nan"
+        if len(parts) > 3 or any(not math.isfinite(part) or part < 0 for part in parts):
+            raise InvalidTimeRange(f"Invalid timestamp: {value}. Use a format like 1:02:03 or 90")
+
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + part
+        # cache keys keep milliseconds
+        return round(seconds, 3)
+
+    @staticmethod
+    def _truncate(text: str, length: int) -> str:
+        return text if len(text) <= length else text[:length - 3] + "..."
+
     def _bytes_to_megabytes(self, bytes_size: int) -> int:
         """Convert bytes to megabytes."""
         return round(bytes_size / (1024 * 1024), 2)
@@ -0,0 +1,24 @@
+import discord
+from discord.ext import commands
+from src.application.services.download import SpeculativeProbeService
+from src.domain.models.settings.download_settings import DownloadSettings
+
+class SpeculativeProbeCog(commands.Cog):
+    """Cog probing the media links posted in guilds, when enabled in the download settings."""
+
+    def __init__(self, bot: commands.Bot, speculative_probe: SpeculativeProbeService,
+                 download_settings: DownloadSettings) -> None:
+        self.bot = bot
+        self.speculative_probe = speculative_probe
+        self.download_settings = download_settings
+
+    async def cog_unload(self) -> None:
+        await self.speculative_probe.close()
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        if not self.download_settings.speculative_probe or message.guild is None or message.author.bot:
+            return
+        if "http" not in message.content:
+            return
+        self.speculative_probe.submit(message.content, self.download_settings.file_size_limit)
\ No newline at end of file
@@ -0,0 +1,3 @@
+from .interaction_progress_reporter import InteractionProgressReporter
+
+__all__ = ["InteractionProgressReporter"]
\ No newline at end of file
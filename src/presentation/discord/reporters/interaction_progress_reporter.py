@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import discord
+from logging import Logger
+from typing import Optional
+from src.domain.models import DownloadProgress, ProgressTracker
+from src.core.constants import DEFAULT_PROGRESS_EDIT_INTERVAL
+
+STAGE_LABELS = {
+    "probe": "Inspecting",
+    "fetch": "Downloading",
+    "postprocess": "Processing",
+    "route": "Processing",
+    "split": "Splitting",
+    "upload": "Uploading",
+    "deliver": "Finishing",
+}
+
+class InteractionProgressReporter():
+    """Shows the progress of a job by editing the deferred response of its interaction.
+
+    The tracker is polled from the event loop and the response is edited at most once per interval,
+    only when something changed. Every edit is awaited before the next poll, so a rate limited edit
+    delays the following one instead of piling up requests.
+    """
+
+    def __init__(self, interaction: discord.Interaction, tracker: ProgressTracker,
+                 interval: float = DEFAULT_PROGRESS_EDIT_INTERVAL, logger: Optional[Logger] = None) -> None:
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.interaction = interaction
+        self.tracker = tracker
+        self.interval = interval
+        self.edited = False
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "InteractionProgressReporter":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def stop(self) -> None:
+        """Stop editing, before anything else is sent to the interaction."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def clear(self) -> None:
+        """Delete the progress message once the answer was sent as a new one.
+
+        While the response was never edited, the answer replaced it and there is nothing to delete.
+        """
+        if not self.edited:
+            return
+        try:
+            await self.interaction.delete_original_response()
+        except discord.HTTPException as error:
+            self.logger.debug(f"Failed to delete progress message: {error}")
+
+    async def _run(self) -> None:
+        last: DownloadProgress | None = None
+        while True:
+            await asyncio.sleep(self.interval)
+            progress = self.tracker.snapshot()
+            if progress == last:
+                continue
+            last = progress
+            # set first, an edit cut short by the job finishing may still reach Discord
+            self.edited = True
+            try:
+                await self.interaction.edit_original_response(content=self.format(progress))
+            except discord.HTTPException as error:
+                self.logger.debug(f"Failed to edit progress message: {error}")
+
+    @staticmethod
+    def format(progress: DownloadProgress) -> str:
+        label = STAGE_LABELS.get(progress.stage, progress.stage.capitalize())
+        if not progress.downloaded_bytes:
+            return f"{label}..."
+
+        content = f"{label}... {progress.downloaded_bytes / (1024 * 1024):.1f}"
+        if progress.total_bytes:
+            content += f"/{progress.total_bytes / (1024 * 1024):.1f} MB ({progress.fraction:.0%})"
+        else:
+            content += " MB"
+        if progress.speed:
+            content += f" at {progress.speed / (1024 * 1024):.1f} MB/s"
+        if progress.eta is not None:
+            minutes, seconds = divmod(int(progress.eta), 60)
+            content += f", ETA {minutes}:{seconds:02d}"
+        return content
\ No newline at end of file
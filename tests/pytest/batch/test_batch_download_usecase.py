@@ -0,0 +1,97 @@
+import asyncio
+import zipfile
+import pytest
+from pathlib import Path
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock
+from src.application.usecases.batch_download_usecase import BatchDownloadUsecase
+from src.application.dto.request.batch_request import BatchRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.domain.enum import BatchDelivery, Formats
+from src.infrastructure.services.archive import ZipArchiveService
+
+class FakeExpander():
+    def __init__(self) -> None:
+        self.pulled = 0
+
+    async def expand(self, url: str, max_items: int):
+        for index in range(min(10, max_items)):
+            self.pulled += 1
+            yield f"{url}/{index}"
+
+class FakeDownloads():
+    def __init__(self, folder: Path, expander: FakeExpander) -> None:
+        self.folder = folder
+        self.expander = expander
+        self.running = 0
+        self.max_running = 0
+        self.max_ahead = 0
+        self.contexts = []
+
+    async def execute(self, request, cancellation=None, context=None) -> DownloadOutput:
+        self.contexts.append(context)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        index = int(request.url.rsplit("/", 1)[1])
+        if index == 3:
+            raise ValueError("broken item")
+        if index % 2:
+            return DownloadOutput(file_url=f"https://drive/{index}", file_size=1)
+        path = self.folder / f"{index}.mp4"
+        path.write_bytes(b"x" * 10)
+        return DownloadOutput(file_path=path, file_size=10)
+
+class FakeStorage():
+    async def upload(self, file_path: Path) -> str:
+        return f"https://drive/{file_path.name}"
+
+    async def upload_growing(self, growing_file, cancellation=None) -> str:
+        while not growing_file.is_finished:
+            await asyncio.to_thread(growing_file.wait, 0.01)
+        return "https://drive/batch.zip"
+
+class FakeTemp():
+    def __init__(self, folder: Path) -> None:
+        self.folder = folder
+
+    @asynccontextmanager
+    async def create_session(self, session_id=None):
+        yield self.folder
+
+def _usecase(tmp_path: Path, max_items: int = 50) -> tuple[BatchDownloadUsecase, FakeDownloads, FakeExpander]:
+    expander = FakeExpander()
+    downloads = FakeDownloads(tmp_path, expander)
+    usecase = BatchDownloadUsecase(downloads, expander, FakeStorage(), FakeTemp(tmp_path), ZipArchiveService(),
+                                   logger=MagicMock(), concurrency=2, max_items=max_items)
+    return usecase, downloads, expander
+
+@pytest.mark.asyncio
+async def test_batch_runs_items_within_its_concurrency_and_links_everything(tmp_path: Path) -> None:
+    usecase, downloads, expander = _usecase(tmp_path, max_items=6)
+
+    output = await usecase.execute(BatchRequest(urls=("https://list",), file_size_limit=10, format=Formats.MP4),
+                                   context={"channel_id": 1})
+
+    assert downloads.max_running == 2
+    # items are tagged so a restart doesn't deliver them one by one
+    assert downloads.contexts[0] == {"channel_id": 1, "source": "batch"}
+    assert expander.pulled == 6
+    assert [item.error for item in output.items].count("broken item") == 1
+    assert output.items[0].output.file_url == "https://drive/0.mp4"
+    assert output.items[1].output.file_url == "https://drive/1"
+
+@pytest.mark.asyncio
+async def test_batch_streams_local_items_into_a_zip(tmp_path: Path) -> None:
+    usecase, _, _ = _usecase(tmp_path, max_items=4)
+
+    output = await usecase.execute(BatchRequest(urls=("https://list",), file_size_limit=10, format=Formats.MP4,
+                                                delivery=BatchDelivery.ZIP))
+
+    assert output.archive_url == "https://drive/batch.zip"
+    with zipfile.ZipFile(tmp_path / "batch.zip") as archive:
+        names = archive.namelist()
+        assert sorted(name.split(" - ")[1] for name in names if " - " in name) == ["0.mp4", "2.mp4"]
+        links = archive.read("links.txt").decode()
+    assert "https://drive/1" in links and "broken item" in links
\ No newline at end of file
@@ -0,0 +1,40 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+from src.application.services import CacheManager
+from src.application.models.dataclasses.cache_key import CacheKey
+from src.application.models.dataclasses.cached_item import CachedItem
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.domain.models import TimeRange
+
+def _round_trip(key: CacheKey) -> CacheKey:
+    manager = CacheManager(storage=MagicMock(), logger=MagicMock())
+    item = CachedItem(key=key, local_path=Path("video.mp4"), remote_url=None, file_size=10)
+    return manager._deserialize_item(manager._serialize_item(item)).key
+
+def test_clip_keys_survive_the_index() -> None:
+    clip = CacheKey(url="https://example.com/v", format_value=Formats.MP4, quality=Quality._720,
+                    time_range=TimeRange(30, 90.5))
+    open_ended = CacheKey(url="https://example.com/v", format_value=Formats.MP4, time_range=TimeRange(12))
+
+    assert _round_trip(clip) == clip
+    assert _round_trip(open_ended) == open_ended
+
+def test_clip_keys_differ_from_the_whole_media() -> None:
+    manager = CacheManager(storage=MagicMock(), logger=MagicMock())
+    whole = CacheKey(url="https://example.com/v", format_value=Formats.MP4, quality=Quality._720)
+    clip = CacheKey(url="https://example.com/v", format_value=Formats.MP4, quality=Quality._720,
+                    time_range=TimeRange(0, 30))
+
+    assert manager._key_to_str(whole) != manager._key_to_str(clip)
+    assert manager._key_to_str(whole) == "https://example.com/v|mp4|720p"
+
+def test_clip_keys_keep_milliseconds() -> None:
+    manager = CacheManager(storage=MagicMock(), logger=MagicMock())
+
+    def _key(time_range: TimeRange) -> str:
+        return manager._key_to_str(CacheKey(url="https://example.com/v", format_value=Formats.MP4, time_range=time_range))
+
+    assert _key(TimeRange(10800.25, 10900)) != _key(TimeRange(10800.2, 10900))
+    tiny = CacheKey(url="https://example.com/v", format_value=Formats.MP4, time_range=TimeRange(0.001, 5))
+    assert _round_trip(tiny) == tiny
\ No newline at end of file
@@ -0,0 +1,46 @@
+import pytest
+from unittest.mock import MagicMock
+from src.application.services import CacheManager
+from src.application.models.dataclasses.cache_key import CacheKey
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+
+class MemoryStorage():
+    def __init__(self) -> None:
+        self.index = {}
+        self.loads = 0
+
+    async def load_index(self):
+        self.loads += 1
+        return dict(self.index)
+
+    async def save_index(self, index):
+        self.index = dict(index)
+
+KEY = CacheKey(url="https://example.com/v", format_value=Formats.MP4, quality=Quality._720)
+
+@pytest.mark.asyncio
+async def test_peek_sees_stored_items_without_io() -> None:
+    storage = MemoryStorage()
+    manager = CacheManager(storage=storage, logger=MagicMock())
+    assert manager.peek_item(KEY) is None
+
+    await manager.store_item(KEY, source_file=None, remote_url="https://drive/file", file_size=10)
+    loads = storage.loads
+
+    item = manager.peek_item(KEY)
+    assert item is not None and item.remote_url == "https://drive/file"
+    assert storage.loads == loads
+
+@pytest.mark.asyncio
+async def test_lookup_refreshes_entries_written_elsewhere() -> None:
+    storage = MemoryStorage()
+    manager = CacheManager(storage=storage, logger=MagicMock())
+    await manager.get_item(KEY)
+    assert manager.peek_item(KEY) is None
+
+    # another process (like an ingest run) writes the index
+    storage.index[manager._key_to_str(KEY)] = {"local_path": None, "remote_url": "https://drive/file", "file_size": 10}
+
+    assert await manager.get_item(KEY) is not None
+    assert manager.peek_item(KEY) is not None
\ No newline at end of file
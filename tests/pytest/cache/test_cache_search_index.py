@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+from src.application.services import CacheSearchIndex
+from src.application.services import cache_search_index
+
+def test_search_matches_prefixes_and_titles() -> None:
+    index = CacheSearchIndex(logger=MagicMock())
+    index.add("https://www.youtube.com/watch?v=abc123", "Never Gonna Give You Up")
+    index.add("https://youtu.be/xyz", "Lofi beats to study")
+    index.add("https://example.com/video.mp4")
+
+    assert [url for url, _ in index.search("youtube.com/watch")] == ["https://www.youtube.com/watch?v=abc123"]
+    assert [url for url, _ in index.search("https://youtu.be")] == ["https://youtu.be/xyz"]
+    assert [url for url, _ in index.search("gonna give")] == ["https://www.youtube.com/watch?v=abc123"]
+    assert index.search("nothing like this") == []
+
+def test_search_ranks_used_entries_first() -> None:
+    index = CacheSearchIndex(logger=MagicMock())
+    for number in range(5):
+        index.add(f"https://example.com/{number}", f"Clip {number}")
+    index.touch("https://example.com/1")
+    index.touch("https://example.com/1")
+    index.touch("https://example.com/3")
+
+    assert [url for url, _ in index.search("clip", limit=2)] == ["https://example.com/1", "https://example.com/3"]
+
+def test_entries_stay_while_a_key_uses_the_url() -> None:
+    index = CacheSearchIndex(logger=MagicMock())
+    # the same URL cached in two formats
+    index.add("https://example.com/v", "Song")
+    index.add("https://example.com/v", "Song")
+
+    index.remove("https://example.com/v")
+    assert index.search("song") == [("https://example.com/v", "Song")]
+    index.remove("https://example.com/v")
+    assert index.search("song") == []
+    assert len(index) == 0
+
+def test_bulk_adds_are_sorted_once_and_short_queries_scan_a_bounded_number_of_entries(monkeypatch) -> None:
+    monkeypatch.setattr(cache_search_index, "INSERT_LIMIT", 1)
+    monkeypatch.setattr(cache_search_index, "SCAN_LIMIT", 2)
+    index = CacheSearchIndex(logger=MagicMock())
+    index.add_many([("https://example.com/zz", "Old ab"), ("https://example.com/b", "Clip"), ("https://example.com/c", "Clip")])
+    index.sort()
+    index.touch("https://example.com/b")
+    index.touch("https://example.com/c")
+
+    # too short for trigrams: ids still match by prefix, titles only among the best ranked entries
+    assert index.search("zz") == [("https://example.com/zz", "Old ab")]
+    assert index.search("ab") == []
+    assert [url for url, _ in index.search("cl")] == ["https://example.com/c", "https://example.com/b"]
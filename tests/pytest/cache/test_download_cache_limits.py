@@ -0,0 +1,66 @@
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+from src.application.services import CacheManager
+from src.application.services.download import DownloadCacheService
+from src.application.dto.request.download_request import DownloadRequest
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+
+class MemoryStorage():
+    def __init__(self) -> None:
+        self.index = {}
+
+    async def load_index(self):
+        return dict(self.index)
+
+    async def save_index(self, index):
+        self.index = dict(index)
+
+    async def move_file_to_cache(self, key, source_path):
+        return source_path
+
+def _request(limit: int) -> DownloadRequest:
+    return DownloadRequest(url="https://example.com/v", file_size_limit=limit, format=Formats.MP4)
+
+@pytest.mark.asyncio
+async def test_attachments_are_only_reused_for_their_limit(tmp_path: Path) -> None:
+    service = DownloadCacheService(cache_manager=CacheManager(storage=MemoryStorage(), logger=MagicMock()))
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"x" * 40)
+
+    boosted = _request(50)
+    await service.cache_manager.store_item(service.create_cache_key(boosted, attached=True), source_file=video,
+                                           remote_url=None, file_size=40)
+
+    assert (await service.get_cached_output(boosted)).file_path == video
+    assert await service.get_cached_output(_request(10)) is None
+
+@pytest.mark.asyncio
+async def test_links_and_fitting_legacy_files_serve_every_limit(tmp_path: Path) -> None:
+    service = DownloadCacheService(cache_manager=CacheManager(storage=MemoryStorage(), logger=MagicMock()))
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"x" * 40)
+
+    # stored before keys carried the limit
+    await service.cache_manager.store_item(service.create_cache_key(_request(50)), source_file=video,
+                                           remote_url=None, file_size=40)
+    assert await service.get_cached_output(_request(10)) is None
+    assert service.peek_cached_output(_request(100)).file_path == video
+
+    await service.store_uploaded(service.create_cache_key(_request(10)), "https://drive/file", 40)
+    assert (await service.get_cached_output(_request(10))).file_url == "https://drive/file"
+
+@pytest.mark.asyncio
+async def test_lowered_auto_quality_is_kept_under_the_quality_delivered() -> None:
+    service = DownloadCacheService(cache_manager=CacheManager(storage=MemoryStorage(), logger=MagicMock()))
+    auto = DownloadRequest(url="https://example.com/v", file_size_limit=100, format=Formats.MP4,
+                           quality=Quality._1080, auto_quality=True)
+
+    await service.store_uploaded(service.create_cache_key(auto, quality=Quality._360), "https://drive/360", 40)
+    assert await service.get_cached_output(auto) is None
+    explicit = DownloadRequest(url="https://example.com/v", file_size_limit=100, format=Formats.MP4, quality=Quality._360)
+    assert (await service.get_cached_output(explicit)).file_url == "https://drive/360"
+
+    await service.store_uploaded(service.create_cache_key(auto, quality=Quality._1080), "https://drive/1080", 40)
+    assert (await service.get_cached_output(auto)).file_url == "https://drive/1080"
\ No newline at end of file
@@ -0,0 +1,93 @@
+import time
+import threading
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from src.domain.models import CancellationToken
+from src.domain.exceptions import DownloadCancelled
+from src.application.services import TaskManager
+from src.domain.enum.quality import Quality
+from src.infrastructure.services.ffmpeg import FFmpegProcessPool
+from src.infrastructure.services.ytdlp import YtdlpDownloadService
+
+def test_token_runs_callbacks_once() -> None:
+    token = CancellationToken()
+    reasons = []
+    token.on_cancel(reasons.append)
+
+    token.cancel("first")
+    token.cancel("second")
+
+    assert reasons == ["first"]
+    with pytest.raises(DownloadCancelled):
+        token.raise_if_cancelled()
+
+def test_token_cancels_after_deadline() -> None:
+    token = CancellationToken(timeout=0)
+
+    assert token.is_cancelled
+    assert token.reason == "deadline exceeded"
+
+def test_token_calls_late_callbacks_right_away() -> None:
+    token = CancellationToken()
+    token.cancel("done")
+    reasons = []
+
+    token.on_cancel(reasons.append)
+
+    assert reasons == ["done"]
+
+def test_task_manager_cancels_by_owner() -> None:
+    manager = TaskManager(logger=MagicMock())
+
+    with manager.track(owner=1) as first, manager.track(owner=2) as second:
+        assert manager.cancel_owner(1, "user gave up") == 1
+        assert first.is_cancelled and not second.is_cancelled
+    assert manager.active == 0
+
+@pytest.mark.asyncio
+async def test_process_pool_kills_cancelled_process() -> None:
+    pool = FFmpegProcessPool(size=1, niceness=0, logger=MagicMock())
+    token = CancellationToken()
+    asyncio.get_running_loop().call_later(0.1, token.cancel, "stop")
+
+    started = time.monotonic()
+    with pytest.raises(DownloadCancelled):
+        await pool.run(["sleep", "5"], token)
+
+    assert time.monotonic() - started < 2
+
+
+@pytest.mark.asyncio
+async def test_process_pool_stops_waiting_for_a_slot_on_cancel() -> None:
+    pool = FFmpegProcessPool(size=1, niceness=0, logger=MagicMock())
+    busy = asyncio.create_task(pool.run(["sleep", "5"]))
+    await asyncio.sleep(0.1)
+    token = CancellationToken()
+    asyncio.get_running_loop().call_later(0.1, token.cancel, "stop")
+
+    started = time.monotonic()
+    with pytest.raises(DownloadCancelled):
+        await pool.run(["echo", "late"], token)
+
+    assert time.monotonic() - started < 2
+    busy.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await busy
+    # the cancelled wait didn't keep the slot
+    assert await asyncio.wait_for(pool.run(["echo", "ok"]), 5) == "ok\n"
+
+@pytest.mark.asyncio
+async def test_probe_stops_waiting_for_the_extraction_on_cancel() -> None:
+    service = YtdlpDownloadService(MagicMock(), logger=MagicMock())
+    release = threading.Event()
+    service._probe_sync = lambda *args: release.wait(5)
+    token = CancellationToken()
+    asyncio.get_running_loop().call_later(0.1, token.cancel, "stop")
+
+    started = time.monotonic()
+    with pytest.raises(DownloadCancelled):
+        await service.probe("https://example.com/v", None, Quality._720, token)
+
+    assert time.monotonic() - started < 2
+    release.set()
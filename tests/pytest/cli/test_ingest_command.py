@@ -0,0 +1,99 @@
+import io
+import json
+import asyncio
+import pytest
+from pathlib import Path
+from typing import AsyncIterator, Iterable
+from unittest.mock import MagicMock
+from src.application.dto.output.download_output import DownloadOutput
+from src.domain.models.settings.download_settings import DownloadSettings
+from src.domain.enum import Formats, Quality
+from src.application.services import TaskManager
+from src.bootstrap.models import IngestApplication
+from src.domain.exceptions import DownloadCancelled
+from src.presentation.cli import IngestCommand
+
+class FakeUsecase():
+    def __init__(self) -> None:
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+
+    async def execute(self, request, cancellation=None, context=None, job_id=None):
+        self.requests.append(request)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if "broken" in request.url:
+            raise RuntimeError("extractor failed")
+        return DownloadOutput(file_path=Path("/cache/video.mp4"), file_size=1000, elapsed=0.01)
+
+    async def pending_jobs(self):
+        return []
+
+async def _lines(lines: Iterable[str]) -> AsyncIterator[str]:
+    for line in lines:
+        yield line
+
+@pytest.mark.asyncio
+async def test_ingest_reports_every_line() -> None:
+    usecase = FakeUsecase()
+    command = IngestCommand(usecase, DownloadSettings(), TaskManager(), MagicMock(), parallelism=2)
+    report = io.StringIO()
+
+    summary = await command.run(_lines([
+        "# comment\n", "https://a.example/1 mp3\n", "\n", "https://broken.example/2\n",
+        "https://a.example/3 1080p webm\n", "https://a.example/4\n",
+    ]), report)
+
+    records = [json.loads(line) for line in report.getvalue().splitlines()]
+    items = sorted((record for record in records if record["type"] == "item"), key=lambda record: record["line"])
+    assert [item["status"] for item in items] == ["ok", "failed", "ok", "ok"]
+    assert items[1]["error_type"] == "RuntimeError"
+    assert records[-1] == summary
+    assert summary["succeeded"] == 3 and summary["bytes"] == 3000
+    assert usecase.max_running == 2
+
+    by_url = {request.url: request for request in usecase.requests}
+    assert by_url["https://a.example/1"].format == Formats.MP3
+    assert by_url["https://a.example/3"].quality == Quality._1080
+
+@pytest.mark.asyncio
+async def test_ingest_rejects_unknown_options() -> None:
+    usecase = FakeUsecase()
+    command = IngestCommand(usecase, DownloadSettings(), TaskManager(), MagicMock())
+    report = io.StringIO()
+
+    summary = await command.run(_lines(["https://a.example/1 flac\n"]), report)
+
+    assert summary["failed"] == 1
+    assert usecase.requests == []
+
+class BlockingUsecase():
+    """Runs until its job is cancelled, like a download still going when the process stops."""
+
+    def __init__(self) -> None:
+        self.started = asyncio.Event()
+
+    async def execute(self, request, cancellation=None, context=None, job_id=None):
+        self.started.set()
+        while not cancellation.is_cancelled:
+            await asyncio.sleep(0.01)
+        raise DownloadCancelled(f"Download cancelled: {cancellation.reason}")
+
+@pytest.mark.asyncio
+async def test_ingest_shutdown_cancels_running_jobs() -> None:
+    usecase = BlockingUsecase()
+    task_manager = TaskManager()
+    command = IngestCommand(usecase, DownloadSettings(), task_manager, MagicMock())
+    application = IngestApplication(command, drive=None, task_manager=task_manager, input_path="-", report_path="-")
+    report = io.StringIO()
+
+    run = asyncio.create_task(command.run(_lines(["https://a.example/1\n"]), report))
+    await usecase.started.wait()
+    await application.shutdown()
+    summary = await run
+
+    assert summary["cancelled"] == 1
+    assert task_manager.active == 0
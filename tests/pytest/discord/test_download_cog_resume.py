@@ -0,0 +1,27 @@
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.models.dataclasses import JournalEntry
+from src.domain.enum.formats import Formats
+from src.domain.models.settings import DownloadSettings
+from src.presentation.discord.commands.download_command import DownloadCog
+
+def _entry(job_id: str, context: dict) -> JournalEntry:
+    request = DownloadRequest(url=f"https://example.com/{job_id}", file_size_limit=10, format=Formats.MP4)
+    return JournalEntry(job_id=job_id, request=request, stage="fetch", context=context, temp_path=Path(job_id))
+
+@pytest.mark.asyncio
+async def test_only_plain_downloads_are_resumed() -> None:
+    download_usecase = MagicMock(pending_jobs=AsyncMock(return_value=[
+        _entry("plain", {"channel_id": 1}),
+        _entry("item", {"channel_id": 1, "source": "batch"}),
+        _entry("preview", {"channel_id": 1, "source": "preview"}),
+    ]), discard_job=AsyncMock())
+    cog = DownloadCog(MagicMock(), download_usecase, DownloadSettings(), MagicMock(), MagicMock(load=AsyncMock()), MagicMock())
+    cog._resume_job = AsyncMock()
+
+    await cog.on_ready()
+
+    assert [call.args[0].job_id for call in cog._resume_job.call_args_list] == ["plain"]
+    assert [call.args[0] for call in download_usecase.discard_job.await_args_list] == ["item", "preview"]
\ No newline at end of file
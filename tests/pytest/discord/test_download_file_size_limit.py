@@ -0,0 +1,21 @@
+from unittest.mock import MagicMock
+from src.domain.models.settings import DownloadSettings
+from src.presentation.discord.commands.download_command import DownloadCog
+
+def _cog(configured_limit: int) -> DownloadCog:
+    return DownloadCog(MagicMock(), MagicMock(), DownloadSettings(file_size_limit=configured_limit),
+                       MagicMock(), MagicMock(), MagicMock())
+
+def test_interaction_limit_comes_first() -> None:
+    interaction = MagicMock(filesize_limit=10, guild=MagicMock(filesize_limit=50))
+
+    assert _cog(100)._calculate_file_size_limit(interaction) == 10
+    # the configured limit still caps the interaction's, like it caps the guild's
+    assert _cog(5)._calculate_file_size_limit(interaction) == 5
+
+def test_configured_limit_never_raises_the_guild_limit() -> None:
+    cog = _cog(100)
+
+    assert cog._calculate_file_size_limit(MagicMock(filesize_limit=None, guild=MagicMock(filesize_limit=50))) == 50
+    assert _cog(20)._calculate_file_size_limit(MagicMock(filesize_limit=None, guild=MagicMock(filesize_limit=50))) == 20
+    assert cog._calculate_file_size_limit(MagicMock(filesize_limit=None, guild=None)) == 100
\ No newline at end of file
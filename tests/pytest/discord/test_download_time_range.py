@@ -0,0 +1,17 @@
+import pytest
+from unittest.mock import MagicMock
+from src.domain.exceptions import InvalidTimeRange
+from src.domain.models.settings import DownloadSettings
+from src.presentation.discord.commands.download_command import DownloadCog
+
+def _cog() -> DownloadCog:
+    return DownloadCog(MagicMock(), MagicMock(), DownloadSettings(), MagicMock(), MagicMock(), MagicMock())
+
+def test_timestamps_are_parsed_to_the_millisecond() -> None:
+    assert _cog()._parse_timestamp("1:02:03.25") == 3723.25
+    assert _cog()._parse_timestamp("0.00001") == 0.0
+
+@pytest.mark.parametrize("value", ["inf", "nan", "1:inf", "-5", "1:2:3:4"])
+def test_timestamps_that_are_not_finite_are_rejected(value: str) -> None:
+    with pytest.raises(InvalidTimeRange):
+        _cog()._parse_timestamp(value)
\ No newline at end of file
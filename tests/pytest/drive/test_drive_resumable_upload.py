@@ -0,0 +1,112 @@
+import os
+import json
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+from src.infrastructure.services.drive.drive_upload_session_store import DriveUploadSession, DriveUploadSessionStore
+from src.infrastructure.services.drive.google_drive_uploader_service import GoogleDriveUploaderService
+
+CHUNK = 256 * 1024
+SESSION_URI = "https://upload.example/session"
+
+class _FakeHttp():
+    """Answers requests from a list, an exception in it is raised like a dropped connection."""
+
+    def __init__(self, answers: List[Any]) -> None:
+        self.answers = answers
+        self.requests: List[Any] = []
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        self.requests.append((method, uri, dict(headers or {})))
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        status, response_headers, content = answer
+        return httplib2.Response({"status": status, **response_headers}), content
+
+def _upload(tmp_path: Path, file_path: Path, http: _FakeHttp, upload_id: str | None = None) -> str:
+    """A fresh service and store every time, like after a restart."""
+    service = GoogleDriveUploaderService(MagicMock(), "folder", max_retries=0, chunk_size=CHUNK,
+                                         session_store=DriveUploadSessionStore(tmp_path / "sessions.json"))
+    drive_service = build("drive", "v3", http=http, static_discovery=True)
+    return service._upload_chunks(drive_service, file_path, service._session_key(file_path, upload_id))
+
+def _interrupted_run() -> _FakeHttp:
+    return _FakeHttp([
+        (200, {"location": SESSION_URI}, b""),
+        (308, {"range": f"bytes=0-{CHUNK - 1}"}, b""),
+        ConnectionResetError("connection reset"),
+    ])
+
+def test_upload_continues_from_the_offset_drive_acknowledged(tmp_path: Path) -> None:
+    file_path = tmp_path / "video.mp4"
+    file_path.write_bytes(b"x" * (CHUNK * 2 + 100))
+
+    with pytest.raises(ConnectionResetError):
+        _upload(tmp_path, file_path, _interrupted_run())
+
+    # the second chunk reached Drive before the connection dropped
+    second_run = _FakeHttp([
+        (308, {"range": f"bytes=0-{CHUNK * 2 - 1}"}, b""),
+        (200, {}, json.dumps({"id": "abc"}).encode()),
+    ])
+    assert _upload(tmp_path, file_path, second_run) == "abc"
+
+    # the committed offset is asked for first
+    assert [(method, uri) for method, uri, _ in second_run.requests] == [("PUT", SESSION_URI), ("PUT", SESSION_URI)]
+    assert second_run.requests[0][2]["Content-Range"] == f"bytes */{CHUNK * 2 + 100}"
+    assert second_run.requests[1][2]["Content-Range"] == f"bytes {CHUNK * 2}-{CHUNK * 2 + 99}/{CHUNK * 2 + 100}"
+    assert json.loads((tmp_path / "sessions.json").read_text()) == {}
+
+def test_expired_session_is_forgotten(tmp_path: Path) -> None:
+    file_path = tmp_path / "video.mp4"
+    file_path.write_bytes(b"x" * (CHUNK + 100))
+
+    with pytest.raises(ConnectionResetError):
+        _upload(tmp_path, file_path, _interrupted_run(), upload_id="job")
+    assert DriveUploadSessionStore(tmp_path / "sessions.json").get("job").offset == CHUNK
+
+    with pytest.raises(Exception):
+        _upload(tmp_path, file_path, _FakeHttp([(404, {}, b"")]), upload_id="job")
+    assert DriveUploadSessionStore(tmp_path / "sessions.json").get("job") is None
+
+def test_upload_of_a_job_resumes_after_its_file_was_written_again(tmp_path: Path) -> None:
+    file_path = tmp_path / "video.mp4"
+    file_path.write_bytes(b"x" * (CHUNK * 2 + 100))
+    with pytest.raises(ConnectionResetError):
+        _upload(tmp_path, file_path, _interrupted_run(), upload_id="job")
+
+    # fetched again after the restart
+    file_path.write_bytes(b"x" * (CHUNK * 2 + 100))
+    os.utime(file_path, ns=(0, 0))
+    second_run = _FakeHttp([
+        (308, {"range": f"bytes=0-{CHUNK - 1}"}, b""),
+        (308, {"range": f"bytes=0-{CHUNK * 2 - 1}"}, b""),
+        (200, {}, json.dumps({"id": "abc"}).encode()),
+    ])
+    assert _upload(tmp_path, file_path, second_run, upload_id="job") == "abc"
+    assert second_run.requests[1][2]["Content-Range"] == f"bytes {CHUNK}-{CHUNK * 2 - 1}/{CHUNK * 2 + 100}"
+
+def test_session_completed_before_the_restart_is_not_sent_again(tmp_path: Path) -> None:
+    file_path = tmp_path / "video.mp4"
+    file_path.write_bytes(b"x" * (CHUNK + 100))
+    with pytest.raises(ConnectionResetError):
+        _upload(tmp_path, file_path, _interrupted_run(), upload_id="job")
+
+    # the last chunk made it, only its answer was lost
+    second_run = _FakeHttp([(200, {}, json.dumps({"id": "abc"}).encode())])
+    assert _upload(tmp_path, file_path, second_run, upload_id="job") == "abc"
+    assert len(second_run.requests) == 1
+
+def test_saving_next_to_an_expired_session_keeps_the_new_key(tmp_path: Path) -> None:
+    store = DriveUploadSessionStore(tmp_path / "sessions.json", ttl=60)
+    store.save("old", DriveUploadSession(SESSION_URI, CHUNK, created_at=0, size=CHUNK * 2))
+
+    store.save("job", DriveUploadSession(SESSION_URI, CHUNK, created_at=time.time(), size=CHUNK * 2))
+
+    assert DriveUploadSessionStore(tmp_path / "sessions.json", ttl=60).get("job").offset == CHUNK
+    assert json.loads((tmp_path / "sessions.json").read_text()).keys() == {"job"}
\ No newline at end of file
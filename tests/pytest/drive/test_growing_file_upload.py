@@ -0,0 +1,131 @@
+import json
+import asyncio
+import threading
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock
+import httplib2
+import pytest
+from googleapiclient.discovery import build
+from src.domain.models import CancellationToken, GrowingFile
+from src.domain.exceptions import DownloadCancelled
+from src.infrastructure.services.drive.drive_upload_session_store import DriveUploadSessionStore
+from src.infrastructure.services.drive.growing_file_media_upload import GrowingFileMediaUpload
+from src.infrastructure.services.drive.google_drive_uploader_service import GoogleDriveUploaderService
+
+CHUNK = 256 * 1024
+
+class _FakeHttp():
+    """Answers every request with the next answer of the list and keeps what was sent."""
+
+    def __init__(self, answers: List[Any], first_chunk_sent: threading.Event | None = None) -> None:
+        self.answers = answers
+        self.requests: List[Any] = []
+        self.first_chunk_sent = first_chunk_sent
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        self.requests.append((method, dict(headers or {}), body))
+        if self.first_chunk_sent is not None and len(self.requests) == 2:
+            self.first_chunk_sent.set()
+        status, response_headers, content = self.answers.pop(0)
+        return httplib2.Response({"status": status, **response_headers}), content
+
+def _write_later(growing_file: GrowingFile, path: Path, pieces: List[bytes],
+                 finish_gate: threading.Event | None = None) -> threading.Thread:
+    """Writes the pieces from another thread, then waits for finish_gate before reporting the file done."""
+    def write() -> None:
+        with open(path, "wb") as f:
+            growing_file.set_path(path)
+            for piece in pieces:
+                f.write(piece)
+                f.flush()
+        if finish_gate is not None:
+            finish_gate.wait(5)
+        growing_file.finish(path, sum(len(piece) for piece in pieces))
+
+    thread = threading.Thread(target=write)
+    thread.start()
+    return thread
+
+def test_reader_waits_for_the_writer(tmp_path: Path) -> None:
+    growing_file = GrowingFile()
+    with pytest.raises(TimeoutError):
+        growing_file.wait_for_path(timeout=0.01)
+
+    writer = _write_later(growing_file, tmp_path / "video.mp4", [b"x" * 10])
+    assert growing_file.wait_for_path(timeout=5) == tmp_path / "video.mp4"
+    writer.join()
+    assert (growing_file.is_finished, growing_file.final_size) == (True, 10)
+
+def test_reader_gets_the_writer_error() -> None:
+    growing_file = GrowingFile()
+    growing_file.fail(OSError("disk full"))
+
+    with pytest.raises(OSError, match="disk full"):
+        growing_file.wait_for_path(timeout=5)
+
+def test_chunks_are_only_read_once_complete(tmp_path: Path) -> None:
+    growing_file = GrowingFile()
+    media = GrowingFileMediaUpload(growing_file, chunksize=CHUNK, poll_interval=0.01)
+    finish_gate = threading.Event()
+    writer = _write_later(growing_file, tmp_path / "video.mp4", [b"a" * CHUNK, b"b" * 100], finish_gate)
+
+    # more than a chunk is written, so the first one is full even though the size isn't known yet
+    media.wait_for_chunk(0)
+    assert media.size() is None
+    assert media.getbytes(0, CHUNK) == b"a" * CHUNK
+
+    finish_gate.set()
+    writer.join()
+    media.wait_for_chunk(CHUNK)
+    assert media.size() == CHUNK + 100
+    # the last chunk is a short read, the end of the file
+    assert media.getbytes(CHUNK, CHUNK) == b"b" * 100
+    media.close()
+
+@pytest.mark.asyncio
+async def test_upload_growing_commits_the_size_with_the_last_chunk(tmp_path: Path) -> None:
+    first_chunk_sent = threading.Event()
+    http = _FakeHttp([
+        (200, {"location": "https://upload.example/session"}, b""),
+        (308, {"range": f"bytes=0-{CHUNK - 1}"}, b""),
+        (200, {}, json.dumps({"id": "abc"}).encode()),
+        (200, {}, json.dumps({"id": "permission"}).encode()),
+    ], first_chunk_sent)
+    login_service = MagicMock()
+    login_service.get_instance_drive = AsyncMock(return_value=build("drive", "v3", http=http, static_discovery=True))
+    service = GoogleDriveUploaderService(login_service, "folder", stream_chunk_size=CHUNK,
+                                         session_store=DriveUploadSessionStore(tmp_path / "sessions.json"))
+    growing_file = GrowingFile()
+
+    upload = asyncio.create_task(service.upload_growing(growing_file))
+    await asyncio.to_thread(_write_later(growing_file, tmp_path / "video.mp4", [b"a" * CHUNK, b"b" * 100],
+                                         first_chunk_sent).join)
+    file_url = await upload
+
+    assert file_url.endswith("abc")
+    assert [headers.get("Content-Range") for _, headers, _ in http.requests[1:3]] == [
+        f"bytes 0-{CHUNK - 1}/*",
+        f"bytes {CHUNK}-{CHUNK + 99}/{CHUNK + 100}",
+    ]
+
+@pytest.mark.asyncio
+async def test_cancelled_upload_growing_stops_before_sending_a_chunk(tmp_path: Path) -> None:
+    http = _FakeHttp([])
+    login_service = MagicMock()
+    login_service.get_instance_drive = AsyncMock(return_value=build("drive", "v3", http=http, static_discovery=True))
+    service = GoogleDriveUploaderService(login_service, "folder", stream_chunk_size=CHUNK,
+                                         session_store=DriveUploadSessionStore(tmp_path / "sessions.json"))
+    growing_file = GrowingFile()
+    (tmp_path / "video.mp4").write_bytes(b"a" * 10)
+    growing_file.set_path(tmp_path / "video.mp4")
+    cancellation = CancellationToken()
+
+    upload = asyncio.create_task(service.upload_growing(growing_file, cancellation))
+    await asyncio.sleep(0.05)
+    cancellation.cancel("user")
+
+    # the writer never finishes, only the token stops the upload
+    with pytest.raises(DownloadCancelled):
+        await asyncio.wait_for(upload, 5)
+    assert http.requests == []
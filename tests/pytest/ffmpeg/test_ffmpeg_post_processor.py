@@ -0,0 +1,65 @@
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+from src.domain.enum import ProcessingMode
+from src.domain.models import DownloadedFile, PendingProcessing
+from src.infrastructure.services.ffmpeg import FFmpegPostProcessor
+
+class FakePool():
+    thread_args = ["-threads", "1"]
+
+    def __init__(self) -> None:
+        self.commands = []
+
+    async def run(self, command, cancellation=None):
+        self.commands.append(command)
+        Path(command[-1]).write_bytes(b"processed")
+        return ""
+
+def _raw_download(tmp_path: Path, mode: ProcessingMode, output: str, audio_only: bool = False,
+                  inputs: tuple = ("video.f136.mp4", "video.f140.m4a")) -> DownloadedFile:
+    paths = tuple(tmp_path / name for name in inputs)
+    for path in paths:
+        path.write_bytes(b"raw")
+    return DownloadedFile(
+        file_path=paths[0],
+        file_size=3 * len(paths),
+        processing_mode=mode,
+        pending_processing=PendingProcessing(inputs=paths, output_path=tmp_path / output, mode=mode, audio_only=audio_only),
+    )
+
+@pytest.mark.asyncio
+async def test_post_processor_merges_with_stream_copy(tmp_path: Path) -> None:
+    pool = FakePool()
+    processor = FFmpegPostProcessor(process_pool=pool, logger=MagicMock())
+
+    result = await processor.process(_raw_download(tmp_path, ProcessingMode.COPY, "video.mp4"))
+
+    command = pool.commands[0]
+    assert command[command.index("-c") + 1] == "copy"
+    assert command.count("-i") == 2
+    assert result.file_path == tmp_path / "video.mp4"
+    assert result.pending_processing is None
+    assert not (tmp_path / "video.f136.mp4").exists()
+
+@pytest.mark.asyncio
+async def test_post_processor_transcodes_audio(tmp_path: Path) -> None:
+    pool = FakePool()
+    processor = FFmpegPostProcessor(process_pool=pool, logger=MagicMock())
+
+    downloaded = _raw_download(tmp_path, ProcessingMode.TRANSCODE, "song.mp3", audio_only=True, inputs=("song.f251.webm",))
+    result = await processor.process(downloaded)
+
+    command = pool.commands[0]
+    assert "libmp3lame" in command
+    assert ["-map", "0:a?"] == command[command.index("-map"):command.index("-map") + 2]
+    assert result.processing_mode == ProcessingMode.TRANSCODE
+
+@pytest.mark.asyncio
+async def test_post_processor_skips_finished_files(tmp_path: Path) -> None:
+    pool = FakePool()
+    processor = FFmpegPostProcessor(process_pool=pool, logger=MagicMock())
+    downloaded = DownloadedFile(file_path=tmp_path / "video.mp4", file_size=10)
+
+    assert await processor.process(downloaded) is downloaded
+    assert pool.commands == []
@@ -0,0 +1,62 @@
+import json
+import pytest
+from pathlib import Path
+from typing import List
+from unittest.mock import MagicMock
+from src.domain.models import DownloadedFile
+from src.domain.exceptions import MediaProcessingFailed
+from src.infrastructure.services.ffmpeg import FFmpegSegmentSplitter
+
+class FakePool():
+    """Answers ffprobe with a fixed duration, and writes parts of the given sizes for every ffmpeg run."""
+
+    def __init__(self, duration: float, runs: List[List[int]]) -> None:
+        self.duration = duration
+        self.runs = runs
+        self.commands = []
+
+    async def run(self, command, cancellation=None):
+        self.commands.append(command)
+        if "-show_format" in command:
+            return json.dumps({"format": {"duration": str(self.duration)}})
+        pattern = command[-1]
+        for number, size in enumerate(self.runs.pop(0), start=1):
+            Path(pattern.replace("%02d", f"{number:02d}")).write_bytes(b"x" * size)
+        return ""
+
+def _download(tmp_path: Path, size: int) -> DownloadedFile:
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"x" * size)
+    return DownloadedFile(file_path=path, file_size=size)
+
+@pytest.mark.asyncio
+async def test_splitter_cuts_with_stream_copy(tmp_path: Path) -> None:
+    pool = FakePool(duration=100, runs=[[90, 90, 20]])
+    splitter = FFmpegSegmentSplitter(size_margin=0.9, process_pool=pool, logger=MagicMock())
+
+    parts = await splitter.split(_download(tmp_path, 200), 100, tmp_path)
+
+    command = pool.commands[1]
+    assert command[command.index("-c") + 1] == "copy"
+    assert command[command.index("-segment_time") + 1] == "45.000"
+    assert [part.name for part in parts] == ["video part01.mp4", "video part02.mp4", "video part03.mp4"]
+
+@pytest.mark.asyncio
+async def test_splitter_retries_with_shorter_segments(tmp_path: Path) -> None:
+    pool = FakePool(duration=100, runs=[[120, 80], [80, 80, 40]])
+    splitter = FFmpegSegmentSplitter(size_margin=0.9, process_pool=pool, logger=MagicMock())
+
+    parts = await splitter.split(_download(tmp_path, 200), 100, tmp_path)
+
+    second_time = float(pool.commands[2][pool.commands[2].index("-segment_time") + 1])
+    assert second_time < 45
+    assert len(parts) == 3
+    assert all(part.stat().st_size <= 100 for part in parts)
+
+@pytest.mark.asyncio
+async def test_splitter_gives_up_over_max_parts(tmp_path: Path) -> None:
+    pool = FakePool(duration=100, runs=[[50, 50, 50]])
+    splitter = FFmpegSegmentSplitter(max_parts=2, process_pool=pool, logger=MagicMock())
+
+    with pytest.raises(MediaProcessingFailed):
+        await splitter.split(_download(tmp_path, 150), 60, tmp_path)
\ No newline at end of file
@@ -0,0 +1,134 @@
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from src.application.usecases.download_usecase import DownloadUsecase
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.application.models.dataclasses import JournalEntry
+from src.application.models.dataclasses.download_storage_decision import DownloadStorageDecision
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.enum.processing_mode import ProcessingMode
+from src.domain.models import DownloadedFile, MediaProbe, PendingProcessing
+from src.infrastructure.services.journal import JSONJobJournal
+from src.infrastructure.services.temp_service import TempService
+
+JOB_ID = "abc"
+REQUEST = DownloadRequest(url="https://example.com/v", file_size_limit=10)
+PROBE = MediaProbe(title="video", estimated_size=100, requires_postprocessing=True)
+
+# stage the job was interrupted at -> collaborators it still needs
+EXPECTED_CALLS = {
+    "probe": {"probe", "download", "process", "decide", "upload"},
+    "fetch": {"download", "process", "decide", "upload"},
+    "postprocess": {"process", "decide", "upload"},
+    "route": {"decide", "upload"},
+    "split": {"split"},
+    "upload": {"upload"},
+    "deliver": set(),
+}
+
+def _entry(stage: str, folder: Path) -> JournalEntry:
+    """What the journal holds when a job enters the stage, with its files on disk."""
+    video = folder / "video.mp4"
+    inputs = (folder / f"{JOB_ID}.f1.mp4", folder / f"{JOB_ID}.f2.m4a")
+    entry = JournalEntry(job_id=JOB_ID, request=REQUEST, stage=stage, temp_path=folder,
+                         probe=PROBE if stage != "probe" else None)
+    if stage == "postprocess":
+        for path in inputs:
+            path.write_bytes(b"x" * 50)
+        entry.downloaded_file = DownloadedFile(file_path=video, file_size=100,
+                                               pending_processing=PendingProcessing(inputs, video, ProcessingMode.REMUX))
+    elif stage in ("route", "split", "upload", "deliver"):
+        video.write_bytes(b"x" * 100)
+        entry.downloaded_file = DownloadedFile(file_path=video, file_size=100)
+    if stage == "split":
+        entry.destination = DownloadDestination.SPLIT
+    if stage in ("upload", "deliver"):
+        entry.destination = DownloadDestination.REMOTE
+    if stage == "deliver":
+        entry.file_url = "https://drive/video"
+    return entry
+
+def _usecase(tmp_path: Path, journal: JSONJobJournal) -> tuple[DownloadUsecase, dict]:
+    folder = tmp_path / "temp" / f"kaoruko_{JOB_ID}"
+    video = DownloadedFile(file_path=folder / "video.mp4", file_size=100)
+    calls: dict = {}
+
+    def _track(name: str, result=None):
+        async def call(*args, **kwargs):
+            calls[name] = calls.get(name, 0) + 1
+            return result
+        return call
+
+    raw = DownloadedFile(file_path=video.file_path, file_size=100,
+                         pending_processing=PendingProcessing((), video.file_path, ProcessingMode.REMUX))
+    downloader_service = MagicMock(probe=_track("probe", PROBE), download=_track("download", raw))
+    decision_strategy = MagicMock(decide=_track("decide", DownloadStorageDecision(destination=DownloadDestination.REMOTE)),
+                                  allows_split=MagicMock(return_value=False))
+    download_cache_service = MagicMock(get_cached_output=AsyncMock(return_value=None))
+    download_cache_service.store_uploaded = AsyncMock(return_value=DownloadOutput(file_url="https://drive/video"))
+    download_cache_service.store_parts = AsyncMock(return_value=DownloadOutput(file_paths=(video.file_path,)))
+    usecase = DownloadUsecase(
+        downloader_service=downloader_service,
+        cache_manager=MagicMock(),
+        storage_service=MagicMock(upload=_track("upload", "https://drive/video")),
+        temp_service=TempService(logger=MagicMock(), base_dir=tmp_path / "temp"),
+        validator=MagicMock(),
+        decision_strategy=decision_strategy,
+        download_cache_service=download_cache_service,
+        media_encoder=MagicMock(),
+        media_processor=MagicMock(process=_track("process", video)),
+        media_splitter=MagicMock(split=_track("split", [video.file_path])),
+        journal=journal,
+        logger=MagicMock(),
+    )
+    return usecase, calls
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stage", list(EXPECTED_CALLS))
+async def test_interrupted_job_resumes_at_its_stage(tmp_path: Path, stage: str) -> None:
+    folder = tmp_path / "temp" / f"kaoruko_{JOB_ID}"
+    folder.mkdir(parents=True)
+    journal_file = tmp_path / "jobs.json"
+    # written before the restart, read by a new journal like on the next start
+    await JSONJobJournal(journal_file=journal_file, logger=MagicMock()).save(_entry(stage, folder))
+    usecase, calls = _usecase(tmp_path, JSONJobJournal(journal_file=journal_file, logger=MagicMock()))
+
+    try:
+        output = await usecase.execute(REQUEST, job_id=JOB_ID)
+    finally:
+        await usecase.pipeline.stop()
+
+    assert set(calls) == EXPECTED_CALLS[stage]
+    assert output.file_url == "https://drive/video" or output.file_paths
+    assert await usecase.journal.load() == []
+
+@pytest.mark.asyncio
+async def test_job_whose_files_are_gone_is_fetched_again(tmp_path: Path) -> None:
+    folder = tmp_path / "temp" / f"kaoruko_{JOB_ID}"
+    folder.mkdir(parents=True)
+    entry = _entry("upload", folder)
+    entry.downloaded_file.file_path.unlink()
+    journal = JSONJobJournal(journal_file=tmp_path / "jobs.json", logger=MagicMock())
+    await journal.save(entry)
+    usecase, calls = _usecase(tmp_path, journal)
+
+    try:
+        await usecase.execute(REQUEST, job_id=JOB_ID)
+    finally:
+        await usecase.pipeline.stop()
+
+    assert set(calls) == EXPECTED_CALLS["fetch"]
+@pytest.mark.asyncio
+async def test_job_that_cannot_be_journaled_does_not_run(tmp_path: Path) -> None:
+    journal_file = tmp_path / "jobs.json"
+    journal_file.mkdir()
+    usecase, calls = _usecase(tmp_path, JSONJobJournal(journal_file=journal_file, logger=MagicMock()))
+
+    try:
+        with pytest.raises(OSError):
+            await usecase.execute(REQUEST)
+    finally:
+        await usecase.pipeline.stop()
+
+    assert calls == {}
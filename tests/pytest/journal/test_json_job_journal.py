@@ -0,0 +1,63 @@
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.models.dataclasses import JournalEntry
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.domain.enum.download_destination import DownloadDestination
+from src.domain.enum.processing_mode import ProcessingMode
+from src.domain.models import DownloadedFile, MediaProbe, PendingProcessing, TimeRange
+from src.infrastructure.services.journal import JSONJobJournal
+
+def _entry() -> JournalEntry:
+    return JournalEntry(
+        job_id="abc",
+        request=DownloadRequest(url="https://example.com/v", file_size_limit=10, format=Formats.MP3, quality=Quality._480,
+                                time_range=TimeRange(30, 90.5)),
+        stage="fetch",
+        context={"channel_id": 1, "user_id": 2},
+        temp_path=Path(".temp/kaoruko_abc"),
+        probe=MediaProbe(title="video", duration=60, estimated_size=100),
+        downloaded_file=DownloadedFile(
+            file_path=Path(".temp/kaoruko_abc/video.mp3"), file_size=100,
+            pending_processing=PendingProcessing((Path(".temp/kaoruko_abc/abc.f1.m4a"),), Path(".temp/kaoruko_abc/video.mp3"),
+                                                 ProcessingMode.TRANSCODE, audio_only=True),
+        ),
+        destination=DownloadDestination.REMOTE,
+    )
+
+@pytest.mark.asyncio
+async def test_journal_survives_a_restart(tmp_path: Path) -> None:
+    journal_file = tmp_path / "jobs.json"
+    await JSONJobJournal(journal_file=journal_file, logger=MagicMock()).save(_entry())
+
+    entries = await JSONJobJournal(journal_file=journal_file, logger=MagicMock()).load()
+
+    assert len(entries) == 1
+    assert entries[0].request == _entry().request
+    assert entries[0].stage == "fetch"
+    assert entries[0].context == {"channel_id": 1, "user_id": 2}
+    assert entries[0].temp_path == Path(".temp/kaoruko_abc")
+    # what the earlier stages produced, to resume at the journaled stage
+    assert (entries[0].probe, entries[0].downloaded_file, entries[0].destination) == (
+        _entry().probe, _entry().downloaded_file, _entry().destination)
+
+@pytest.mark.asyncio
+async def test_journal_forgets_removed_jobs(tmp_path: Path) -> None:
+    journal = JSONJobJournal(journal_file=tmp_path / "jobs.json", logger=MagicMock())
+    await journal.save(_entry())
+
+    await journal.remove("abc")
+
+    assert await JSONJobJournal(journal_file=tmp_path / "jobs.json", logger=MagicMock()).load() == []
+
+@pytest.mark.asyncio
+async def test_journal_raises_when_it_cannot_write(tmp_path: Path) -> None:
+    journal_file = tmp_path / "jobs.json"
+    # a folder where the file goes, replacing it fails like a full or read-only disk would
+    journal_file.mkdir()
+    journal = JSONJobJournal(journal_file=journal_file, logger=MagicMock())
+
+    with pytest.raises(OSError):
+        await journal.save(_entry())
@@ -0,0 +1,57 @@
+import threading
+import pytest
+from src.domain.models import CancellationToken
+from src.domain.exceptions import DownloadCancelled
+from src.infrastructure.services.network import BandwidthBudget
+
+def test_budget_splits_the_rate_and_grants_connections_once() -> None:
+    budget = BandwidthBudget(max_connections=32, max_job_connections=16, max_rate=8_000_000)
+    changes = []
+
+    with budget.acquire() as first:
+        assert (first.connections, first.rate) == (16, 8_000_000)
+        first.on_change(lambda share: changes.append((share.connections, share.rate)))
+
+        with budget.acquire() as second, budget.acquire() as third:
+            # the running download keeps its connections, the new ones get what is free
+            assert (first.connections, second.connections, third.connections) == (16, 8, 4)
+            assert third.rate == 8_000_000 // 3
+            assert third.stream_rate == 8_000_000 // 3 // 4
+
+        assert budget.active == 1
+
+    assert changes == [(16, 4_000_000), (16, 8_000_000 // 3), (16, 4_000_000), (16, 8_000_000)]
+
+def test_staggered_downloads_never_exceed_the_connection_limit() -> None:
+    budget = BandwidthBudget(max_connections=32, max_job_connections=16, max_rate=None)
+
+    with budget.acquire(), budget.acquire(), budget.acquire(), budget.acquire(), budget.acquire(), budget.acquire():
+        # 16 + 8 + 4 + 2 + 1 + 1, the next download waits
+        assert budget.free_connections == 0
+
+def test_download_waits_for_a_free_connection() -> None:
+    budget = BandwidthBudget(max_connections=1, max_rate=None)
+    started = threading.Event()
+
+    def _second() -> None:
+        with budget.acquire() as share:
+            assert share.connections == 1
+            started.set()
+
+    with budget.acquire():
+        thread = threading.Thread(target=_second)
+        thread.start()
+        assert not started.wait(0.1)
+    assert started.wait(1)
+    thread.join()
+
+def test_waiting_download_can_be_cancelled() -> None:
+    budget = BandwidthBudget(max_connections=1, max_rate=None)
+    cancellation = CancellationToken()
+
+    with budget.acquire():
+        threading.Timer(0.05, cancellation.cancel, ("stopped",)).start()
+        with pytest.raises(DownloadCancelled):
+            with budget.acquire(cancellation):
+                pass
+    assert budget.active == 0
\ No newline at end of file
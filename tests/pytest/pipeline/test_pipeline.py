@@ -0,0 +1,109 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from src.application.services.pipeline import Pipeline, PipelineStage
+
+class Job():
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.done = asyncio.get_running_loop().create_future()
+
+async def _on_done(job: Job, error: BaseException | None) -> None:
+    if error is not None:
+        job.done.set_exception(error)
+    else:
+        job.done.set_result(job.value)
+
+@pytest.mark.asyncio
+async def test_pipeline_runs_jobs_through_stages() -> None:
+    async def double(job: Job) -> str:
+        job.value *= 2
+        return "increment"
+
+    async def increment(job: Job) -> None:
+        job.value += 1
+        return None
+
+    pipeline = Pipeline([PipelineStage("double", double), PipelineStage("increment", increment)],
+                        on_done=_on_done, logger=MagicMock())
+    jobs = [Job(value) for value in range(5)]
+    for job in jobs:
+        await pipeline.submit(job)
+
+    assert await asyncio.gather(*(job.done for job in jobs)) == [1, 3, 5, 7, 9]
+    assert [metrics.processed for metrics in pipeline.metrics()] == [5, 5]
+    await pipeline.stop()
+
+@pytest.mark.asyncio
+async def test_pipeline_limits_stage_concurrency() -> None:
+    running = 0
+    peak = 0
+
+    async def slow(job: Job) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    pipeline = Pipeline([PipelineStage("slow", slow, concurrency=2)], on_done=_on_done, logger=MagicMock())
+    jobs = [Job(value) for value in range(6)]
+    for job in jobs:
+        await pipeline.submit(job)
+    await asyncio.gather(*(job.done for job in jobs))
+
+    assert peak == 2
+    await pipeline.stop()
+
+@pytest.mark.asyncio
+async def test_pipeline_applies_backpressure() -> None:
+    release = asyncio.Event()
+
+    async def fast(job: Job) -> str:
+        return "blocked"
+
+    async def blocked(job: Job) -> None:
+        await release.wait()
+
+    pipeline = Pipeline([PipelineStage("fast", fast, queue_size=1), PipelineStage("blocked", blocked, queue_size=1)],
+                        on_done=_on_done, logger=MagicMock())
+    jobs = [Job(value) for value in range(6)]
+    submitter = asyncio.create_task(asyncio.wait_for(asyncio.gather(*(pipeline.submit(job) for job in jobs)), 0.1))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await submitter
+    assert pipeline.stages["blocked"].metrics.max_queue_depth == 1
+    release.set()
+    await pipeline.stop()
+
+@pytest.mark.asyncio
+async def test_pipeline_reports_stage_errors() -> None:
+    async def broken(job: Job) -> None:
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline([PipelineStage("broken", broken)], on_done=_on_done, logger=MagicMock())
+    job = Job(1)
+    await pipeline.submit(job)
+
+    with pytest.raises(RuntimeError):
+        await job.done
+    assert pipeline.metrics()[0].failed == 1
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_handler_fails_its_job_and_keeps_the_worker() -> None:
+    async def handler(job: Job) -> None:
+        if job.value == 0:
+            raise asyncio.CancelledError()
+        return None
+
+    pipeline = Pipeline([PipelineStage("only", handler, concurrency=1)], on_done=_on_done, logger=MagicMock())
+    failed, passed = Job(0), Job(1)
+    await pipeline.submit(failed)
+    await pipeline.submit(passed)
+
+    with pytest.raises(asyncio.CancelledError):
+        await failed.done
+    assert await asyncio.wait_for(passed.done, 1) == 1
+    await pipeline.stop()
\ No newline at end of file
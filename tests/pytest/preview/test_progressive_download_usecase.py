@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import pytest
+from pathlib import Path
+from src.application.dto.request.download_request import DownloadRequest
+from src.application.dto.output.download_output import DownloadOutput
+from src.application.usecases.progressive_download_usecase import ProgressiveDownloadUsecase
+from src.domain.enum import Formats, Quality
+
+class FakeDownloadUsecase():
+    def __init__(self, delays, cached=None):
+        self.delays = delays
+        self.cached = cached
+        self.cancelled = []
+        self.contexts = {}
+
+    async def execute(self, request, cancellation=None, context=None, job_id=None, progress=None):
+        self.contexts[request.quality] = context
+        try:
+            await asyncio.sleep(self.delays[request.quality])
+        except asyncio.CancelledError:
+            self.cancelled.append(request.quality)
+            raise
+        return DownloadOutput(file_path=Path(f"{request.quality.value}.mp4"))
+
+    def peek_cached(self, request):
+        return self.cached
+
+    async def pending_jobs(self):
+        return []
+
+async def collect(usecase, request, context=None):
+    return [output async for output in usecase.execute(request, context=context)]
+
+@pytest.mark.asyncio
+async def test_preview_comes_first_then_requested_quality() -> None:
+    fake = FakeDownloadUsecase({Quality._360: 0, Quality._1080: 0.05})
+    usecase = ProgressiveDownloadUsecase(fake, logging.getLogger("test"))
+
+    outputs = await collect(usecase, DownloadRequest(url="https://example.com/v", file_size_limit=1, format=Formats.MP4,
+                                                     quality=Quality._1080), context={"channel_id": 1})
+
+    assert [output.preview_quality for output in outputs] == [Quality._360, None]
+    assert outputs[1].file_path == Path("1080p.mp4")
+    # only the requested quality is resumed after a restart
+    assert fake.contexts == {Quality._1080: {"channel_id": 1}, Quality._360: {"channel_id": 1, "source": "preview"}}
+
+@pytest.mark.asyncio
+async def test_no_preview_for_cache_hits_audio_or_when_full_is_first() -> None:
+    fake = FakeDownloadUsecase({Quality._360: 0.05, Quality._1080: 0})
+    usecase = ProgressiveDownloadUsecase(fake, logging.getLogger("test"))
+    request = DownloadRequest(url="https://example.com/v", file_size_limit=1, format=Formats.MP4, quality=Quality._1080)
+
+    assert len(await collect(usecase, request)) == 1
+    assert fake.cancelled == [Quality._360]
+
+    fake.cancelled.clear()
+    assert len(await collect(usecase, DownloadRequest(url="https://example.com/v", file_size_limit=1, format=Formats.MP3,
+                                                      quality=Quality._1080))) == 1
+    fake.cached = DownloadOutput(file_path=Path("1080p.mp4"))
+    assert len(await collect(usecase, request)) == 1
+    assert fake.cancelled == []
\ No newline at end of file
@@ -0,0 +1,46 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from src.application.services import TaskManager
+from src.application.services.download import DownloadRequestValidator, SpeculativeProbeService
+from src.domain.models import MediaProbe
+
+def _service(task_manager: TaskManager, download_usecase=None) -> SpeculativeProbeService:
+    downloader_service = MagicMock()
+    downloader_service.probe = AsyncMock(return_value=MediaProbe(title="song", duration=60, estimated_size=1024,
+                                                                 extension="m4a", requires_postprocessing=True))
+    url_matcher = MagicMock()
+    url_matcher.is_supported = lambda url: "media.example" in url
+    validator = DownloadRequestValidator(url_validator=MagicMock(is_valid=lambda url: True), blacklist_sites=["blocked.example"])
+    return SpeculativeProbeService(downloader_service, validator, url_matcher, task_manager, MagicMock(),
+                                   download_usecase=download_usecase, idle_poll=0.01)
+
+@pytest.mark.asyncio
+async def test_only_supported_links_are_probed_once_downloads_are_done() -> None:
+    task_manager = TaskManager()
+    service = _service(task_manager)
+
+    with task_manager.track():
+        queued = service.submit("look (https://media.example/v/1), https://blocked.example/v/2 and https://other.example/x",
+                                file_size_limit=1000)
+        await asyncio.sleep(0.05)
+        service.downloader_service.probe.assert_not_awaited()
+    await asyncio.sleep(0.05)
+    await service.close()
+
+    assert queued == 2
+    assert [call.args[0].url for call in service.downloader_service.probe.await_args_list] == ["https://media.example/v/1"]
+    assert service.submit("https://media.example/v/1", file_size_limit=1000) == 0
+
+@pytest.mark.asyncio
+async def test_short_audio_is_prefetched() -> None:
+    download_usecase = MagicMock()
+    download_usecase.execute = AsyncMock()
+    service = _service(TaskManager(), download_usecase)
+
+    service.submit("https://media.example/v/1", file_size_limit=1000)
+    await asyncio.sleep(0.05)
+    await service.close()
+
+    request = download_usecase.execute.await_args.args[0]
+    assert (request.url, request.format.is_audio()) == ("https://media.example/v/1", True)
\ No newline at end of file
@@ -0,0 +1,38 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.domain.models import ProgressTracker
+from src.presentation.discord.reporters import InteractionProgressReporter
+
+def test_tracker_keeps_only_latest_counters() -> None:
+    tracker = ProgressTracker()
+    tracker.set_stage("fetch")
+    tracker.update(10, 100, 5.0, 18.0)
+    tracker.update(50, 100, 5.0, 10.0)
+
+    progress = tracker.snapshot()
+    assert (progress.stage, progress.downloaded_bytes, progress.eta) == ("fetch", 50, 10.0)
+    assert progress.fraction == 0.5
+
+    tracker.set_stage("upload")
+    assert tracker.snapshot().downloaded_bytes == 0
+
+@pytest.mark.asyncio
+async def test_reporter_collapses_updates_into_throttled_edits() -> None:
+    interaction = MagicMock()
+    interaction.edit_original_response = AsyncMock()
+    interaction.delete_original_response = AsyncMock()
+    tracker = ProgressTracker()
+    tracker.set_stage("fetch")
+
+    reporter = InteractionProgressReporter(interaction, tracker, interval=0.05)
+    async with reporter:
+        for downloaded in range(1, 1001):
+            tracker.update(downloaded * 1024, 1000 * 1024)
+        await asyncio.sleep(0.2)
+
+    # a thousand updates, one edit: nothing changed after the first poll
+    interaction.edit_original_response.assert_awaited_once()
+    assert "100%" in interaction.edit_original_response.await_args.kwargs["content"]
+    await reporter.clear()
+    interaction.delete_original_response.assert_awaited_once()
\ No newline at end of file
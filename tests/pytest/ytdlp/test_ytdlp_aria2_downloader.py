@@ -0,0 +1,61 @@
+import yt_dlp
+import pytest
+from pathlib import Path
+from src.infrastructure.services.ytdlp import Aria2RpcFD
+
+class FakeDaemon():
+    def __init__(self, statuses, tmp_path):
+        self.statuses = list(statuses)
+        self.tmp_path = tmp_path
+        self.added = []
+        self.removed = []
+
+    def add_uri(self, uris, options, position=None):
+        self.added.append((uris, options, position))
+        return "gid1"
+
+    def tell_status(self, gid, keys=None):
+        status = self.statuses.pop(0)
+        if status["status"] == "complete":
+            Path(self.added[0][1]["dir"], self.added[0][1]["out"]).write_bytes(b"x" * 10)
+        return status
+
+    def change_option(self, gid, options):
+        pass
+
+    def remove(self, gid):
+        self.removed.append(gid)
+
+def _info(url="https://example.com/v.mp4"):
+    return {"url": url, "protocol": "https", "filesize": 10, "http_headers": {"User-Agent": "test"}}
+
+def test_aria2_fd_reports_progress_and_renames(tmp_path) -> None:
+    daemon = FakeDaemon([
+        {"status": "active", "totalLength": "10", "completedLength": "4", "downloadSpeed": "2"},
+        {"status": "complete", "totalLength": "10", "completedLength": "10"},
+    ], tmp_path)
+    events = []
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        fd = Aria2RpcFD(ydl, ydl.params, daemon, poll_interval=0)
+        fd.add_progress_hook(lambda d: events.append((d["status"], d.get("downloaded_bytes"))))
+        assert fd.real_download(str(tmp_path / "v.mp4"), _info())
+
+    assert (tmp_path / "v.mp4").stat().st_size == 10
+    assert events == [("downloading", 4), ("finished", 10)]
+    uris, options, position = daemon.added[0]
+    assert options["header"] == ["User-Agent: test"] and position == 0
+
+def test_aria2_fd_removes_cancelled_download(tmp_path) -> None:
+    daemon = FakeDaemon([{"status": "active", "totalLength": "10", "completedLength": "4"}], tmp_path)
+
+    def _cancel(d):
+        raise KeyboardInterrupt
+
+    with yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        fd = Aria2RpcFD(ydl, ydl.params, daemon, poll_interval=0)
+        fd.add_progress_hook(_cancel)
+        with pytest.raises(KeyboardInterrupt):
+            fd.real_download(str(tmp_path / "v.mp4"), _info())
+
+    assert daemon.removed == ["gid1"]
+    assert not Aria2RpcFD.supports({"protocol": "m3u8_native"})
\ No newline at end of file
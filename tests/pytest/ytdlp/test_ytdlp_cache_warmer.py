@@ -0,0 +1,44 @@
+import shutil
+import pytest
+import importlib.resources
+from pathlib import Path
+from unittest.mock import MagicMock
+from src.infrastructure.services.ytdlp import YtdlpCacheWarmer
+from src.infrastructure.services.ytdlp import ytdlp_cache_warmer
+
+BUNDLED_CORE = importlib.resources.files("yt_dlp.extractor.youtube.jsc._builtin.vendor") / "yt.solver.core.js"
+
+def _warmer(tmp_path: Path, vendor_dir: Path) -> YtdlpCacheWarmer:
+    return YtdlpCacheWarmer(vendor_dir=vendor_dir, warmup_url=None, offline=True,
+                            ydl_opts={'cachedir': str(tmp_path / "cache")}, logger=MagicMock())
+
+@pytest.mark.asyncio
+async def test_warmer_caches_vendored_script(tmp_path: Path) -> None:
+    vendor_dir = tmp_path / "vendor"
+    vendor_dir.mkdir()
+    shutil.copyfile(str(BUNDLED_CORE), vendor_dir / "yt.solver.core.js")
+
+    sources = await _warmer(tmp_path, vendor_dir).warm_up()
+    assert sources == {"lib": "missing", "core": "vendored"}
+    assert (tmp_path / "cache" / "challenge-solver" / "core.json").is_file()
+
+    # the next start finds it in the shared cache, even without the vendored copy
+    sources = await _warmer(tmp_path, tmp_path / "empty").warm_up()
+    assert sources["core"] == "cache"
+
+@pytest.mark.asyncio
+async def test_warmer_rejects_modified_script(tmp_path: Path) -> None:
+    vendor_dir = tmp_path / "vendor"
+    vendor_dir.mkdir()
+    (vendor_dir / "yt.solver.core.js").write_text(BUNDLED_CORE.read_text(encoding="utf-8") + "\n// patched", encoding="utf-8")
+
+    sources = await _warmer(tmp_path, vendor_dir).warm_up()
+    assert sources["core"] == "missing"
+    assert not (tmp_path / "cache" / "challenge-solver" / "core.json").exists()
+
+@pytest.mark.asyncio
+async def test_warmer_is_skipped_without_the_solver_module(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ytdlp_cache_warmer, "EJS_VERSION", None)
+
+    assert await _warmer(tmp_path, tmp_path / "vendor").warm_up() == {}
+    assert not (tmp_path / "cache").exists()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import threading
+from unittest.mock import MagicMock
+import pytest
+from src.domain.models import ProgressTracker
+from src.infrastructure.services.network import BandwidthBudget
+from src.infrastructure.services.ytdlp import YtdlpDownloadService
+from src.domain.enum.processing_mode import ProcessingMode
+from src.infrastructure.services.ytdlp.ytdlp_format_mapper import FormatPlan
+
+PLAN = FormatPlan(format="137+140", mode=ProcessingMode.REMUX,
+                  selected_formats=({'format_id': '137'}, {'format_id': '140'}))
+
+class _FakeYdl():
+    def __init__(self, params, fetch) -> None:
+        self.params = params
+        self.fetch = fetch
+
+    def __enter__(self) -> "_FakeYdl":
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def sanitize_info(self, info):
+        return info
+
+    def process_ie_result(self, info, download):
+        return self.fetch(self.params)
+
+def _service(fetch) -> YtdlpDownloadService:
+    service = YtdlpDownloadService(MagicMock(), logger=MagicMock())
+    service._create_ydl = lambda ydl_opts: _FakeYdl(ydl_opts, fetch)
+    return service
+
+def test_streams_are_fetched_at_the_same_time_and_kept_in_plan_order() -> None:
+    both_started = threading.Barrier(2, timeout=5)
+
+    def fetch(params):
+        # each stream waits for the other one, so a sequential fetch would time out
+        both_started.wait()
+        return {'id': 'x', 'requested_downloads': [{'format_id': params['format']}]}
+
+    with BandwidthBudget().acquire() as share:
+        info = _service(fetch)._fetch_streams({'format': '137,140'}, {'id': 'x'}, PLAN, share)
+
+    assert [download['format_id'] for download in info['requested_downloads']] == ['137', '140']
+
+def test_a_failing_stream_stops_the_other_and_is_raised() -> None:
+    audio_failed = threading.Event()
+
+    def fetch(params):
+        if params['format'] == '140':
+            audio_failed.set()
+            raise ValueError("audio unavailable")
+        audio_failed.wait(timeout=5)
+        for hook in params['progress_hooks']:
+            hook({'status': 'downloading'})
+        return {'id': 'x', 'requested_downloads': []}
+
+    with BandwidthBudget().acquire() as share, pytest.raises(ValueError, match="audio unavailable"):
+        _service(fetch)._fetch_streams({'format': '137,140'}, {'id': 'x'}, PLAN, share)
+
+def test_progress_adds_up_the_streams() -> None:
+    tracker = ProgressTracker()
+    hook = YtdlpDownloadService(MagicMock(), logger=MagicMock())._get_progress_opts({}, tracker)['progress_hooks'][-1]
+
+    hook({'status': 'downloading', 'filename': 'video', 'downloaded_bytes': 30, 'total_bytes': 100, 'speed': 10})
+    hook({'status': 'downloading', 'filename': 'audio', 'downloaded_bytes': 10, 'total_bytes': 20, 'speed': 10})
+
+    snapshot = tracker.snapshot()
+    assert (snapshot.downloaded_bytes, snapshot.total_bytes, snapshot.speed, snapshot.eta) == (40, 120, 20, 4)
\ No newline at end of file
@@ -0,0 +1,34 @@
+from unittest.mock import MagicMock
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.infrastructure.services.ytdlp.ytdlp_deadline_fitter import YtdlpDeadlineFitter
+
+MB = 1024 * 1024
+
+def _info() -> dict:
+    return {
+        "duration": 300,
+        "formats": [
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "filesize": 5 * MB},
+            {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 1080, "filesize": 95 * MB},
+            {"format_id": "136", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 720, "filesize": 45 * MB},
+            {"format_id": "135", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 480, "filesize": 15 * MB},
+        ],
+    }
+
+def test_deadline_fitter_picks_highest_quality_done_in_time() -> None:
+    fitter = YtdlpDeadlineFitter(margin=1.0, logger=MagicMock())
+
+    # 1 MB/s: 1080p takes ~100s, 720p ~50s
+    assert fitter.select_quality(_info(), Formats.MP4, Quality._1080, 120, MB) == Quality._1080
+    assert fitter.select_quality(_info(), Formats.MP4, Quality._1080, 60, MB) == Quality._720
+    # a clip of a tenth of the media fits at full quality
+    assert fitter.select_quality(_info(), Formats.MP4, Quality._1080, 60, MB, fraction=0.1) == Quality._1080
+
+def test_deadline_fitter_falls_back_to_lowest_or_ceiling() -> None:
+    fitter = YtdlpDeadlineFitter(margin=1.0, logger=MagicMock())
+
+    assert fitter.select_quality(_info(), Formats.MP4, Quality._1080, 1, MB) == Quality._360
+    # without any size estimate the usual default is kept
+    assert fitter.select_quality({"formats": []}, Formats.MP4, Quality._1080, 1, MB) == Quality.DEFAULT
+    assert fitter.select_quality(_info(), Formats.MP3, Quality._1080, 1, MB) == Quality._1080
\ No newline at end of file
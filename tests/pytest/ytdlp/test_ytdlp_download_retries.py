@@ -0,0 +1,72 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+import pytest
+from yt_dlp.utils import DownloadError, ExtractorError
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+from src.domain.models import DownloadedFile
+from src.infrastructure.services.ytdlp import YtdlpErrorClassifier, YtdlpDownloadService
+
+def _http_error(status: int) -> HTTPError:
+    return HTTPError(MagicMock(status=status, reason="error", headers={}, url="https://example.com"))
+
+def _wrapped(error: Exception) -> DownloadError:
+    return DownloadError(f"ERROR: {error}", (type(error), error, None))
+
+def test_error_classifier_looks_through_wrapped_errors() -> None:
+    classifier = YtdlpErrorClassifier()
+
+    assert classifier.is_transient(_wrapped(TransportError("connection reset by peer")))
+    assert classifier.is_transient(_wrapped(_http_error(503)))
+    assert not classifier.is_transient(_wrapped(_http_error(404)))
+    assert not classifier.is_transient(_wrapped(ExtractorError("Private video", expected=True)))
+    assert classifier.is_expired_url(_wrapped(_http_error(403)))
+
+def test_error_classifier_reads_messages() -> None:
+    classifier = YtdlpErrorClassifier()
+
+    assert classifier.is_transient(DownloadError("ERROR: aria2c exited with code 6"))
+    assert not classifier.is_transient(DownloadError("ERROR: aria2c exited with code 3"))
+    assert not classifier.is_transient(DownloadError("ERROR: Video unavailable"))
+    assert not classifier.is_transient(ValueError("something else"))
+
+def _service(attempts: list) -> YtdlpDownloadService:
+    service = YtdlpDownloadService(MagicMock(), max_retries=2, retry_backoff=0, logger=MagicMock())
+
+    def _attempt(url, ydl_opts, format_value, quality, output_folder, *args):
+        outcome = attempts.pop(0)
+        if isinstance(outcome, Exception):
+            # every failed attempt adds to the partial file the next one resumes
+            with open(output_folder / "id.mp4.part", "ab") as part:
+                part.write(b"x" * 10)
+            raise outcome
+        return outcome
+
+    service._attempt_download = _attempt
+    return service
+
+def test_download_retries_transient_errors_and_counts_salvaged_bytes(tmp_path: Path) -> None:
+    result = DownloadedFile(file_path=tmp_path / "video.mp4", file_size=20)
+    service = _service([_wrapped(TransportError("timed out")), result])
+
+    downloaded_file = service._download_sync("https://example.com", None, None, tmp_path)
+
+    assert downloaded_file.retries == 1
+    assert downloaded_file.bytes_salvaged == 10
+
+def test_salvaged_bytes_are_counted_once_across_retries(tmp_path: Path) -> None:
+    result = DownloadedFile(file_path=tmp_path / "video.mp4", file_size=30)
+    service = _service([_wrapped(TransportError("timed out")), _wrapped(TransportError("timed out")), result])
+
+    downloaded_file = service._download_sync("https://example.com", None, None, tmp_path)
+
+    assert downloaded_file.retries == 2
+    # 10 bytes resumed by the second attempt, 10 more by the third, not 10 + 20
+    assert downloaded_file.bytes_salvaged == 20
+
+def test_download_does_not_retry_permanent_errors(tmp_path: Path) -> None:
+    attempts = [_wrapped(_http_error(404)), DownloadedFile(file_path=tmp_path / "video.mp4", file_size=20)]
+    service = _service(attempts)
+
+    with pytest.raises(Exception, match="Failed to download"):
+        service._download_sync("https://example.com", None, None, tmp_path)
+    assert len(attempts) == 1
\ No newline at end of file
@@ -0,0 +1,71 @@
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.domain.enum.processing_mode import ProcessingMode
+from src.infrastructure.services.ytdlp.ytdlp_format_mapper import YtdlpFormatMapper
+
+def _info() -> dict:
+    return {
+        "formats": [
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 128},
+            {"format_id": "251", "ext": "webm", "vcodec": "none", "acodec": "opus", "abr": 160},
+            {"format_id": "136", "ext": "mp4", "vcodec": "avc1.4d401f", "acodec": "none", "height": 720, "tbr": 1500},
+            {"format_id": "247", "ext": "webm", "vcodec": "vp9", "acodec": "none", "height": 720, "tbr": 1400},
+        ],
+    }
+
+def test_plan_copies_compatible_mp4_streams() -> None:
+    plan = YtdlpFormatMapper.plan_format(_info(), Formats.MP4, Quality._720)
+
+    assert plan.format == "136+140"
+    assert plan.mode == ProcessingMode.COPY
+    assert plan.to_ydl_opts() == {"format": "136+140", "postprocessors": [], "merge_output_format": "mp4"}
+
+def test_plan_keeps_vp9_and_opus_for_webm() -> None:
+    plan = YtdlpFormatMapper.plan_format(_info(), Formats.WEBM, Quality._720)
+
+    assert plan.format == "247+251"
+    assert plan.mode == ProcessingMode.COPY
+
+def test_plan_remuxes_opus_into_ogg() -> None:
+    plan = YtdlpFormatMapper.plan_format(_info(), Formats.OGG)
+
+    assert plan.format == "251"
+    assert plan.mode == ProcessingMode.REMUX
+    assert plan.postprocessors == [{"key": "FFmpegVideoRemuxer", "preferedformat": "ogg"}]
+
+def test_plan_transcodes_audio_to_mp3() -> None:
+    plan = YtdlpFormatMapper.plan_format(_info(), Formats.MP3)
+
+    assert plan.mode == ProcessingMode.TRANSCODE
+    assert plan.postprocessors[0]["key"] == "FFmpegExtractAudio"
+
+def test_plan_transcodes_when_webm_codecs_are_missing() -> None:
+    info = {"formats": [f for f in _info()["formats"] if f["ext"] != "webm"]}
+
+    plan = YtdlpFormatMapper.plan_format(info, Formats.WEBM, Quality._720)
+
+    assert plan.mode == ProcessingMode.TRANSCODE
+    assert plan.merge_output_format == "mkv"
+
+def test_plan_uses_given_selector() -> None:
+    plan = YtdlpFormatMapper.plan_format(_info(), Formats.MP4, selector="247+140")
+
+    assert plan.format == "247+140"
+    assert plan.mode == ProcessingMode.REMUX
+
+def test_plan_falls_back_without_formats() -> None:
+    assert YtdlpFormatMapper.plan_format({}, Formats.MP4) is None
+
+
+def test_plan_keeps_the_original_audio_track_over_dubs() -> None:
+    info = {"formats": [
+        {"format_id": "140-dub", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 160, "language_preference": -1},
+        {"format_id": "140-ad", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 160, "language_preference": -10},
+        {"format_id": "251", "ext": "webm", "vcodec": "none", "acodec": "opus", "abr": 130, "language_preference": 10},
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 128, "language_preference": 10},
+        {"format_id": "136", "ext": "mp4", "vcodec": "avc1.4d401f", "acodec": "none", "height": 720, "tbr": 1500},
+    ]}
+
+    assert YtdlpFormatMapper.plan_format(info, Formats.MP4, Quality._720).format == "136+140"
+    # with no codec to copy, yt-dlp's order decides before the bitrate
+    assert YtdlpFormatMapper.plan_format(info, Formats.MP3).format == "140"
\ No newline at end of file
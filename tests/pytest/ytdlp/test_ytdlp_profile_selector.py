@@ -0,0 +1,45 @@
+from pathlib import Path
+from unittest.mock import MagicMock
+import pytest
+from src.domain.enum import Quality
+from src.infrastructure.services.network import BandwidthBudget
+from src.infrastructure.services.ytdlp import YtdlpDownloadService, YtdlpProfileSelector
+
+def _selector(history_file: Path, exploration: float = 0.0) -> YtdlpProfileSelector:
+    return YtdlpProfileSelector(history_file=history_file, exploration=exploration, logger=MagicMock())
+
+def test_profile_selector_starts_with_the_default_profile(tmp_path: Path) -> None:
+    selector = _selector(tmp_path / "profiles.json")
+
+    assert selector.select("Youtube").name == "aria2c"
+
+def test_profile_selector_picks_the_fastest_measured_profile(tmp_path: Path) -> None:
+    history_file = tmp_path / "profiles.json"
+    selector = _selector(history_file)
+    selector.record("Youtube", selector.profiles["aria2c"], 10_000_000, 10)
+    selector.record("Youtube", selector.profiles["native"], 10_000_000, 2)
+    selector.record("Vimeo", selector.profiles["aria2c"], 10_000_000, 1)
+
+    assert selector.select("Youtube").name == "native"
+    # the history survives a restart
+    assert _selector(history_file).select("Vimeo").name == "aria2c"
+
+def test_profile_selector_explores_untried_profiles(tmp_path: Path) -> None:
+    selector = _selector(tmp_path / "profiles.json", exploration=1.0)
+    selector.record("Youtube", selector.profiles["aria2c"], 10_000_000, 1)
+    selector.record("Youtube", selector.profiles["native"], 10_000_000, 2)
+
+    assert selector.select("Youtube").name == "native_chunked"
+
+def test_failed_fetch_is_not_recorded(tmp_path: Path) -> None:
+    selector = _selector(tmp_path / "profiles.json")
+    selector.record = MagicMock()
+    service = YtdlpDownloadService(MagicMock(), profile_selector=selector, logger=MagicMock())
+    service._extract_info = lambda url, ydl_opts: {'id': 'x', 'extractor_key': 'Youtube'}
+    service._plan = lambda *args: ({}, None)
+    service._create_ydl = lambda ydl_opts: MagicMock()
+    service._fetch = lambda ydl, info, share: None
+
+    with BandwidthBudget().acquire() as share, pytest.raises(ValueError, match="Failed to extract"):
+        service._attempt_download("https://example.com", {}, None, Quality.DEFAULT, tmp_path, None, None, None, share)
+    selector.record.assert_not_called()
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock
+from src.domain.enum.formats import Formats
+from src.domain.enum.quality import Quality
+from src.infrastructure.services.ytdlp.ytdlp_size_fitter import YtdlpSizeFitter
+
+MB = 1024 * 1024
+
+def _info() -> dict:
+    return {
+        "duration": 300,
+        "formats": [
+            {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "filesize": 5 * MB},
+            {"format_id": "139", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.5", "filesize": 2 * MB},
+            {"format_id": "136", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 720, "filesize": 40 * MB},
+            {"format_id": "135", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 480, "filesize": 18 * MB},
+            {"format_id": "134", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 360, "tbr": 300},
+            {"format_id": "18", "ext": "mp4", "vcodec": "avc1", "acodec": "mp4a", "height": 360, "filesize_approx": 15 * MB},
+        ],
+    }
+
+def test_size_fitter_picks_highest_resolution_that_fits() -> None:
+    fitter = YtdlpSizeFitter(size_margin=1.0, logger=MagicMock())
+
+    selector = fitter.select_format(_info(), Formats.MP4, Quality._720, 25 * MB)
+
+    assert selector == "135+140"
+
+def test_size_fitter_uses_smaller_audio_when_needed() -> None:
+    fitter = YtdlpSizeFitter(size_margin=1.0, logger=MagicMock())
+
+    selector = fitter.select_format(_info(), Formats.MP4, Quality._720, 21 * MB)
+
+    assert selector == "135+139"
+
+def test_size_fitter_respects_requested_quality() -> None:
+    fitter = YtdlpSizeFitter(size_margin=1.0, logger=MagicMock())
+
+    selector = fitter.select_format(_info(), Formats.MP4, Quality._360, 100 * MB)
+
+    assert selector == "134+140"
+
+def test_size_fitter_estimates_from_bitrate() -> None:
+    assert YtdlpSizeFitter.estimate_size({"tbr": 300}, 300) == 300 * 1000 / 8 * 300
+    assert YtdlpSizeFitter.estimate_size({"tbr": 300}, None) is None
+
+def test_size_fitter_returns_none_when_nothing_fits() -> None:
+    fitter = YtdlpSizeFitter(size_margin=1.0, logger=MagicMock())
+
+    assert fitter.select_format(_info(), Formats.MP4, Quality._720, 5 * MB) is None
+
+def test_size_fitter_skips_audio_formats() -> None:
+    fitter = YtdlpSizeFitter(size_margin=1.0, logger=MagicMock())
+
+    assert fitter.select_format(_info(), Formats.MP3, None, 25 * MB) is None